@@ -0,0 +1,47 @@
+"""
+Per-call cost of the mu dependent equations, looked up through `ReturnType` by the module functions and
+pre-bound by a `BallisticModel`.
+
+    python -m benchmarks.ballistic_model_benchmark
+"""
+import timeit
+
+from constants.earth import ReturnType
+from one_twoBodyOrbitalMecanics import one_08_circular_orbit
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem as six_02
+from six_ballisticMissileTrajectories.ballistic_model import BallisticModel
+
+
+def _perCallNanoseconds(function, args, number: int) -> float:
+    timer = timeit.Timer(lambda: function(*args))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def runBenchmark(number: int = 200000) -> dict:
+    """
+    Times each equation through the module function and through a `BallisticModel`.
+    Args:
+        number (int): calls per timing repeat
+
+    Returns:
+        dict: nanoseconds per call keyed by (equation, 'module' or 'model')
+    """
+    typeUsed = ReturnType.METRIC
+    model = BallisticModel(typeUsed)
+
+    cases = {'6.2-1': (six_02.solveForNondimentionalParametericParameter621, model.solveForNondimentionalParametericParameter621, (7.15, 7016.0)),
+             '1.8-2': (one_08_circular_orbit.circularSatelliteSpeed, model.circularSatelliteSpeed, (7016.0,)),
+             '6.2-12 from burnout': (six_02.solveForFreeFlightAngleFromBurnout, model.solveForFreeFlightAngleFromBurnout, (7016.0, 7.15, 30.0)),
+             '6.2-22': (six_02.solveForTimeOfFreeFlight, model.solveForTimeOfFreeFlight, (60.0, 0.4, 6000.0))}
+
+    results = {}
+    for equation, (function, method, args) in cases.items():
+        results[(equation, 'module')] = _perCallNanoseconds(function, args + (typeUsed,), number)
+        results[(equation, 'model')] = _perCallNanoseconds(method, args, number)
+
+    return results
+
+
+if __name__ == '__main__':
+    for (equation, entryPoint), nanoseconds in runBenchmark().items():
+        print("%-20s %-8s %8.1f ns/call" % (equation, entryPoint, nanoseconds))
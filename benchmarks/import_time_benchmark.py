@@ -0,0 +1,99 @@
+"""
+Import time of the scalar solvers, each in a fresh interpreter.
+
+The scalar modules only need the standard library; NumPy, pandas and matplotlib are loaded by the
+`_vectorized` modules and the plots when arrays or charts are actually used.  Short-lived worker processes pay
+the import on every spawn, so each core module is checked against a time budget and against pulling in any of
+`heavyModules`:
+
+    python -m benchmarks.import_time_benchmark                 # exits with status 1 over budget
+    python -m benchmarks.import_time_benchmark --budget 50
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+coreModules = ('constants.conversions',
+               'constants.earth',
+               'one_twoBodyOrbitalMecanics.one_04_constants_of_the_motion',
+               'one_twoBodyOrbitalMecanics.one_08_circular_orbit',
+               'four_position_and_velocity_a_funcion_of_time.four_02_time_of_flight_eccentric_anomoly',
+               'six_ballisticMissileTrajectories.six_02_general_ballistic_missile_problem',
+               'six_ballisticMissileTrajectories.six_03_launching_errors_on_range',
+               'six_ballisticMissileTrajectories.ballistic_model')
+
+heavyModules = ('numpy', 'pandas', 'matplotlib', 'multipledispatch')
+
+defaultBudgetMilliseconds = 100.0
+
+_rootDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_measureScript = """
+import json, sys, time
+start = time.perf_counter()
+import %s
+seconds = time.perf_counter() - start
+print(json.dumps({'seconds': seconds, 'heavy': sorted(name for name in %r if name in sys.modules)}))
+"""
+
+
+def measureImport(module: str, repeat: int = 3) -> (float, list):
+    """
+    Times `import module` in fresh interpreters, leaving out the start up of the interpreter itself.
+    Args:
+        module (str): dotted module name
+        repeat (int): interpreters started, the fastest is kept
+
+    Returns:
+        (float, list): seconds of the import and the `heavyModules` it loaded
+    """
+    best, heavy = None, []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _measureScript % (module, heavyModules)], cwd=_rootDirectory,
+                                check=True, capture_output=True, text=True).stdout
+        measured = json.loads(output.strip().splitlines()[-1])
+        if best is None or measured['seconds'] < best:
+            best = measured['seconds']
+        heavy = measured['heavy']
+    return best, heavy
+
+
+def checkImportBudget(budgetMilliseconds: float = defaultBudgetMilliseconds, modules=coreModules,
+                      repeat: int = 3) -> dict:
+    """
+    Measures every module and reports the ones over budget or loading a heavy dependency.
+
+    Returns:
+        dict: (milliseconds, heavy modules, problem or None) keyed by module
+    """
+    results = {}
+    for module in modules:
+        seconds, heavy = measureImport(module, repeat)
+        milliseconds = seconds * 1e3
+        problem = None
+        if heavy:
+            problem = "imports %s" % ', '.join(heavy)
+        elif milliseconds > budgetMilliseconds:
+            problem = "over the %.0f ms budget" % budgetMilliseconds
+        results[module] = (milliseconds, heavy, problem)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time the import of every scalar solver module in a fresh interpreter")
+    parser.add_argument('--budget', type=float, default=defaultBudgetMilliseconds, help="milliseconds per module")
+    parser.add_argument('--repeat', type=int, default=3, help="interpreters per module, the fastest is kept")
+    args = parser.parse_args(argv)
+
+    results = checkImportBudget(args.budget, repeat=args.repeat)
+    for module, (milliseconds, heavy, problem) in results.items():
+        print("%-90s %8.1f ms %s" % (module, milliseconds, problem or ''))
+    failures = [module for module, (_, _, problem) in results.items() if problem]
+    print("%d of %d modules failed the import budget" % (len(failures), len(results)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Speed up of the shared memory sweep executor over one process, for the free-flight angle and time of flight sweeps.
+
+    python -m benchmarks.parallel_sweep_benchmark                       # 1, 2, 4, ... up to every CPU
+    python -m benchmarks.parallel_sweep_benchmark --processes 1 16 64 --points 4000
+"""
+import argparse
+import os
+import time
+
+import numpy
+
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from utilities import sweep_engine
+from utilities.parallel_sweep import SweepExecutor
+
+
+def maximumRangeTimeOfFlight(r_bo, freeFlightRange, returntype):
+    """
+    Time of free flight on the maximum range trajectory (equations 6.2-18 to 6.2-22)
+    """
+    six_02 = six_02_general_ballistic_missile_problem_vectorized
+    Q_bo = six_02.solveForRequiredQAtMaxRange(freeFlightRange)
+    e = six_02.solveForEccentricity(Q_bo, six_02.solveForMaxBurnoutFlightPathAngle(freeFlightRange))
+    capE = six_02.solveForEccentricAnomalyFromMaxRange(e, freeFlightRange)
+    return six_02.solveForTimeOfFreeFlight(capE, e, six_02.solveForSemiMajorAxis(r_bo, Q_bo), returntype)
+
+
+def _sweeps(points: int) -> dict:
+    return {'freeFlightAngle': (six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ,
+                                {'Q_bo': numpy.linspace(0.1, 1.9, points), 'FPA_bo': numpy.linspace(0.0, 90.0, points)}, {}),
+            'timeOfFlight': (maximumRangeTimeOfFlight,
+                             {'r_bo': numpy.linspace(1.0, 1.2, points), 'freeFlightRange': numpy.linspace(0.5, 179.5, points)},
+                             {'returntype': ReturnType.CANONICAL})}
+
+
+def runBenchmark(processes=None, points: int = 2000) -> dict:
+    """
+    Times each sweep on a points x points grid with every number of processes.
+
+    Returns:
+        dict: (seconds, speed up over 1 process) keyed by (sweep, processes)
+    """
+    if processes is None:
+        processes = [1]
+        while processes[-1] * 2 <= (os.cpu_count() or 1):
+            processes.append(processes[-1] * 2)
+
+    results = {}
+    for name, (function, grid, fixed) in _sweeps(points).items():
+        single = None
+        for count in processes:
+            start = time.perf_counter()
+            sweep_engine.sweep(function, grid, fixed, executor=SweepExecutor(count))
+            seconds = time.perf_counter() - start
+            single = single or seconds
+            results[(name, count)] = (seconds, single / seconds)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Speed up of parallel sweeps with the number of processes")
+    parser.add_argument('--processes', type=int, nargs='+', default=None, help="process counts, the first is the reference")
+    parser.add_argument('--points', type=int, default=2000, help="grid points along each axis")
+    args = parser.parse_args(argv)
+
+    for (name, count), (seconds, speedUp) in runBenchmark(args.processes, args.points).items():
+        print("%-16s %4d processes %8.3f s %6.2fx" % (name, count, seconds, speedUp))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Per-call overhead of the free-flight angle entry points.
+
+"before" rebuilds the old `multipledispatch` overloads around the same equations (only when the package is
+installed), "after" is the `solveForFreeFlightAngle` compatibility shim, and "direct" calls the named
+equations that hot loops should use.
+
+    python -m benchmarks.six_02_free_flight_angle_dispatch_benchmark
+"""
+import timeit
+
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem as six_02
+
+
+def _multipledispatchBaseline():
+    try:
+        from multipledispatch import Dispatcher
+    except ImportError:
+        return None
+
+    dispatcher = Dispatcher('solveForFreeFlightAngle')
+
+    def fromBurnout(r_bo, v_bo, FPA_bo, returntype):
+        # the old overload re-entered the dispatcher for the (Q, FPA) equation
+        return dispatcher(six_02.solveForNondimentionalParametericParameter621(v_bo, r_bo, returntype), FPA_bo)
+
+    dispatcher.add((float, float), six_02.solveForFreeFlightAngleFromQ)
+    dispatcher.add((float, float, float, ReturnType), fromBurnout)
+    return dispatcher
+
+
+def _perCallNanoseconds(function, args, number: int) -> float:
+    timer = timeit.Timer(lambda: function(*args))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def runBenchmark(number: int = 200000) -> dict:
+    """
+    Times every entry point with both the (Q, FPA) and the (r, v, FPA, ReturnType) signatures.
+    Args:
+        number (int): calls per timing repeat
+
+    Returns:
+        dict: nanoseconds per call keyed by (entry point, signature)
+    """
+    signatures = {'Q, FPA': (0.8, 30.0),
+                  'r, v, FPA, ReturnType': (1.1, 0.905, 30.0, ReturnType.CANONICAL)}
+    direct = {'Q, FPA': six_02.solveForFreeFlightAngleFromQ,
+              'r, v, FPA, ReturnType': six_02.solveForFreeFlightAngleFromBurnout}
+
+    entryPoints = {'after (shim)': lambda signature: six_02.solveForFreeFlightAngle,
+                   'direct': lambda signature: direct[signature]}
+
+    baseline = _multipledispatchBaseline()
+    if baseline is not None:
+        entryPoints = dict({'before (multipledispatch)': lambda signature: baseline}, **entryPoints)
+
+    results = {}
+    for signature, args in signatures.items():
+        for entryPoint, getFunction in entryPoints.items():
+            results[(entryPoint, signature)] = _perCallNanoseconds(getFunction(signature), args, number)
+
+    return results
+
+
+if __name__ == '__main__':
+    for (entryPoint, signature), nanoseconds in runBenchmark().items():
+        print("%-26s %-24s %8.1f ns/call" % (entryPoint, signature, nanoseconds))
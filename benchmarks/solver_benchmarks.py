@@ -0,0 +1,311 @@
+"""
+Throughput of every public solver, one call at a time and in batches.
+
+Each public function of the one_04, one_08, four_02, six_02, six_03 and conversions modules is timed:
+
+- `scalar`: the scalar function, one call (size 1)
+- `batch`: its array version on arrays of each size (1, 1e3 and 1e6 by default)
+
+Times are nanoseconds per element, best of `repeat` runs.  Every run is appended to a JSON history file and,
+when a baseline has been saved, compared against it: a case that got slower by more than `--threshold` is
+reported as a regression and the command exits with status 1.
+
+    python -m benchmarks.solver_benchmarks --save-baseline     # on the release being compared against
+    python -m benchmarks.solver_benchmarks                     # later, flags regressions against it
+
+Only the standard library and NumPy are used, so it runs offline on any CPU.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import timeit
+
+import numpy
+
+from constants import conversions
+from constants.earth import ReturnType
+from four_position_and_velocity_a_funcion_of_time import four_02_time_of_flight_eccentric_anomoly, \
+    four_02_time_of_flight_eccentric_anomoly_vectorized
+from one_twoBodyOrbitalMecanics import one_04_constants_of_the_motion, one_04_constants_of_the_motion_vectorized, \
+    one_08_circular_orbit, one_08_circular_orbit_vectorized
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem, \
+    six_02_general_ballistic_missile_problem_vectorized, six_03_launching_errors_on_range, \
+    six_03_launching_errors_on_range_vectorized
+
+defaultSizes = (1, 1000, 1000000)
+defaultHistoryPath = os.path.join(os.path.dirname(__file__), 'benchmark_history.json')
+defaultBaselinePath = os.path.join(os.path.dirname(__file__), 'benchmark_baseline.json')
+
+
+def _nominalTrajectory() -> dict:
+    # the problem on pg. 305 (1st ed), with every derived quantity the solvers take
+    six_02 = six_02_general_ballistic_missile_problem
+    canonical = ReturnType.CANONICAL
+    r, v, fpa = 1.1, 0.905, 30.0
+    Q = six_02.solveForNondimentionalParametericParameter621(v, r, canonical)
+    psi = six_02.solveForFreeFlightAngleFromQ(Q, fpa)
+    e = six_02.solveForEccentricity(Q, fpa)
+    a = six_02.solveForSemiMajorAxis(r, Q)
+    return {'r': r, 'v': v, 'fpa': fpa, 'Q': Q, 'psi': psi, 'e': e, 'a': a,
+            'p': a * (1.0 - e * e),
+            'nu': six_02.solveForAnomalyAngleAtBurnout(psi),
+            'E': six_02.solveForEccentricAnomalyFromMaxRange(e, psi),
+            'energy': one_04_constants_of_the_motion.solveForSpecificMechanicalEnergy(v, r, canonical),
+            'h': one_04_constants_of_the_motion.solveForAngularmoment(v, r, fpa),
+            'icHeight': six_03_launching_errors_on_range.solveForInfluenceCoefficientBurnoutHeight(r, v, fpa, psi, canonical)}
+
+
+def _cases() -> dict:
+    """
+    Scalar arguments of every public function, keyed by module and then function name
+    """
+    t = _nominalTrajectory()
+    canonical = ReturnType.CANONICAL
+    r, v, fpa, Q, psi, e, a = t['r'], t['v'], t['fpa'], t['Q'], t['psi'], t['e'], t['a']
+
+    cases = {
+        one_04_constants_of_the_motion: {
+            'solveForSpecificMechanicalEnergy': (v, r, canonical),
+            'solveForVelocityFromSpecificEnergy': (t['energy'], r, canonical),
+            'solveForAngularMomentum': (v, r),
+            'solveForAngularmoment': (v, r, fpa),
+            'solveForFPAFromAngularMomentum': (t['h'], v, r),
+        },
+        one_08_circular_orbit: {
+            'circularSatelliteSpeed': (r, canonical),
+        },
+        four_02_time_of_flight_eccentric_anomoly: {
+            'solveforEccentricAnomoly': (e, t['nu']),
+            'solveForMeanAnomaly': (e, t['E']),
+            'solveForEccentricAnomalyFromMeanAnomaly': (e, t['E']),
+            'solveForTrueAnomalyFromEccentricAnomaly': (e, t['E']),
+        },
+        six_02_general_ballistic_missile_problem: {
+            'six21': (v, r, canonical),
+            'solveForNondimentionalParametericParameter621': (v, r, canonical),
+            'solveForVelocity621': (Q, r, canonical),
+            'solveForNondimentionalParameter622': (v, r, canonical),
+            'solveForSemiMajorAxis': (r, Q),
+            'solveForNondimentionalParameter624': (r, a),
+            'solveForEccentricity': (Q, fpa),
+            'solveForRadiusOfEllipse': (t['p'], e, t['nu']),
+            'solveForAnomalyOfEllipse': (t['p'], e, r),
+            'solveForFreeFlightAngleFromAnomaly': (t['nu'],),
+            'solveForAnomalyAngleAtBurnout': (psi,),
+            'solveForFreeFlightAngleFromQ': (Q, fpa),
+            'solveForFreeFlightAngleFromBurnout': (r, v, fpa, canonical),
+            'solveForFreeFlightAngle': (Q, fpa),
+            'solveForFlightPathAngle': (psi, Q),
+            'solveForMaxBurnoutFlightPathAngle': (psi,),
+            'solveForMaxRangeAngle': (Q,),
+            'solveForRequiredQAtMaxRange': (psi,),
+            'solveForEccentricAnomalyFromMaxRange': (e, psi),
+            'solveForTimeOfFreeFlight': (t['E'], e, a, canonical),
+            'solveForTimeOfFreeFlightFromBurnout': (r, v, fpa, canonical),
+            'solveForFreeFlightTime': (r, canonical),
+        },
+        six_03_launching_errors_on_range: {
+            'solveForCrossRangeErrorLateral': (psi, 0.01),
+            'solveForCrossRangeErrorLateralSmallAngleApprox': (psi, 0.01),
+            'solveForCrossRangeErrorAzimuthal': (psi, 0.01),
+            'solveForCrossRangeErrorAzimuthalSmallAngleApprox': (psi, 0.01),
+            'solveForDownRangeError': (Q, fpa),
+            'solveForInfluenceCoefficientFPAError': (psi, fpa),
+            'solveForInfluenceCoefficientBurnoutHeight': (r, v, fpa, psi, canonical),
+            'solveForInfluenceCoefficientBurnoutVelocity': (r, v, fpa, psi, canonical),
+            'solveForInfluenceCoefficientBurnoutVelocityAlternative': (r, v, t['icHeight']),
+            'solveForInfluenceCoefficients': (r, v, fpa, canonical),
+        },
+        conversions: {
+            'getConversionFactor': ('ft/sec', 'km/sec'),
+            'convert': (22000.0, 'ft/sec', 'km/sec'),
+            'convertColumns': ({'v_bo': 22000.0}, {'v_bo': ('ft/sec', 'km/sec')}),
+        },
+    }
+
+    # every scalar lambda and convert* function takes one value
+    for name in getPublicFunctions(conversions):
+        cases[conversions].setdefault(name, (1.0,))
+
+    return cases
+
+
+# the array version of each scalar module; conversions and the free-flight angle shim handle arrays themselves
+_batchModules = {
+    one_04_constants_of_the_motion: one_04_constants_of_the_motion_vectorized,
+    one_08_circular_orbit: one_08_circular_orbit_vectorized,
+    four_02_time_of_flight_eccentric_anomoly: four_02_time_of_flight_eccentric_anomoly_vectorized,
+    six_02_general_ballistic_missile_problem: six_02_general_ballistic_missile_problem_vectorized,
+    six_03_launching_errors_on_range: six_03_launching_errors_on_range_vectorized,
+    conversions: conversions,
+}
+_arrayAwareFunctions = {(six_02_general_ballistic_missile_problem, 'solveForFreeFlightAngle')}
+
+
+def getPublicFunctions(module) -> list:
+    """
+    Names of the functions (and function valued constants such as `six21`) defined by `module`
+    """
+    return [name for name, value in vars(module).items()
+            if callable(value) and not name.startswith('_') and getattr(value, '__module__', None) == module.__name__
+            and not isinstance(value, type)]
+
+
+def _batchFunction(module, name: str):
+    if (module, name) in _arrayAwareFunctions:
+        return getattr(module, name)
+    return getattr(_batchModules[module], name, None)
+
+
+def _batchArguments(args: tuple, size: int):
+    # floats become arrays of `size` elements around the nominal value; None if there is nothing to batch
+    spread = numpy.linspace(0.999, 1.001, size) if size > 1 else numpy.ones(1)
+
+    def toArray(arg):
+        if isinstance(arg, float):
+            return arg * spread
+        if isinstance(arg, dict):
+            return {key: toArray(value) for key, value in arg.items()}
+        return arg
+
+    if not any(isinstance(arg, (float, dict)) for arg in args):
+        return None
+    return tuple(toArray(arg) for arg in args)
+
+
+def _nanosecondsPerElement(function, args: tuple, elements: int, repeat: int, minTime: float) -> float:
+    timer = timeit.Timer(lambda: function(*args))
+    # grow the number of calls until one timing run lasts at least minTime
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= minTime:
+            break
+        number = max(number * 2, int(number * minTime / max(elapsed, 1e-9) * 1.1))
+    best = min([elapsed] + timer.repeat(repeat=repeat - 1, number=number))
+    return best / number / elements * 1e9
+
+
+def runBenchmarks(sizes=defaultSizes, repeat: int = 3, minTime: float = 0.2, match: str = None) -> dict:
+    """
+    Times every case.
+    Args:
+        sizes (tuple): batch sizes
+        repeat (int): timing runs per case, the best is kept
+        minTime (float): seconds each timing run lasts at least
+        match (str): only time functions whose `module.function` name contains this
+
+    Returns:
+        dict: nanoseconds per element keyed by `module.function|mode|size`
+    """
+    results = {}
+    for module, functions in _cases().items():
+        for name, args in functions.items():
+            qualifiedName = "%s.%s" % (module.__name__.rsplit('.', 1)[-1], name)
+            if match and match not in qualifiedName:
+                continue
+
+            results["%s|scalar|1" % qualifiedName] = _nanosecondsPerElement(getattr(module, name), args, 1, repeat, minTime)
+
+            batchFunction = _batchFunction(module, name)
+            if batchFunction is None:
+                continue
+            for size in sizes:
+                batchArgs = _batchArguments(args, size)
+                if batchArgs is not None:
+                    results["%s|batch|%d" % (qualifiedName, size)] = _nanosecondsPerElement(batchFunction, batchArgs, size, repeat, minTime)
+
+    return results
+
+
+def getMissingCases() -> list:
+    """
+    Public functions the suite has no case for, as `module.function`
+    """
+    cases = _cases()
+    return ["%s.%s" % (module.__name__, name) for module in cases
+            for name in getPublicFunctions(module) if name not in cases[module]]
+
+
+def findRegressions(results: dict, baseline: dict, threshold: float) -> dict:
+    """
+    Cases more than `threshold` (a fraction) slower than the baseline.
+    Args:
+        results (dict): nanoseconds per element of this run
+        baseline (dict): nanoseconds per element of the baseline run
+        threshold (float): allowed slow down, e.g. 0.2 for 20%
+
+    Returns:
+        dict: (baseline, result) nanoseconds keyed by case
+    """
+    return {case: (baseline[case], nanoseconds) for case, nanoseconds in results.items()
+            if case in baseline and nanoseconds > baseline[case] * (1.0 + threshold)}
+
+
+def _environment() -> dict:
+    return {'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(), 'numpy': numpy.__version__,
+            'machine': platform.machine(), 'processor': platform.processor() or platform.machine(),
+            'platform': platform.platform()}
+
+
+def appendHistory(path: str, results: dict) -> dict:
+    """
+    Appends a run to the JSON history file (a list of runs) and returns the run
+    """
+    history = []
+    if os.path.exists(path):
+        with open(path) as historyFile:
+            history = json.load(historyFile)
+
+    run = dict(_environment(), results=results)
+    history.append(run)
+    with open(path, 'w') as historyFile:
+        json.dump(history, historyFile, indent=1)
+    return run
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time every public solver, scalar and batch, and flag regressions")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(defaultSizes), help="batch sizes")
+    parser.add_argument('--repeat', type=int, default=3, help="timing runs per case, the best is kept")
+    parser.add_argument('--min-time', type=float, default=0.2, help="seconds each timing run lasts at least")
+    parser.add_argument('--match', default=None, help="only time functions whose module.function contains this")
+    parser.add_argument('--history', default=defaultHistoryPath, help="JSON history file runs are appended to")
+    parser.add_argument('--baseline', default=defaultBaselinePath, help="JSON baseline results to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the baseline")
+    parser.add_argument('--threshold', type=float, default=0.2, help="slow down reported as a regression (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    for name in getMissingCases():
+        print("no benchmark case for %s" % name, file=sys.stderr)
+
+    results = runBenchmarks(args.sizes, args.repeat, args.min_time, args.match)
+    run = appendHistory(args.history, results)
+
+    for case in sorted(results):
+        print("%-80s %12.1f ns/element" % (case, results[case]))
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as baselineFile:
+            json.dump(run, baselineFile, indent=1)
+        print("baseline saved to %s" % args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline at %s, run with --save-baseline to create one" % args.baseline)
+        return 0
+
+    with open(args.baseline) as baselineFile:
+        regressions = findRegressions(results, json.load(baselineFile)['results'], args.threshold)
+    for case, (before, after) in sorted(regressions.items()):
+        print("REGRESSION %-69s %10.1f -> %10.1f ns/element (%+.0f%%)" % (case, before, after, (after / before - 1.0) * 100.0))
+    print("%d regressions beyond %.0f%%" % (len(regressions), args.threshold * 100.0))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
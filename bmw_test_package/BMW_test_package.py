@@ -1,16 +1,64 @@
 import unittest
 
-from bmw_test_package.chapter_tests.chapter_06 import six_02_tests, six_03_tests
+from bmw_test_package.chapter_tests.benchmarks import solver_benchmarks_tests, import_time_benchmark_tests
+from bmw_test_package.chapter_tests.constants import conversions_tests
+from bmw_test_package.chapter_tests.utilities import solver_instrumentation_tests, sweep_engine_tests, \
+    parallel_sweep_tests
+from bmw_test_package.chapter_tests.chapter_04 import four_02_tests
+from bmw_test_package.chapter_tests.chapter_06 import six_02_tests, six_02_vectorized_tests, six_02_range_table_tests, \
+    six_02_time_of_flight_table_tests, six_02_targeting_tests, six_02_trajectory_ephemeris_tests, six_02_geodesy_tests, six_02_feasibility_matrix_tests, \
+    six_02_inverse_range_tests, six_03_tests, six_03_monte_carlo_tests, six_03_covariance_propagation_tests, \
+    batch_evaluator_tests, ballistic_model_tests, solver_service_tests, domain_status_tests, burnout_state_tests, \
+    ballistic_case_tests
 
 
 def suite():
     suiteRun = unittest.TestSuite()
 
+    # constants tests
+    suiteRun.addTests(conversions_tests.suite())
+
+    # chapter 4, section 2 tests
+    suiteRun.addTests(four_02_tests.suite())
+
     # chapter 6, section 2 tests
     suiteRun.addTests(six_02_tests.suite())
+    suiteRun.addTests(six_02_vectorized_tests.suite())
+    suiteRun.addTests(six_02_range_table_tests.suite())
+    suiteRun.addTests(six_02_time_of_flight_table_tests.suite())
+    suiteRun.addTests(six_02_targeting_tests.suite())
+    suiteRun.addTests(six_02_trajectory_ephemeris_tests.suite())
+    suiteRun.addTests(six_02_geodesy_tests.suite())
+    suiteRun.addTests(six_02_feasibility_matrix_tests.suite())
+    suiteRun.addTests(six_02_inverse_range_tests.suite())
+    suiteRun.addTests(domain_status_tests.suite())
+    suiteRun.addTests(burnout_state_tests.suite())
+    suiteRun.addTests(ballistic_case_tests.suite())
 
     # chapter 6, section 3 tests
     suiteRun.addTests(six_03_tests.suite())
+    suiteRun.addTests(six_03_monte_carlo_tests.suite())
+    suiteRun.addTests(six_03_covariance_propagation_tests.suite())
+
+    # equations bound to one set of Earth constants
+    suiteRun.addTests(ballistic_model_tests.suite())
+
+    # batch evaluation of chapter 6
+    suiteRun.addTests(batch_evaluator_tests.suite())
+
+    # local solver service
+    suiteRun.addTests(solver_service_tests.suite())
+
+    # benchmark suite
+    suiteRun.addTests(solver_benchmarks_tests.suite())
+    suiteRun.addTests(import_time_benchmark_tests.suite())
+
+    # instrumentation
+    suiteRun.addTests(solver_instrumentation_tests.suite())
+
+    # families of curves
+    suiteRun.addTests(sweep_engine_tests.suite())
+    suiteRun.addTests(parallel_sweep_tests.suite())
 
     return suiteRun
 
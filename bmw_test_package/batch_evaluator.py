@@ -0,0 +1,281 @@
+"""
+Streams burnout states through the Chapter 6 solvers.
+
+Reads records with `r_bo`, `v_bo`, `fpa_bo` (degrees) and optionally `units` (a `ReturnType` name, `--units` when
+missing, empty or null) from CSV,
+newline-delimited JSON or a memory-mapped `BurnoutStateArray` catalog (`.npy`), a fixed number of records at a time, evaluates each chunk with the array solvers
+and writes the inputs back out with these columns added:
+
+- `Q_bo`: equation 6.2-1
+- `freeFlightAngle`: equation 6.2-12 (degrees)
+- `freeFlightRange`: ground range of the free flight, in the length unit of `units`
+- `timeOfFlight`: equations 6.2-21 and 6.2-22, in the time unit of `units`; interpolated instead when a
+  `TimeOfFlightTable` is given (`--time-of-flight-table`)
+- `icFPAError`, `icBurnoutHeight`, `icBurnoutVelocity`: equations 6.3-13, 6.3-16 and 6.3-18
+- `status`: only with `--errors mask`, the most severe `domain_status.Status` of the row's equations
+  (ok, clamped, degenerate or unreachable); the number of rows with each status is added to the summary
+
+Only one chunk is held in memory at a time, so the input can be piped through from files of any size:
+
+    python -m bmw_test_package.batch_evaluator --input states.csv --output-format ndjson > results.ndjson
+    python -m bmw_test_package.batch_evaluator --input catalog.npy --output results.csv
+
+The rows/sec rate is reported on stderr when the input is exhausted.  With `BMW_INSTRUMENTATION=1` set the
+solver calls are instrumented, see `utilities.solver_instrumentation`.
+"""
+import argparse
+import collections
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+import time
+
+import numpy
+
+from constants import earth, trig
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import burnout_state, domain_status, six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories import six_03_launching_errors_on_range_vectorized
+from six_ballisticMissileTrajectories.burnout_state import BurnoutStateArray
+from six_ballisticMissileTrajectories.six_02_time_of_flight_table import TimeOfFlightTable
+from utilities import solver_instrumentation
+
+resultColumns = ('Q_bo', 'freeFlightAngle', 'freeFlightRange', 'timeOfFlight',
+                 'icFPAError', 'icBurnoutHeight', 'icBurnoutVelocity')
+
+_statusNames = numpy.array([status.name.lower() for status in domain_status.Status])
+
+
+def evaluateChunk(r_bo: numpy.ndarray, v_bo: numpy.ndarray, fpa_bo: numpy.ndarray, returntype: ReturnType,
+                  timeOfFlightTable: TimeOfFlightTable = None, errors: str = 'nan') -> dict:
+    """
+    Evaluates every result column for a chunk of burnout states that share one unit system.
+    Args:
+        r_bo (numpy.ndarray): burnout radius
+        v_bo (numpy.ndarray): burnout velocity
+        fpa_bo (numpy.ndarray): burnout flight path angle (degrees)
+        returntype (ReturnType): unit system of the chunk
+        timeOfFlightTable (TimeOfFlightTable): interpolate the time of flight from this table instead of solving it
+        errors (str): 'nan', or 'mask' to add a `status` array of `domain_status.Status` codes
+
+    Returns:
+        dict: result arrays keyed by the names in `resultColumns` (and `status`)
+    """
+    six_02 = six_02_general_ballistic_missile_problem_vectorized
+    six_03 = six_03_launching_errors_on_range_vectorized
+    domain_status.checkErrors(errors)
+    statuses = []
+
+    def values(result):
+        # the values of a masked result; its status goes into the status of the row
+        if errors == 'mask':
+            statuses.append(result.status)
+            return result.values
+        return result
+
+    Q_bo = six_02.solveForNondimentionalParametericParameter621(v_bo, r_bo, returntype)
+    freeFlightAngle = values(six_02.solveForFreeFlightAngleFromQ(Q_bo, fpa_bo, errors))
+    if timeOfFlightTable is None:
+        timeOfFlight = values(six_02.solveForTimeOfFreeFlightFromBurnout(r_bo, v_bo, fpa_bo, returntype, errors))
+    else:
+        timeOfFlight = timeOfFlightTable.getTimeOfFlight(Q_bo, fpa_bo, r_bo, returntype)
+        if errors == 'mask':
+            values(domain_status.classify(timeOfFlight))
+
+    results = {'Q_bo': Q_bo,
+               'freeFlightAngle': freeFlightAngle,
+               'freeFlightRange': freeFlightAngle * trig.degrees2radians * earth.getMeanEquatorialRadius(returntype),
+               'timeOfFlight': timeOfFlight,
+               'icFPAError': values(six_03.solveForInfluenceCoefficientFPAError(freeFlightAngle, fpa_bo, errors)),
+               'icBurnoutHeight': values(six_03.solveForInfluenceCoefficientBurnoutHeight(r_bo, v_bo, fpa_bo, freeFlightAngle,
+                                                                                          returntype, errors)),
+               'icBurnoutVelocity': values(six_03.solveForInfluenceCoefficientBurnoutVelocity(r_bo, v_bo, fpa_bo, freeFlightAngle,
+                                                                                              returntype, errors))}
+    if errors == 'mask':
+        results['status'] = domain_status.combine(*statuses)
+    return results
+
+
+def _evaluateRecords(columns: dict, timeOfFlightTable: TimeOfFlightTable = None, errors: str = 'nan') -> dict:
+    r_bo = numpy.asarray(columns['r_bo'], dtype=float)
+    v_bo = numpy.asarray(columns['v_bo'], dtype=float)
+    fpa_bo = numpy.asarray(columns['fpa_bo'], dtype=float)
+    units = numpy.asarray([name.upper() for name in columns['units']])
+
+    results = {name: numpy.empty(r_bo.shape) for name in resultColumns}
+    if errors == 'mask':
+        results['status'] = numpy.empty(r_bo.shape, dtype=domain_status.statusType)
+    for unitName in numpy.unique(units):
+        rows = units == unitName
+        chunkResults = evaluateChunk(r_bo[rows], v_bo[rows], fpa_bo[rows], ReturnType[unitName], timeOfFlightTable, errors)
+        for name in results:
+            results[name][rows] = chunkResults[name]
+
+    return results
+
+
+def _withDefaultUnits(names, defaultUnits: str) -> list:
+    # an empty CSV cell or a JSON null stands for the default units, like a missing field
+    return [name.strip() if name and name.strip() else defaultUnits for name in names]
+
+
+def readCsv(stream, chunkSize: int, defaultUnits: str):
+    """
+    Yields the records of a CSV stream with a header row as dictionaries of columns, `chunkSize` rows at a time
+    """
+    reader = csv.reader(stream)
+    header = next(reader)
+    while True:
+        rows = list(itertools.islice(reader, chunkSize))
+        if not rows:
+            return
+        columns = dict(zip(header, zip(*rows)))
+        columns['units'] = _withDefaultUnits(columns.get('units', (None,) * len(rows)), defaultUnits)
+        yield columns
+
+
+def readNdjson(stream, chunkSize: int, defaultUnits: str):
+    """
+    Yields the records of a newline-delimited JSON stream as dictionaries of columns, `chunkSize` rows at a time
+    """
+    lines = (line for line in stream if line.strip())
+    while True:
+        records = [json.loads(line) for line in itertools.islice(lines, chunkSize)]
+        if not records:
+            return
+        columns = {name: [record.get(name) for record in records] for name in records[0]}
+        columns['units'] = _withDefaultUnits([record.get('units') for record in records], defaultUnits)
+        yield columns
+
+
+def readStates(states: BurnoutStateArray, chunkSize: int, defaultUnits: str):
+    """
+    Yields the columns of a `BurnoutStateArray` as dictionaries of views, `chunkSize` states at a time; the units
+    of the catalog take the place of `defaultUnits`
+    """
+    unitName = states.getReturnType().name
+    for chunk in states.chunks(chunkSize):
+        columns = {name: chunk.getColumn(name) for name in burnout_state.fields}
+        columns['units'] = (unitName,) * len(chunk)
+        yield columns
+
+
+def writeCsv(stream, chunks):
+    rowFormat = None
+    for columns in chunks:
+        if rowFormat is None:
+            csv.writer(stream, lineterminator='\n').writerow(columns.keys())
+            # formatting the floats directly is about twice as fast as csv.writer, and %.17g round trips exactly
+            rowFormat = ','.join('%.17g' if name in resultColumns else '%s' for name in columns) + '\n'
+        stream.write(''.join([rowFormat % row for row in zip(*(_asList(values) for values in columns.values()))]))
+
+
+def writeNdjson(stream, chunks):
+    for columns in chunks:
+        names = list(columns.keys())
+        for row in zip(*(_asList(values) for values in columns.values())):
+            # NaN and infinity are not valid JSON, unreachable and singular results are written as null
+            record = {name: (None if isinstance(value, float) and not math.isfinite(value) else value)
+                      for name, value in zip(names, row)}
+            stream.write(json.dumps(record, allow_nan=False))
+            stream.write('\n')
+
+
+def _asList(values) -> list:
+    return values.tolist() if isinstance(values, numpy.ndarray) else list(values)
+
+
+readers = {'csv': readCsv, 'ndjson': readNdjson, 'npy': readStates}
+writers = {'csv': writeCsv, 'ndjson': writeNdjson}
+
+
+def evaluateStream(inputStream, outputStream, inputFormat: str = 'csv', outputFormat: str = None,
+                   chunkSize: int = 65536, defaultUnits: str = 'CANONICAL',
+                   timeOfFlightTable: TimeOfFlightTable = None, errors: str = 'nan', statusCounts: collections.Counter = None) -> int:
+    """
+    Evaluates every record of `inputStream` and writes the results to `outputStream`, one chunk at a time.
+    Args:
+        inputStream: text stream of CSV (with a header row) or newline-delimited JSON records, or a
+            `BurnoutStateArray` for 'npy'
+        outputStream: text stream for the results
+        inputFormat (str): 'csv', 'ndjson' or 'npy'
+        outputFormat (str): 'csv' or 'ndjson', the input format (csv for 'npy') when not given
+        chunkSize (int): records held in memory at once
+        defaultUnits (str): `ReturnType` name used for records without a `units` field
+        timeOfFlightTable (TimeOfFlightTable): interpolate the time of flight from this table instead of solving it
+        errors (str): 'nan', or 'mask' to add a `status` column
+        statusCounts (collections.Counter): incremented with the number of records with each status ('mask' only)
+
+    Returns:
+        int: number of records evaluated
+    """
+    count = 0
+
+    def evaluatedChunks():
+        nonlocal count
+        for columns in readers[inputFormat](inputStream, chunkSize, defaultUnits):
+            results = _evaluateRecords(columns, timeOfFlightTable, errors)
+            count += len(columns['units'])
+            if 'status' in results:
+                if statusCounts is not None:
+                    statusCounts.update(domain_status.countStatuses(results['status']))
+                results['status'] = _statusNames[results['status']]
+            yield dict(columns, **results)
+
+    writers[outputFormat or (inputFormat if inputFormat in writers else 'csv')](outputStream, evaluatedChunks())
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate Chapter 6 ballistic missile solvers for a file of burnout states")
+    parser.add_argument('--input', default='-', help="input file, '-' for stdin (default)")
+    parser.add_argument('--output', default='-', help="output file, '-' for stdout (default)")
+    parser.add_argument('--input-format', choices=sorted(readers), default=None,
+                        help="defaults to the input file extension, or csv")
+    parser.add_argument('--output-format', choices=sorted(writers), default=None,
+                        help="defaults to the input format, or csv for npy")
+    parser.add_argument('--chunk-size', type=int, default=65536, help="records held in memory at once")
+    parser.add_argument('--units', default='CANONICAL', choices=[returntype.name for returntype in ReturnType],
+                        help="unit system of records without a units field")
+    parser.add_argument('--errors', choices=domain_status.errorModes, default='nan',
+                        help="'mask' adds a status column and counts each status in the summary")
+    parser.add_argument('--time-of-flight-table', default=None,
+                        help="interpolate the time of flight from this table file, built there on first use")
+    args = parser.parse_args(argv)
+    solver_instrumentation.enableFromEnvironment()
+
+    timeOfFlightTable = None
+    if args.time_of_flight_table is not None:
+        timeOfFlightTable = TimeOfFlightTable.loadOrBuild(args.time_of_flight_table)
+
+    inputFormat = args.input_format or {'.ndjson': 'ndjson', '.jsonl': 'ndjson', '.npy': 'npy'}.get(
+        os.path.splitext(args.input)[1], 'csv')
+    if inputFormat == 'npy':
+        inputStream = BurnoutStateArray.open(args.input)
+    else:
+        inputStream = sys.stdin if args.input == '-' else open(args.input, newline='')
+    outputStream = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+
+    statusCounts = collections.Counter()
+    start = time.perf_counter()
+    try:
+        count = evaluateStream(inputStream, outputStream, inputFormat, args.output_format, args.chunk_size, args.units,
+                               timeOfFlightTable, args.errors, statusCounts)
+    finally:
+        if inputStream is not sys.stdin and inputFormat != 'npy':
+            inputStream.close()
+        if outputStream is not sys.stdout:
+            outputStream.close()
+    elapsed = time.perf_counter() - start
+
+    print("%d rows in %.3f s (%.0f rows/sec)" % (count, elapsed, count / elapsed if elapsed > 0 else math.inf), file=sys.stderr)
+    if args.errors == 'mask':
+        print(", ".join("%s: %d" % (status.name.lower(), statusCounts[status.name.lower()]) for status in domain_status.Status),
+              file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import unittest
+
+from benchmarks import import_time_benchmark
+
+
+class ImportTimeBenchmarkTests(unittest.TestCase):
+    """
+    The scalar solvers stay importable with the standard library alone, within the import budget
+    """
+
+    def test_CoreModulesWithinBudget(self):
+        """
+        No core module loads NumPy, pandas, matplotlib or multipledispatch, or takes longer than the budget.
+        """
+        results = import_time_benchmark.checkImportBudget(repeat=1)
+        self.assertEqual(set(results), set(import_time_benchmark.coreModules))
+        for module, (milliseconds, heavy, problem) in results.items():
+            self.assertEqual(heavy, [], module)
+            self.assertIsNone(problem, "%s: %.1f ms" % (module, milliseconds))
+
+    def test_PlotsImportLazily(self):
+        """
+        pandas and matplotlib are only imported when a chart is drawn.
+        """
+        _, heavy = import_time_benchmark.measureImport('bmw_test_package.chapter_tests.chapter_06.six_02_plots', repeat=1)
+        self.assertNotIn('pandas', heavy)
+        self.assertNotIn('matplotlib', heavy)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(ImportTimeBenchmarkTests('test_CoreModulesWithinBudget'))
+    suite.addTest(ImportTimeBenchmarkTests('test_PlotsImportLazily'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy
+
+from benchmarks import solver_benchmarks
+
+
+class SolverBenchmarksTests(unittest.TestCase):
+    """
+    Coverage and bookkeeping of the solver benchmark suite
+    """
+
+    def test_EveryPublicFunctionHasACase(self):
+        """
+        Adding a solver without a benchmark case fails here.
+        """
+        self.assertEqual(solver_benchmarks.getMissingCases(), [])
+
+    def test_BatchMatchesScalar(self):
+        """
+        Each batch version gives the scalar result for the benchmark inputs, so both time the same work.
+        """
+        for module, functions in solver_benchmarks._cases().items():
+            for name, args in functions.items():
+                batchFunction = solver_benchmarks._batchFunction(module, name)
+                batchArgs = solver_benchmarks._batchArguments(args, 1)
+                if batchFunction is None or batchArgs is None or isinstance(args[0], dict):
+                    continue
+                expected = getattr(module, name)(*args)
+                numpy.testing.assert_allclose(numpy.squeeze(batchFunction(*batchArgs)), expected, rtol=1e-12,
+                                              err_msg="%s.%s" % (module.__name__, name))
+
+    def test_FindRegressions(self):
+        """
+        Only cases slower than the threshold, and present in the baseline, are regressions.
+        """
+        baseline = {'a|scalar|1': 100.0, 'b|scalar|1': 100.0, 'c|batch|1000': 10.0}
+        results = {'a|scalar|1': 119.0, 'b|scalar|1': 121.0, 'c|batch|1000': 5.0, 'd|scalar|1': 1000.0}
+
+        regressions = solver_benchmarks.findRegressions(results, baseline, 0.2)
+        self.assertEqual(regressions, {'b|scalar|1': (100.0, 121.0)})
+
+        timings = solver_benchmarks.runBenchmarks(sizes=(1, 1000), repeat=1, minTime=0.001, match='solveForFreeFlightAngleFromQ')
+        self.assertEqual(sorted(timings), ['six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ|batch|1',
+                                           'six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ|batch|1000',
+                                           'six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ|scalar|1'])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(SolverBenchmarksTests('test_EveryPublicFunctionHasACase'))
+    suite.addTest(SolverBenchmarksTests('test_BatchMatchesScalar'))
+    suite.addTest(SolverBenchmarksTests('test_FindRegressions'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
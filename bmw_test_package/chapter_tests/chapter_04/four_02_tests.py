@@ -0,0 +1,75 @@
+import math
+import unittest
+
+import numpy
+
+from four_position_and_velocity_a_funcion_of_time import four_02_time_of_flight_eccentric_anomoly, \
+    four_02_time_of_flight_eccentric_anomoly_vectorized
+
+
+class KeplerEquationTests(unittest.TestCase):
+    """
+    Position as a function of time: Kepler's equation and the eccentric to true anomaly conversion
+    """
+
+    def test_RoundTripOfManyPairs(self):
+        """
+        E from M satisfies Kepler's equation for a large batch, including e near 1 and several turns.
+        """
+        four_02 = four_02_time_of_flight_eccentric_anomoly_vectorized
+        generator = numpy.random.default_rng(12)
+        e = numpy.concatenate((generator.uniform(0.0, 0.999999, 200000), [0.0, 0.999999, 0.999999, 0.5]))
+        M = numpy.concatenate((generator.uniform(-720.0, 720.0, 200000), [37.0, 1e-6, 179.999, 400.0]))
+
+        capE = four_02.solveForEccentricAnomalyFromMeanAnomaly(e, M, maxIterations=6)
+        self.assertFalse(numpy.isnan(capE).any())
+        numpy.testing.assert_allclose(four_02.solveForMeanAnomaly(e, capE), M, rtol=0.0, atol=1e-9)
+        self.assertEqual(capE[-4], 37.0)
+        self.assertGreater(capE[-1], 360.0)
+
+    def test_IterationCapAndDomain(self):
+        """
+        Elements that do not converge within the cap, or have no elliptic solution, are NaN.
+        """
+        four_02 = four_02_time_of_flight_eccentric_anomoly_vectorized
+        self.assertTrue(numpy.isnan(four_02.solveForEccentricAnomalyFromMeanAnomaly([0.5, 0.9], [100.0, 10.0], maxIterations=1)).all())
+        capE = four_02.solveForEccentricAnomalyFromMeanAnomaly([0.1, 1.0, -0.1, 0.5], [30.0, 30.0, 30.0, numpy.nan])
+        self.assertFalse(numpy.isnan(capE[0]))
+        self.assertTrue(numpy.isnan(capE[1:]).all())
+
+        self.assertTrue(math.isnan(four_02_time_of_flight_eccentric_anomoly.solveForEccentricAnomalyFromMeanAnomaly(1.2, 30.0)))
+
+    def test_ScalarMatchesVectorized(self):
+        """
+        The scalar and array versions agree, and E to v inverts equation 4.2-8.
+        """
+        scalar = four_02_time_of_flight_eccentric_anomoly
+        four_02 = four_02_time_of_flight_eccentric_anomoly_vectorized
+        e = numpy.array([0.0, 0.2, 0.5, 0.9, 0.97])
+        M = numpy.array([10.0, 100.0, 200.0, 359.0, -45.0])
+
+        capE = four_02.solveForEccentricAnomalyFromMeanAnomaly(e, M)
+        trueAnomaly = four_02.solveForTrueAnomalyFromEccentricAnomaly(e, capE)
+        for i in range(len(e)):
+            self.assertAlmostEqual(scalar.solveForEccentricAnomalyFromMeanAnomaly(e[i], M[i]), capE[i], 10)
+            self.assertAlmostEqual(scalar.solveForTrueAnomalyFromEccentricAnomaly(e[i], capE[i]), trueAnomaly[i], 10)
+            self.assertAlmostEqual(scalar.solveForMeanAnomaly(e[i], capE[i]), M[i], 10)
+
+        # true anomaly on the same turn as E, and back through equation 4.2-8 on the ascending half
+        numpy.testing.assert_array_equal(numpy.floor(trueAnomaly / 360.0), numpy.floor(capE / 360.0))
+        v = numpy.array([20.0, 90.0, 150.0, 179.0])
+        capE = four_02.solveforEccentricAnomoly(0.6, v)
+        numpy.testing.assert_allclose(four_02.solveForTrueAnomalyFromEccentricAnomaly(0.6, capE), v, rtol=1e-12)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(KeplerEquationTests('test_RoundTripOfManyPairs'))
+    suite.addTest(KeplerEquationTests('test_IterationCapAndDomain'))
+    suite.addTest(KeplerEquationTests('test_ScalarMatchesVectorized'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
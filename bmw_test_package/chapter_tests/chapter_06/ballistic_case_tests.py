@@ -0,0 +1,95 @@
+import unittest
+
+import numpy
+
+from constants import earth
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories.ballistic_case import BallisticCase
+from six_ballisticMissileTrajectories.burnout_state import BurnoutStateArray
+
+
+class BallisticCaseTests(unittest.TestCase):
+    """
+    Lazily evaluated, cached quantities of a burnout state and what changing an input forgets
+    """
+
+    def test_ExampleProblem(self):
+        """
+        The example problem starting on page 290 of the BMW book, evaluated on demand.
+        """
+        typeUsed = ReturnType.CANONICAL
+        case = BallisticCase(earth.getMeanEquatorialRadius(typeUsed) + 1.0/5.0, 2.0/3.0, 51.31781255, typeUsed)
+        self.assertFalse(case.isCached('Q_bo'))
+
+        self.assertAlmostEqual(case.freeFlightAngle, 36.4, 1, "Wrong free flight angle")
+        self.assertTrue(case.isCached('Q_bo'))
+        self.assertFalse(case.isCached('energy'))
+        self.assertAlmostEqual(case.energy, -11/18, 3, "Wrong specific energy")
+        self.assertAlmostEqual(case.angularMomentum, 1/2, 3, "Wrong angular momentum")
+        self.assertAlmostEqual(case.Q_bo, 0.533, 3, "Wrong Q_bo")
+        self.assertAlmostEqual(case.semiLatusRectum, case.semiMajorAxis * (1.0 - case.eccentricity**2), 12)
+        self.assertEqual(case.timeOfFlight, six_02_general_ballistic_missile_problem_vectorized.
+                         solveForTimeOfFreeFlightFromBurnout(case.getInput('r_bo'), 2.0/3.0, 51.31781255, typeUsed))
+        self.assertFalse(case.isCached('eccentricAnomaly'))
+
+        # E is the burnout eccentric anomaly of this trajectory too, though pi - E loses digits for short flights
+        chained = six_02_general_ballistic_missile_problem_vectorized.solveForTimeOfFreeFlight(
+            case.eccentricAnomaly, case.eccentricity, case.semiMajorAxis, typeUsed)
+        self.assertAlmostEqual(chained, case.timeOfFlight, 12)
+        short = BallisticCase(1.0, 0.01, 45.0, typeUsed)
+        self.assertAlmostEqual(short.timeOfFlight, 0.014143314219891, 14)
+
+        # only what depends on v_bo is evaluated again
+        case.circularSpeed
+        case.set(v_bo=0.7)
+        self.assertTrue(case.isCached('circularSpeed'))
+        self.assertFalse(case.isCached('Q_bo'))
+        self.assertFalse(case.isCached('timeOfFlight'))
+        case.set(v_bo=2.0/3.0)
+        self.assertAlmostEqual(case.freeFlightAngle, 36.4, 1)
+        counts = case.getEvaluationCounts()
+        self.assertEqual((counts['Q_bo'], counts['circularSpeed']), (2, 1))
+
+        with self.assertRaises(AttributeError):
+            case.range
+        with self.assertRaises(TypeError):
+            case.set(h_bo=0.2)
+
+    def test_IncrementalArrays(self):
+        """
+        Changing some of an array of cases recomputes the cached quantities at those elements, to the same values as
+        a fresh case set.
+        """
+        r_bo = numpy.linspace(1.01, 1.1, 60)
+        v_bo = numpy.linspace(0.6, 1.0, 60)
+        states = BurnoutStateArray.fromColumns(r_bo, v_bo, 35.0, ReturnType.CANONICAL)
+        cases = BallisticCase.fromStates(states)
+        cases.timeOfFlight
+        cases.icBurnoutVelocity
+
+        cases.set(where=slice(10, 20), v_bo=0.8)
+        cases.set(where=r_bo > 1.09, fpa_bo=40.0)
+        # the states themselves are left as they were
+        numpy.testing.assert_array_equal(states.getV(), v_bo)
+
+        fresh = BallisticCase(r_bo, cases.getInput('v_bo'), cases.getInput('fpa_bo'), ReturnType.CANONICAL)
+        for name in ('Q_bo', 'freeFlightAngle', 'timeOfFlight', 'icBurnoutVelocity'):
+            numpy.testing.assert_array_equal(cases.get(name), fresh.get(name), err_msg=name)
+        self.assertFalse(cases.isCached('energy'))
+        self.assertEqual(cases.getEvaluationCounts()['timeOfFlight'], 3)
+
+        with self.assertRaises(ValueError):
+            cases.set(where=0, returntype=ReturnType.METRIC)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(BallisticCaseTests('test_ExampleProblem'))
+    suite.addTest(BallisticCaseTests('test_IncrementalArrays'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+from constants.earth import EarthConstants, ReturnType
+from four_position_and_velocity_a_funcion_of_time import four_02_time_of_flight_eccentric_anomoly
+from one_twoBodyOrbitalMecanics import one_04_constants_of_the_motion, one_08_circular_orbit
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem, six_03_launching_errors_on_range
+from six_ballisticMissileTrajectories.ballistic_model import BallisticModel
+
+
+class BallisticModelTests(unittest.TestCase):
+    """
+    Equations bound to one set of Earth constants against the module level equations
+    """
+
+    def test_MatchesModuleFunctions(self):
+        """
+        The problem on pg. 305 (1st ed) in every unit system gives exactly the module results.
+        """
+        one_04 = one_04_constants_of_the_motion
+        six_02 = six_02_general_ballistic_missile_problem
+        six_03 = six_03_launching_errors_on_range
+
+        for typeUsed in ReturnType:
+            model = BallisticModel(typeUsed)
+            r_bo = 1.1 * typeUsed.value.getRadius()
+            v_bo = 0.905 * one_08_circular_orbit.circularSatelliteSpeed(typeUsed.value.getRadius(), typeUsed)
+            fpa_bo = 30.0
+
+            Q_bo = six_02.solveForNondimentionalParametericParameter621(v_bo, r_bo, typeUsed)
+            psi = six_02.solveForFreeFlightAngleFromBurnout(r_bo, v_bo, fpa_bo, typeUsed)
+            e = six_02.solveForEccentricity(Q_bo, fpa_bo)
+            a = six_02.solveForSemiMajorAxis(r_bo, Q_bo)
+            capE = six_02.solveForEccentricAnomalyFromMaxRange(e, psi)
+            energy = one_04.solveForSpecificMechanicalEnergy(v_bo, r_bo, typeUsed)
+
+            self.assertEqual(model.solveForSpecificMechanicalEnergy(v_bo, r_bo), energy)
+            self.assertEqual(model.solveForVelocityFromSpecificEnergy(energy, r_bo), one_04.solveForVelocityFromSpecificEnergy(energy, r_bo, typeUsed))
+            self.assertEqual(model.circularSatelliteSpeed(r_bo), one_08_circular_orbit.circularSatelliteSpeed(r_bo, typeUsed))
+            self.assertEqual(model.solveForNondimentionalParametericParameter621(v_bo, r_bo), Q_bo)
+            self.assertEqual(model.solveForVelocity621(Q_bo, r_bo), six_02.solveForVelocity621(Q_bo, r_bo, typeUsed))
+            self.assertEqual(model.solveForNondimentionalParameter622(v_bo, r_bo), six_02.solveForNondimentionalParameter622(v_bo, r_bo, typeUsed))
+            self.assertEqual(model.solveForFreeFlightAngleFromBurnout(r_bo, v_bo, fpa_bo), psi)
+            self.assertEqual(model.solveForTimeOfFreeFlight(capE, e, a), six_02.solveForTimeOfFreeFlight(capE, e, a, typeUsed))
+            for fpa, speed in ((fpa_bo, v_bo), (90.0, v_bo), (0.0, 1.2 * v_bo)):
+                self.assertEqual(model.solveForTimeOfFreeFlightFromBurnout(r_bo, speed, fpa),
+                                 six_02.solveForTimeOfFreeFlightFromBurnout(r_bo, speed, fpa, typeUsed))
+            self.assertEqual(model.solveForFreeFlightTime(r_bo), six_02.solveForFreeFlightTime(r_bo, typeUsed))
+            self.assertEqual(model.solveForInfluenceCoefficientBurnoutHeight(r_bo, v_bo, fpa_bo, psi),
+                             six_03.solveForInfluenceCoefficientBurnoutHeight(r_bo, v_bo, fpa_bo, psi, typeUsed))
+            self.assertEqual(model.solveForInfluenceCoefficientBurnoutVelocity(r_bo, v_bo, fpa_bo, psi),
+                             six_03.solveForInfluenceCoefficientBurnoutVelocity(r_bo, v_bo, fpa_bo, psi, typeUsed))
+            self.assertEqual(model.solveForInfluenceCoefficients(r_bo, v_bo, fpa_bo),
+                             six_03.solveForInfluenceCoefficients(r_bo, v_bo, fpa_bo, typeUsed))
+
+            # equations without constants are the module functions
+            self.assertEqual(model.solveForFreeFlightAngleFromQ(Q_bo, fpa_bo), psi)
+            self.assertEqual(model.solveforEccentricAnomoly(e, 120.0), four_02_time_of_flight_eccentric_anomoly.solveforEccentricAnomoly(e, 120.0))
+            self.assertEqual(model.solveForInfluenceCoefficientFPAError(psi, fpa_bo), six_03.solveForInfluenceCoefficientFPAError(psi, fpa_bo))
+
+    def test_CustomConstants(self):
+        """
+        Custom constants without touching `constants/earth.py`, and no per-instance dictionary.
+        """
+        canonical = BallisticModel(ReturnType.CANONICAL)
+        heavy = BallisticModel(EarthConstants('heavy', 4.0, 1.0))
+
+        self.assertEqual(heavy.getName(), 'heavy')
+        self.assertEqual(heavy.getMu(), 4.0)
+        self.assertEqual(heavy.solveForNondimentionalParametericParameter621(0.905, 1.1),
+                         canonical.solveForNondimentionalParametericParameter621(0.905, 1.1) / 4.0)
+        self.assertEqual(heavy.solveForFreeFlightTime(1.1), canonical.solveForFreeFlightTime(1.1) / 2.0)
+        self.assertAlmostEqual(heavy.solveForTimeOfFreeFlightFromBurnout(1.1, 2.0 * 0.905, 30.0),
+                               canonical.solveForTimeOfFreeFlightFromBurnout(1.1, 0.905, 30.0) / 2.0, 14)
+
+        self.assertFalse(hasattr(heavy, '__dict__'))
+        with self.assertRaises(TypeError):
+            BallisticModel(3.986012e5)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(BallisticModelTests('test_MatchesModuleFunctions'))
+    suite.addTest(BallisticModelTests('test_CustomConstants'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import io
+import json
+import math
+import unittest
+
+from constants import earth, trig
+from constants.earth import ReturnType
+from bmw_test_package import batch_evaluator
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem, six_03_launching_errors_on_range
+
+
+class BatchEvaluatorTests(unittest.TestCase):
+    """
+    Streaming CSV / NDJSON evaluation of burnout states
+    """
+
+    csvInput = "r_bo,v_bo,fpa_bo,units\n" \
+               "1.1,0.905,30.0,CANONICAL\n" \
+               "1.05,0.95,20.0,canonical\n" \
+               "1.1,0.905,89.9,CANONICAL\n" \
+               "7015.9595,7.15442,30.0,METRIC\n" \
+               "1.1,2.0,30.0,CANONICAL\n"
+
+    def test_CsvMatchesScalarEquations(self):
+        """
+        Every result column against the scalar equations, with mixed unit systems in one chunk.
+        """
+        output = io.StringIO()
+        count = batch_evaluator.evaluateStream(io.StringIO(self.csvInput), output, chunkSize=2)
+        self.assertEqual(count, 5)
+
+        lines = output.getvalue().splitlines()
+        header = lines[0].split(',')
+        self.assertEqual(header, ['r_bo', 'v_bo', 'fpa_bo', 'units'] + list(batch_evaluator.resultColumns))
+
+        six_02 = six_02_general_ballistic_missile_problem
+        six_03 = six_03_launching_errors_on_range
+        for line in lines[1:4]:
+            row = dict(zip(header, line.split(',')))
+            r_bo, v_bo, fpa_bo = float(row['r_bo']), float(row['v_bo']), float(row['fpa_bo'])
+            typeUsed = ReturnType[row['units'].upper()]
+
+            Q_bo = six_02.solveForNondimentionalParametericParameter621(v_bo, r_bo, typeUsed)
+            psi = six_02.solveForFreeFlightAngleFromQ(Q_bo, fpa_bo)
+            e = six_02.solveForEccentricity(Q_bo, fpa_bo)
+            a = six_02.solveForSemiMajorAxis(r_bo, Q_bo)
+            timeOfFlight = six_02.solveForTimeOfFreeFlight(six_02.solveForEccentricAnomalyFromMaxRange(e, psi), e, a, typeUsed)
+
+            self.assertAlmostEqual(float(row['Q_bo']), Q_bo, 12)
+            self.assertAlmostEqual(float(row['freeFlightAngle']), psi, 9)
+            self.assertTrue(math.isclose(float(row['freeFlightRange']),
+                                         psi * trig.degrees2radians * earth.getMeanEquatorialRadius(typeUsed), rel_tol=1e-9))
+            self.assertTrue(math.isclose(float(row['timeOfFlight']), timeOfFlight, rel_tol=1e-9))
+            self.assertTrue(math.isclose(float(row['icFPAError']), six_03.solveForInfluenceCoefficientFPAError(psi, fpa_bo), rel_tol=1e-9))
+            self.assertTrue(math.isclose(float(row['icBurnoutHeight']),
+                                         six_03.solveForInfluenceCoefficientBurnoutHeight(r_bo, v_bo, fpa_bo, psi, typeUsed), rel_tol=1e-9))
+            self.assertTrue(math.isclose(float(row['icBurnoutVelocity']),
+                                         six_03.solveForInfluenceCoefficientBurnoutVelocity(r_bo, v_bo, fpa_bo, psi, typeUsed), rel_tol=1e-9))
+
+        # the same trajectory in metric units flies for the same time, in seconds
+        canonical = dict(zip(header, lines[1].split(',')))
+        metric = dict(zip(header, lines[4].split(',')))
+        self.assertAlmostEqual(float(metric['freeFlightAngle']), float(canonical['freeFlightAngle']), 1)
+        self.assertGreater(float(metric['timeOfFlight']), 1000.0)
+
+        # at escape speed the free flight never comes back down
+        escape = dict(zip(header, lines[5].split(',')))
+        self.assertEqual(escape['timeOfFlight'], 'nan')
+
+    def test_NdjsonRoundTrip(self):
+        """
+        NDJSON in, NDJSON out, with the default units and null for results that do not exist.
+        """
+        records = [{'r_bo': 1.1, 'v_bo': 0.905, 'fpa_bo': 30.0}, {'r_bo': 1.1, 'v_bo': 2.0, 'fpa_bo': 30.0},
+                   {'r_bo': 1.0, 'v_bo': 1.0, 'fpa_bo': 0.0}]
+        inputStream = io.StringIO(''.join(json.dumps(record) + '\n' for record in records))
+        output = io.StringIO()
+
+        count = batch_evaluator.evaluateStream(inputStream, output, inputFormat='ndjson')
+        self.assertEqual(count, 3)
+
+        def rejectConstant(name):
+            raise ValueError("%s is not valid JSON" % name)
+
+        results = [json.loads(line, parse_constant=rejectConstant) for line in output.getvalue().splitlines()]
+        self.assertEqual(results[0]['units'], 'CANONICAL')
+        self.assertAlmostEqual(results[0]['Q_bo'], 0.905 * 0.905 * 1.1, 12)
+        self.assertIsNone(results[1]['timeOfFlight'])
+        # a circular orbit fired horizontally has infinite influence coefficients, written as null too
+        self.assertIsNone(results[2]['icFPAError'])
+        self.assertIsNone(results[2]['icBurnoutVelocity'])
+
+    def test_EmptyUnits(self):
+        """
+        An empty CSV units cell or a null NDJSON units field takes the default units, like a missing one.
+        """
+        csvInput = "r_bo,v_bo,fpa_bo,units\n1.1,0.905,30.0,\n7015.9595,7.15442,30.0,METRIC\n1.1,0.905,30.0, \n"
+        output = io.StringIO()
+        self.assertEqual(batch_evaluator.evaluateStream(io.StringIO(csvInput), output), 3)
+        lines = output.getvalue().splitlines()
+        header = lines[0].split(',')
+        rows = [dict(zip(header, line.split(','))) for line in lines[1:]]
+        self.assertEqual([row['units'] for row in rows], ['CANONICAL', 'METRIC', 'CANONICAL'])
+        self.assertAlmostEqual(float(rows[0]['Q_bo']), 0.905 * 0.905 * 1.1, 12)
+
+        records = [{'r_bo': 1.1, 'v_bo': 0.905, 'fpa_bo': 30.0, 'units': None},
+                   {'r_bo': 7015.9595, 'v_bo': 7.15442, 'fpa_bo': 30.0, 'units': 'metric'}]
+        output = io.StringIO()
+        inputStream = io.StringIO(''.join(json.dumps(record) + '\n' for record in records))
+        self.assertEqual(batch_evaluator.evaluateStream(inputStream, output, inputFormat='ndjson'), 2)
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([result['units'] for result in results], ['CANONICAL', 'metric'])
+        self.assertAlmostEqual(results[0]['Q_bo'], float(rows[0]['Q_bo']), 12)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(BatchEvaluatorTests('test_CsvMatchesScalarEquations'))
+    suite.addTest(BatchEvaluatorTests('test_NdjsonRoundTrip'))
+    suite.addTest(BatchEvaluatorTests('test_EmptyUnits'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
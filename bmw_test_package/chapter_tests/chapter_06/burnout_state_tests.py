@@ -0,0 +1,109 @@
+import io
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from bmw_test_package import batch_evaluator
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories import six_03_launching_errors_on_range_vectorized
+from six_ballisticMissileTrajectories.burnout_state import BurnoutStateArray
+
+
+class BurnoutStateTests(unittest.TestCase):
+    """
+    Structure of arrays burnout state container and its memory-mapped catalogs
+    """
+
+    r_bo = numpy.linspace(1.01, 1.1, 40)
+    v_bo = numpy.linspace(0.6, 1.05, 40)
+    fpa_bo = numpy.linspace(10.0, 60.0, 40)
+
+    def test_ViewsAndSolvers(self):
+        """
+        Slices and columns share the block, and the solvers take the states whatever they call the columns.
+        """
+        states = BurnoutStateArray.fromColumns(self.r_bo, self.v_bo, self.fpa_bo, ReturnType.CANONICAL)
+        self.assertEqual(len(states), 40)
+        self.assertTrue(states.getV().flags['C_CONTIGUOUS'])
+
+        part = states[10:20]
+        self.assertTrue(numpy.shares_memory(part.getFPA(), states.getValues()))
+        self.assertEqual(part[0], (self.r_bo[10], self.v_bo[10], self.fpa_bo[10]))
+        self.assertEqual(part.getReturnType(), ReturnType.CANONICAL)
+        self.assertEqual([len(chunk) for chunk in states.chunks(16)], [16, 16, 8])
+
+        six_02 = six_02_general_ballistic_missile_problem_vectorized
+        six_03 = six_03_launching_errors_on_range_vectorized
+        numpy.testing.assert_array_equal(states.apply(six_02.solveForTimeOfFreeFlightFromBurnout),
+                                         six_02.solveForTimeOfFreeFlightFromBurnout(self.r_bo, self.v_bo, self.fpa_bo,
+                                                                                    ReturnType.CANONICAL))
+        freeFlightAngle = states.apply(six_02.solveForFreeFlightAngleFromBurnout)
+        numpy.testing.assert_array_equal(states.apply(six_03.solveForInfluenceCoefficientBurnoutHeight, freelightRange=freeFlightAngle),
+                                         six_03.solveForInfluenceCoefficientBurnoutHeight(self.r_bo, self.v_bo, self.fpa_bo,
+                                                                                          freeFlightAngle, ReturnType.CANONICAL))
+        masked = part.apply(batch_evaluator.evaluateChunk, errors='mask')
+        self.assertEqual(masked['status'].shape, (10,))
+        with self.assertRaises(TypeError):
+            states.apply(six_02.solveForMaxRangeAngle)
+
+        # solvers with other parameter names are given the columns explicitly
+        Q_bo = states.apply(six_02.solveForNondimentionalParametericParameter621, columns={'v': 'v_bo', 'r': 'r_bo'})
+        numpy.testing.assert_array_equal(Q_bo, six_02.solveForNondimentionalParametericParameter621(self.v_bo, self.r_bo,
+                                                                                                     ReturnType.CANONICAL))
+        numpy.testing.assert_array_equal(states.apply(six_02.six21, columns={'v': 'v_bo', 'r': 'r_bo'},
+                                                      rtype=ReturnType.CANONICAL), Q_bo)
+        numpy.testing.assert_allclose(states.apply(six_02.solveForVelocity621, columns={'r': 'r_bo'}, q=Q_bo),
+                                      self.v_bo, rtol=1e-14)
+        with self.assertRaises(TypeError):
+            states.apply(six_02.solveForNondimentionalParametericParameter621)
+        with self.assertRaises(TypeError):
+            states.apply(six_02.solveForTimeOfFreeFlightFromBurnout, columns={'v': 'v_bo'})
+
+        # the unit metadata converts radii and velocities, not angles
+        metric = states.convertTo(ReturnType.METRIC)
+        self.assertEqual(metric.getReturnType(), ReturnType.METRIC)
+        numpy.testing.assert_allclose(metric.apply(six_02.solveForFreeFlightAngleFromBurnout), freeFlightAngle, rtol=1e-9)
+        numpy.testing.assert_array_equal(metric.getFPA(), self.fpa_bo)
+
+    def test_MemoryMappedCatalog(self):
+        """
+        A catalog written chunk by chunk is memory-mapped when opened and evaluated like the states in memory.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'catalog.npy')
+            created = BurnoutStateArray.create(path, 40, ReturnType.CANONICAL)
+            for start in range(0, 40, 16):
+                created.getValues()[:, start:start + 16] = numpy.stack((self.r_bo, self.v_bo, self.fpa_bo))[:, start:start + 16]
+            created.flush()
+            del created
+
+            catalog = BurnoutStateArray.open(path)
+            self.assertIsInstance(catalog.getValues(), numpy.memmap)
+            numpy.testing.assert_array_equal(catalog.getR(), self.r_bo)
+            with self.assertRaises(ValueError):
+                catalog.getR()[0] = 2.0
+
+            output = io.StringIO()
+            count = batch_evaluator.evaluateStream(catalog, output, 'npy', chunkSize=16)
+            self.assertEqual(count, 40)
+            expected = io.StringIO()
+            csvInput = "r_bo,v_bo,fpa_bo\n" + "".join("%r,%r,%r\n" % row for row in zip(self.r_bo.tolist(), self.v_bo.tolist(),
+                                                                                           self.fpa_bo.tolist()))
+            batch_evaluator.evaluateStream(io.StringIO(csvInput), expected, chunkSize=16)
+            self.assertEqual(output.getvalue(), expected.getvalue())
+            del catalog
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(BurnoutStateTests('test_ViewsAndSolvers'))
+    suite.addTest(BurnoutStateTests('test_MemoryMappedCatalog'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
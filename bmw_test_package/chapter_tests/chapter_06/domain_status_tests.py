@@ -0,0 +1,149 @@
+import collections
+import io
+import unittest
+
+import numpy
+
+from bmw_test_package import batch_evaluator
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import domain_status, six_02_inverse_range
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories import six_02_targeting, six_02_trajectory_ephemeris
+from six_ballisticMissileTrajectories import six_03_launching_errors_on_range_vectorized
+from six_ballisticMissileTrajectories.six_02_range_table import RangeTable
+from six_ballisticMissileTrajectories.six_02_time_of_flight_table import TimeOfFlightTable
+from six_ballisticMissileTrajectories.domain_status import Status
+from utilities import sweep_engine
+
+
+class DomainStatusTests(unittest.TestCase):
+    """
+    errors='mask' gives the values of the default mode plus a status code for every element
+    """
+
+    def assertMasked(self, function, *args):
+        # same values as errors='nan', and a status array of the values' shape that explains every NaN
+        expected = function(*args)
+        masked = function(*args, errors='mask')
+        self.assertIsInstance(masked, domain_status.MaskedResult)
+
+        values = masked.values if isinstance(masked.values, tuple) else (masked.values,)
+        for value, expectedValue in zip(values, expected if isinstance(expected, tuple) else (expected,)):
+            numpy.testing.assert_array_equal(value, expectedValue, err_msg=function.__name__)
+            self.assertEqual(masked.status.shape, numpy.shape(value))
+            self.assertTrue(numpy.all(masked.status[numpy.isnan(value)] >= Status.DEGENERATE), function.__name__)
+        return masked.status
+
+    def test_StatusCodes(self):
+        """
+        Clamped, degenerate and unreachable elements of the six_02 and six_03 array equations.
+        """
+        six_02 = six_02_general_ballistic_missile_problem_vectorized
+        six_03 = six_03_launching_errors_on_range_vectorized
+
+        Q_bo = numpy.linspace(0.01, 1.99, 199)
+        status = self.assertMasked(six_02.solveForFreeFlightAngleFromQ, Q_bo, 0.0)
+        self.assertGreater(numpy.count_nonzero(status == Status.CLAMPED), 0)
+        status = self.assertMasked(six_02.solveForFreeFlightAngleFromQ, [0.9, 1.0, 1.0], [30.0, 0.0, 30.0])
+        self.assertEqual(status.tolist(), [Status.OK, Status.DEGENERATE, Status.OK])
+
+        status = self.assertMasked(six_02.solveForFlightPathAngle, [90.0, 170.0, 90.0], [0.9, 0.9, 0.0])
+        self.assertEqual(status.tolist(), [Status.OK, Status.UNREACHABLE, Status.DEGENERATE])
+        status = self.assertMasked(six_02.solveForMaxRangeAngle, [0.5, 1.5, 2.0])
+        self.assertEqual(status.tolist(), [Status.OK, Status.UNREACHABLE, Status.DEGENERATE])
+        status = self.assertMasked(six_02.solveForTimeOfFreeFlightFromBurnout, 1.0, [0.9, 1.0, 1.5], [30.0, 0.0, 30.0],
+                                   ReturnType.CANONICAL)
+        self.assertEqual(status.tolist(), [Status.OK, Status.DEGENERATE, Status.UNREACHABLE])
+        self.assertMasked(six_02.solveForFreeFlightAngleFromBurnout, 1.1, [0.905, 1.2], 30.0, ReturnType.CANONICAL)
+        self.assertMasked(six_02.solveForEccentricAnomalyFromMaxRange, [0.5, 1.0], [60.0, 0.0])
+        self.assertMasked(six_02.solveForAnomalyOfEllipse, 1.0, [0.5, 0.0, 0.1], [1.2, 1.0, 2.0])
+
+        status = self.assertMasked(six_03.solveForDownRangeError, [0.9, 0.9, 0.0], [30.0, 0.0, 30.0])
+        self.assertEqual(status.tolist(), [Status.OK, Status.DEGENERATE, Status.DEGENERATE])
+        self.assertMasked(six_03.solveForCrossRangeErrorLateral, [30.0, 60.0], 0.01)
+        self.assertMasked(six_03.solveForCrossRangeErrorAzimuthal, [30.0, 60.0], 0.01)
+        self.assertMasked(six_03.solveForInfluenceCoefficientFPAError, 100.0, [30.0, 0.0])
+        self.assertMasked(six_03.solveForInfluenceCoefficientBurnoutHeight, 1.1, [0.905, 0.0], 30.0, 100.0, ReturnType.CANONICAL)
+        self.assertMasked(six_03.solveForInfluenceCoefficientBurnoutVelocity, 1.1, 0.905, [30.0, 0.0], 100.0, ReturnType.CANONICAL)
+        status = self.assertMasked(six_03.solveForInfluenceCoefficients, 1.0, numpy.sqrt(Q_bo), 1e-8, ReturnType.CANONICAL)
+        self.assertGreater(numpy.count_nonzero(status == Status.CLAMPED), 0)
+
+        status = self.assertMasked(six_02_inverse_range.solveForRequiredQ, [100.0, 170.0, 0.0, 100.0], [30.0, 5.0, 30.0, 95.0])
+        self.assertEqual(status.tolist(), [Status.OK, Status.OK, Status.DEGENERATE, Status.UNREACHABLE])
+        self.assertMasked(six_02_inverse_range.solveForBurnoutVelocity, [100.0, 0.0], 30.0, 1.05, ReturnType.CANONICAL)
+
+        with self.assertRaises(ValueError):
+            six_02.solveForMaxRangeAngle(0.5, errors='raise')
+
+    def test_BatchEntryPoints(self):
+        """
+        The chapter 6 batch entry points: orbit elements, tables, targeting and ephemerides.
+        """
+        six_02 = six_02_general_ballistic_missile_problem_vectorized
+        with numpy.errstate(all='raise'):
+            status = self.assertMasked(six_02.solveForSemiMajorAxis, 1.1, [0.9, 2.0, 2.5])
+        self.assertEqual(status.tolist(), [Status.OK, Status.DEGENERATE, Status.OK])
+        status = self.assertMasked(six_02.solveForTimeOfFreeFlight, 120.0, 0.5, [1.2, -1.2, 0.0], ReturnType.CANONICAL)
+        self.assertEqual(status.tolist(), [Status.OK, Status.UNREACHABLE, Status.UNREACHABLE])
+
+        rangeTable = RangeTable.build(qPoints=21, fpaPoints=19)
+        status = self.assertMasked(rangeTable.getFreeFlightAngle, [0.5, 1.9, 0.5], [30.0, 30.0, 0.5])
+        self.assertEqual(status.tolist(), [Status.OK, Status.UNREACHABLE, Status.UNREACHABLE])
+        timeOfFlightTable = TimeOfFlightTable.build(qPoints=21, fpaPoints=19)
+        status = self.assertMasked(timeOfFlightTable.getTimeOfFlight, [0.5, 1.9, -0.5], 30.0)
+        self.assertEqual(status.tolist(), [Status.OK, Status.UNREACHABLE, Status.UNREACHABLE])
+
+        solutions, status = six_02_targeting.solveForTargetingSolutions([90.0, 0.0, 150.0], 0.9, errors='mask')
+        self.assertEqual(status.tolist(), [Status.OK, Status.UNREACHABLE, Status.UNREACHABLE])
+        numpy.testing.assert_array_equal(solutions['reachable'], status == Status.OK)
+
+        ephemeris, status = six_02_trajectory_ephemeris.generateEphemeris(1.05, [0.8, 1.5], 30.0, ReturnType.CANONICAL,
+                                                                          samples=5, errors='mask')
+        self.assertEqual(status.tolist(), [Status.OK, Status.UNREACHABLE])
+        self.assertTrue(numpy.isnan(ephemeris['radius'][1]).all())
+
+    def test_CountsAndCombine(self):
+        status = domain_status.combine(numpy.array([0, 1, 3], dtype=numpy.uint8), numpy.array([2, 0, 1], dtype=numpy.uint8))
+        self.assertEqual(status.tolist(), [Status.DEGENERATE, Status.CLAMPED, Status.UNREACHABLE])
+        self.assertEqual(domain_status.countStatuses(status), {'ok': 0, 'clamped': 1, 'degenerate': 1, 'unreachable': 1})
+
+        # masked sweeps get a status output next to the values
+        grid = {'freeFlightRange': [30.0, 120.0, 170.0], 'Q_bo': [0.0, 0.5, 0.9]}
+        result = sweep_engine.sweep(six_02_general_ballistic_missile_problem_vectorized.solveForFlightPathAngle, grid,
+                                    {'errors': 'mask'})
+        self.assertEqual(result.getOutputNames(), ('output0', 'output1', 'status'))
+        self.assertEqual(result.getValues('status')[:, 0].tolist(), [Status.DEGENERATE] * 3)
+        self.assertEqual(result.getValues('status')[2, 2], Status.UNREACHABLE)
+
+    def test_BatchEvaluator(self):
+        """
+        The batch evaluator writes a status column and counts each status for the summary.
+        """
+        csvInput = "r_bo,v_bo,fpa_bo\n1.1,0.905,30.0\n1.0,1.0,0.0\n1.1,2.0,30.0\n1.05,0.9,45.0\n"
+        output = io.StringIO()
+        statusCounts = collections.Counter()
+        count = batch_evaluator.evaluateStream(io.StringIO(csvInput), output, errors='mask', statusCounts=statusCounts)
+        self.assertEqual(count, 4)
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0].split(',')[-1], 'status')
+        self.assertEqual([line.split(',')[-1] for line in lines[1:]], ['ok', 'degenerate', 'unreachable', 'ok'])
+        self.assertEqual(statusCounts, {'ok': 2, 'clamped': 0, 'degenerate': 1, 'unreachable': 1})
+
+        # the default mode has no status column
+        unmasked = batch_evaluator.evaluateChunk(numpy.array([1.1]), numpy.array([0.905]), numpy.array([30.0]), ReturnType.CANONICAL)
+        self.assertNotIn('status', unmasked)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(DomainStatusTests('test_StatusCodes'))
+    suite.addTest(DomainStatusTests('test_BatchEntryPoints'))
+    suite.addTest(DomainStatusTests('test_CountsAndCombine'))
+    suite.addTest(DomainStatusTests('test_BatchEvaluator'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import math
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+
+import numpy
+
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem, six_02_geodesy
+from six_ballisticMissileTrajectories.six_02_feasibility_matrix import buildFeasibilityMatrix, siteDtype, targetDtype
+
+
+class Six02FeasibilityMatrixTests(unittest.TestCase):
+    """
+    Launch site x target feasibility against the scalar equations, tiled and memory-mapped
+    """
+
+    def setUp(self):
+        generator = numpy.random.default_rng(14)
+        self.sites = numpy.zeros(9, dtype=siteDtype)
+        self.sites['lat'] = generator.uniform(-60.0, 60.0, 9)
+        self.sites['lon'] = generator.uniform(-180.0, 180.0, 9)
+        self.sites['r_bo'] = 1.05
+        self.sites['v_max'] = generator.uniform(0.7, 0.95, 9)
+        self.sites['v_max'][-1] = 0.05  # reaches nothing
+        self.targets = numpy.zeros(2000, dtype=targetDtype)
+        self.targets['lat'] = generator.uniform(-90.0, 90.0, 2000)
+        self.targets['lon'] = generator.uniform(-180.0, 180.0, 2000)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_MatchesScalarEquations(self):
+        """
+        Every field agrees with equations 6.2-1, 6.2-18, 6.2-20, 6.2-21 and 6.2-22 on the minimum-energy trajectory.
+        """
+        module = six_02_general_ballistic_missile_problem
+        canonical = ReturnType.CANONICAL
+        matrix = buildFeasibilityMatrix(self.sites, self.targets[:40], canonical)
+        self.assertEqual(matrix.shape, (9, 40))
+        self.assertTrue(matrix['reachable'].any())
+        self.assertFalse(matrix['reachable'][-1].any())
+
+        for i, site in enumerate(self.sites):
+            maxQ = module.solveForNondimentionalParametericParameter621(site['v_max'], site['r_bo'], canonical)
+            for j, target in enumerate(self.targets[:40]):
+                pair = matrix[i, j]
+                psi = float(six_02_geodesy.solveForFreeFlightAngleFromCoordinates(site['lat'], site['lon'],
+                                                                                  target['lat'], target['lon']))
+                Q = module.solveForRequiredQAtMaxRange(psi)
+                fpa = module.solveForMaxBurnoutFlightPathAngle(psi)
+                e = module.solveForEccentricity(Q, fpa)
+                capE = module.solveForEccentricAnomalyFromMaxRange(e, psi)
+                timeOfFlight = module.solveForTimeOfFreeFlight(capE, e, module.solveForSemiMajorAxis(site['r_bo'], Q), canonical)
+
+                self.assertAlmostEqual(pair['freeFlightRange'], psi, 10)
+                self.assertAlmostEqual(pair['requiredQ'], Q, 12)
+                self.assertAlmostEqual(pair['burnoutFPA'], fpa, 10)
+                self.assertTrue(math.isclose(pair['timeOfFlight'], timeOfFlight, rel_tol=1e-9))
+                self.assertEqual(pair['reachable'], Q <= maxQ)
+
+    def test_TilesIntoMemoryMap(self):
+        """
+        A small memory budget splits the table into row and column tiles without changing it, and bounds peak memory.
+        """
+        expected = buildFeasibilityMatrix(self.sites, self.targets, ReturnType.CANONICAL)
+        path = os.path.join(self.directory, 'feasibility.npy')
+
+        tracemalloc.start()
+        try:
+            buildFeasibilityMatrix(self.sites, self.targets, ReturnType.CANONICAL, path=path, memoryBudget=64 * 1024)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 2 * 64 * 1024)
+
+        matrix = numpy.load(path, mmap_mode='r')
+        self.assertEqual(matrix.shape, (9, 2000))
+        numpy.testing.assert_array_equal(matrix, expected)
+
+    def test_TopK(self):
+        """
+        Only the best k feasible targets of each site are kept, best first; a site that reaches nothing has none.
+        """
+        full = buildFeasibilityMatrix(self.sites, self.targets, ReturnType.CANONICAL)
+        best = buildFeasibilityMatrix(self.sites, self.targets, ReturnType.CANONICAL, memoryBudget=64 * 1024, topK=4,
+                                      rankBy='timeOfFlight')
+        self.assertEqual(best.shape, (9, 4))
+
+        for i in range(8):
+            key = numpy.where(full['reachable'][i], full['timeOfFlight'][i], numpy.inf)
+            numpy.testing.assert_array_equal(best['target'][i], numpy.argsort(key, kind='stable')[:4])
+            numpy.testing.assert_array_equal(best['timeOfFlight'][i], full['timeOfFlight'][i][best['target'][i]])
+        numpy.testing.assert_array_equal(best['target'][-1], -1)
+        self.assertTrue(numpy.isnan(best['requiredQ'][-1]).all())
+
+        with self.assertRaises(ValueError):
+            buildFeasibilityMatrix(self.sites, self.targets, ReturnType.CANONICAL, topK=4, rankBy='reachable')
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(Six02FeasibilityMatrixTests('test_MatchesScalarEquations'))
+    suite.addTest(Six02FeasibilityMatrixTests('test_TilesIntoMemoryMap'))
+    suite.addTest(Six02FeasibilityMatrixTests('test_TopK'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import math
+import unittest
+
+import numpy
+
+from six_ballisticMissileTrajectories import six_02_geodesy
+from six_ballisticMissileTrajectories.six_02_targeting import solveForTargetingSolutions
+
+
+class Six02GeodesyTests(unittest.TestCase):
+    """
+    Free-flight range angle and launch azimuth from burnout and re-entry coordinates
+    """
+
+    def test_BookProblemAndAzimuths(self):
+        """
+        Problem on pg. 291 (1st ed): 30N 60E to 30S 60W is 128.68 degrees, along with azimuths whose answer is known.
+        """
+        psi = six_02_geodesy.solveForFreeFlightAngleFromCoordinates(30.0, 60.0, -30.0, -60.0)
+        self.assertAlmostEqual(psi, math.acos(-0.625) * 180.0 / math.pi, 12)
+
+        psi, azimuth = six_02_geodesy.solveForRangeAndAzimuth([0.0, 0.0, 0.0, 0.0, 45.0], [0.0, 0.0, 0.0, 0.0, 10.0],
+                                                              [0.0, 10.0, 0.0, -10.0, 45.0], [90.0, 0.0, -90.0, 0.0, 10.0])
+        numpy.testing.assert_allclose(psi, [90.0, 10.0, 90.0, 10.0, 0.0], atol=1e-12)
+        numpy.testing.assert_allclose(azimuth, [90.0, 0.0, 270.0, 180.0, 0.0], atol=1e-12)
+
+    def test_ShortAndAntipodalRanges(self):
+        """
+        Ranges keep their precision at both ends, where acos of cos(psi) does not.
+        """
+        # 1e-7 degrees along the equator and along a meridian
+        psi = six_02_geodesy.solveForFreeFlightAngleFromCoordinates(0.0, [0.0, 5.0], [0.0, 1e-7], [1e-7, 5.0])
+        numpy.testing.assert_allclose(psi, 1e-7, rtol=1e-8)
+
+        # 1e-7 degrees short of antipodal
+        psi = six_02_geodesy.solveForFreeFlightAngleFromCoordinates(10.0, 20.0, -10.0 + 1e-7, -160.0)
+        self.assertAlmostEqual(180.0 - psi, 1e-7, 12)
+        self.assertEqual(six_02_geodesy.solveForFreeFlightAngleFromCoordinates(10.0, 20.0, -10.0, -160.0), 180.0)
+
+    def test_MatrixFeedsTargeting(self):
+        """
+        Every site against every aim point matches the broadcast pairwise solution and goes straight into targeting.
+        """
+        generator = numpy.random.default_rng(13)
+        siteLat, siteLon = generator.uniform(-90.0, 90.0, 7), generator.uniform(-180.0, 180.0, 7)
+        aimLat, aimLon = generator.uniform(-90.0, 90.0, 5000), generator.uniform(-180.0, 180.0, 5000)
+
+        psi, azimuth = six_02_geodesy.solveForRangeAndAzimuthMatrix(siteLat, siteLon, aimLat, aimLon)
+        expectedPsi, expectedAzimuth = six_02_geodesy.solveForRangeAndAzimuth(siteLat[:, None], siteLon[:, None], aimLat, aimLon)
+        self.assertEqual(psi.shape, (7, 5000))
+        numpy.testing.assert_allclose(psi, expectedPsi, rtol=0.0, atol=1e-10)
+        numpy.testing.assert_allclose(azimuth, expectedAzimuth, rtol=0.0, atol=1e-9)
+
+        out = (numpy.empty((7, 5000)), numpy.empty((7, 5000)))
+        self.assertIs(six_02_geodesy.solveForRangeAndAzimuthMatrix(siteLat, siteLon, aimLat, aimLon, out=out)[0], out[0])
+        with self.assertRaises(ValueError):
+            six_02_geodesy.solveForRangeAndAzimuthMatrix(siteLat, siteLon[:3], aimLat, aimLon)
+
+        solutions = solveForTargetingSolutions(psi, 0.9)
+        self.assertEqual(solutions.shape, psi.shape)
+        numpy.testing.assert_array_equal(solutions['freeFlightRange'], psi)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(Six02GeodesyTests('test_BookProblemAndAzimuths'))
+    suite.addTest(Six02GeodesyTests('test_ShortAndAntipodalRanges'))
+    suite.addTest(Six02GeodesyTests('test_MatrixFeedsTargeting'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+
+import numpy
+
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import domain_status, six_02_general_ballistic_missile_problem
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories import six_02_inverse_range
+
+
+class Six02InverseRangeTests(unittest.TestCase):
+    """
+    Burnout Q and velocity from the free-flight range angle, flight path angle and radius
+    """
+
+    def test_BookProblem(self):
+        """
+        Problem on pg. 305 (1st ed) run backwards: the range of r = 1.1, v = 0.905, FPA = 30 gives back v = 0.905.
+        """
+        module = six_02_general_ballistic_missile_problem
+        canonical = ReturnType.CANONICAL
+        Q_bo = module.solveForNondimentionalParametericParameter621(0.905, 1.1, canonical)
+        psi = module.solveForFreeFlightAngleFromQ(Q_bo, 30.0)
+
+        for refine in (False, True):
+            solvedQ, v_bo = six_02_inverse_range.solveForBurnoutVelocity(psi, 30.0, 1.1, canonical, refine=refine)
+            self.assertAlmostEqual(float(solvedQ), Q_bo, 12)
+            self.assertAlmostEqual(float(v_bo), 0.905, 12)
+
+        # the minimum-energy trajectory of equations 6.2-18 and 6.2-20
+        psi = numpy.array([10.0, 90.0, 132.9, 179.0])
+        numpy.testing.assert_allclose(six_02_inverse_range.solveForRequiredQ(psi, module.solveForMaxBurnoutFlightPathAngle(psi)),
+                                      [module.solveForRequiredQAtMaxRange(angle) for angle in psi], rtol=1e-12)
+
+    def test_RoundTripAndMasks(self):
+        """
+        The refined Q gives back the requested range through equation 6.2-12; unreachable elements are NaN.
+        """
+        rng = numpy.random.default_rng(21)
+        psi = rng.uniform(0.5, 350.0, 20000)
+        fpa = rng.uniform(0.5, 89.5, 20000)
+
+        closedForm = six_02_inverse_range.solveForRequiredQ(psi, fpa)
+        refined = six_02_inverse_range.solveForRequiredQRefined(psi, fpa)
+        reachable = numpy.isfinite(closedForm)
+        self.assertTrue(0.2 < reachable.mean() < 0.8)
+        numpy.testing.assert_array_equal(numpy.isfinite(refined), reachable)
+
+        reached = six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ(refined, fpa)
+        numpy.testing.assert_allclose(reached[reachable], psi[reachable], rtol=0.0, atol=1e-6)
+        numpy.testing.assert_allclose(refined[reachable], closedForm[reachable], rtol=1e-7)
+
+        # out of the domain
+        Q_bo = six_02_inverse_range.solveForRequiredQRefined([0.0, 360.0, 90.0, 90.0, 170.0], [30.0, 30.0, 0.0, 90.0, 85.0])
+        self.assertTrue(numpy.isnan(Q_bo).all())
+
+    def test_ShortRanges(self):
+        """
+        Where equation 6.2-12 cannot resolve the tolerance, the refined Q is as accurate as the exact closed form.
+        """
+        psi, fpa = numpy.meshgrid(numpy.logspace(-6.0, 0.0, 13), [5.0, 30.0, 60.0, 85.0], indexing='ij')
+        closedForm = six_02_inverse_range.solveForRequiredQ(psi, fpa)
+
+        refined = six_02_inverse_range.solveForRequiredQRefined(psi, fpa)
+        numpy.testing.assert_allclose(refined, closedForm, rtol=1e-13)
+        warm = six_02_inverse_range.solveForRequiredQRefined(psi, fpa, initialQ=1.5)
+        numpy.testing.assert_allclose(warm, closedForm, rtol=1e-13)
+
+    def test_NearHorizontalLongRanges(self):
+        """
+        Near horizontal burnouts close to psi = 270 are reachable; where the iteration does not converge the
+        closed form is kept instead of reporting them unreachable.
+        """
+        psi, fpa = 269.4691256462103, 0.03060142544268514
+        closedForm = six_02_inverse_range.solveForRequiredQ(psi, fpa)
+        self.assertAlmostEqual(float(closedForm), 1.00052974, 8)
+
+        self.assertEqual(float(six_02_inverse_range.solveForRequiredQRefined(psi, fpa)), float(closedForm))
+        (Q_bo, v_bo), status = six_02_inverse_range.solveForBurnoutVelocity(psi, fpa, 1.05, ReturnType.CANONICAL,
+                                                                           errors='mask')
+        self.assertEqual(int(status), domain_status.Status.OK)
+        self.assertAlmostEqual(float(Q_bo), float(closedForm), 12)
+        self.assertTrue(numpy.isfinite(v_bo))
+
+    def test_WarmStart(self):
+        """
+        Any starting Q in (0, 2), e.g. the solution at the neighbouring grid point, converges to the same root.
+        """
+        psi, fpa = numpy.meshgrid(numpy.linspace(10.0, 170.0, 33), numpy.linspace(5.0, 60.0, 12), indexing='ij')
+        r_bo = 1.05
+        Q_bo, v_bo = six_02_inverse_range.solveForBurnoutVelocity(psi, fpa, r_bo, ReturnType.CANONICAL)
+        self.assertEqual(v_bo.shape, psi.shape)
+
+        neighbour = numpy.roll(Q_bo, 1, axis=0)
+        warm, _ = six_02_inverse_range.solveForBurnoutVelocity(psi, fpa, r_bo, ReturnType.CANONICAL, initialQ=neighbour)
+        numpy.testing.assert_allclose(warm, Q_bo, rtol=1e-9, equal_nan=True)
+
+        cold = six_02_inverse_range.solveForRequiredQRefined(psi, fpa, initialQ=1.999)
+        numpy.testing.assert_allclose(cold, Q_bo, rtol=1e-9, equal_nan=True)
+
+        # without iterations every element keeps the closed form
+        numpy.testing.assert_array_equal(six_02_inverse_range.solveForRequiredQRefined(psi, fpa, maxIterations=0),
+                                         six_02_inverse_range.solveForRequiredQ(psi, fpa))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(Six02InverseRangeTests('test_BookProblem'))
+    suite.addTest(Six02InverseRangeTests('test_RoundTripAndMasks'))
+    suite.addTest(Six02InverseRangeTests('test_ShortRanges'))
+    suite.addTest(Six02InverseRangeTests('test_NearHorizontalLongRanges'))
+    suite.addTest(Six02InverseRangeTests('test_WarmStart'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,65 +1,91 @@
+import argparse
+import os
+import sys
+
 import numpy
-import pandas as pd
-import matplotlib.pyplot as plt
 
-from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized, \
+    six_03_launching_errors_on_range_vectorized
+from utilities.sweep_engine import sweep
 
 
-def maxRangePlot():
+def maxRangePlot(path: str = None, cacheDirectory: str = None):
     """
-    This is a proof of the max range plot (figure 6.2-6 Range vs. \u03F4 :sub: `bo` )
+    This is a proof of the max range plot (figure 6.2-6 Range vs. ϴ :sub: `bo` )
+    Args:
+        path (str): PNG / SVG file to write the chart to without a display; shown in a window if not given
+        cacheDirectory (str): sweep cache, see `utilities.sweep_engine`
     """
     print("This is a reproduction of the Figure 6.2-6 - 1st ed")
 
-    dot3 = []
-    dot4 = []
-    dot5 = []
-    dot6 = []
-    dot7 = []
-    dot75 = []
-    dot8 = []
-    dot85 = []
-    dot9 = []
-    dot95 = []
-    onedot0 = []
-
+    qSweep = [0.3, 0.4, 0.5, 0.6, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 1.0]
     fpaSweep = numpy.arange(0, 90.5, 0.5)
 
-    for fpa in fpaSweep:
-        # print(fpa)
-
-        dot3.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(0.3, fpa))
-        dot4.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(0.4, fpa))
-        dot5.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(0.5, fpa))
-        dot6.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(0.6, fpa))
-        dot7.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(0.7, fpa))
-        dot75.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(0.75, fpa))
-        dot8.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(0.8, fpa))
-        dot85.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(0.85, fpa))
-        dot9.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(0.9, fpa))
-        dot95.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(0.95, fpa))
-        onedot0.append(six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(1.0, fpa))
-
-    datacolumns = {"Q_bo = 0.3": dot3,
-                   "Q_bo = 0.4": dot4,
-                   "Q_bo = 0.5": dot5,
-                   "Q_bo = 0.6": dot6,
-                   "Q_bo = 0.7": dot7,
-                   "Q_bo = 0.75": dot75,
-                   "Q_bo = 0.8": dot8,
-                   "Q_bo = 0.85": dot85,
-                   "Q_bo = 0.9": dot9,
-                   "Q_bo = 0.95": dot95,
-                   "Q_bo = 1.0": onedot0}
-
-    # Create data frame with predone column names
-    df = pd.DataFrame(datacolumns, index=fpaSweep)
+    # one broadcast call over the whole (Q, FPA) grid instead of a scalar call per point
+    result = sweep(six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ,
+                   {'Q_bo': qSweep, 'FPA_bo': fpaSweep}, cacheDirectory=cacheDirectory)
+
+    if path is not None:
+        result.savePlot(path, x='FPA_bo', title="Figure 6.2-6", ylabel="free-flight range angle (degrees)")
+        return
 
+    import matplotlib.pyplot as plt
+
+    df = result.toDataFrame(x='FPA_bo')
     df.plot()
     plt.grid(True)
 
     plt.show()
 
 
+def influenceCoefficientPlot(path: str, cacheDirectory: str = None):
+    """
+    The down-range influence coefficient of the burnout flight path angle (equation 6.3-13) against the
+    free-flight range angle, one curve per burnout flight path angle
+    """
+    result = sweep(six_03_launching_errors_on_range_vectorized.solveForInfluenceCoefficientFPAError,
+                   {'fpa_bo': [10.0, 20.0, 30.0, 40.0, 50.0], 'freeFlightRange': numpy.arange(1.0, 180.0, 0.5)},
+                   cacheDirectory=cacheDirectory)
+    result.savePlot(path, x='freeFlightRange', title="Equation 6.3-13", ylabel="d psi / d fpa_bo")
+
+
+def timeOfFlightPlot(path: str, cacheDirectory: str = None):
+    """
+    Free-flight time on the maximum range trajectory (equations 6.2-20 to 6.2-22) against the free-flight range
+    angle, one curve per burnout radius (canonical units)
+    """
+    def maximumRangeTimeOfFlight(r_bo, freeFlightRange, returntype):
+        six_02 = six_02_general_ballistic_missile_problem_vectorized
+        Q_bo = six_02.solveForRequiredQAtMaxRange(freeFlightRange)
+        fpa_bo = six_02.solveForMaxBurnoutFlightPathAngle(freeFlightRange)
+        e = six_02.solveForEccentricity(Q_bo, fpa_bo)
+        capE = six_02.solveForEccentricAnomalyFromMaxRange(e, freeFlightRange)
+        return six_02.solveForTimeOfFreeFlight(capE, e, six_02.solveForSemiMajorAxis(r_bo, Q_bo), returntype)
+
+    result = sweep(maximumRangeTimeOfFlight, {'r_bo': [1.01, 1.05, 1.1], 'freeFlightRange': numpy.arange(1.0, 180.0, 0.5)},
+                   fixed={'returntype': ReturnType.CANONICAL}, cacheDirectory=cacheDirectory)
+    result.savePlot(path, x='freeFlightRange', title="Time of free flight at maximum range", ylabel="TOF (TU)")
+
+
+def main(argv=None) -> int:
+    """
+    Writes every chapter 6 design chart to a directory, headless
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('directory', help="where the charts are written")
+    parser.add_argument('--format', default='svg', help="png, svg, pdf, ...")
+    parser.add_argument('--cache', default=None, help="sweep cache directory")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.directory, exist_ok=True)
+    for name, chart in (('range_vs_fpa', maxRangePlot), ('tof_vs_range', timeOfFlightPlot),
+                        ('fpa_influence_vs_range', influenceCoefficientPlot)):
+        chart(os.path.join(args.directory, '%s.%s' % (name, args.format)), cacheDirectory=args.cache)
+    return 0
+
+
 if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        sys.exit(main())
     maxRangePlot()
@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories.six_02_range_table import RangeTable
+
+
+class Six02RangeTableTests(unittest.TestCase):
+    """
+    Interpolated free-flight angle table against the exact equation 6.2-12
+    """
+
+    def test_ErrorBound(self):
+        """
+        Random queries inside of the table stay within the error bound measured when it was built.
+        """
+        table = RangeTable.build(qPoints=201, fpaPoints=181, qMax=0.95, fpaMin=2.0)
+
+        generator = numpy.random.default_rng(6212)
+        Q_bo = generator.uniform(0.0, 0.95, 20000)
+        FPA_bo = generator.uniform(2.0, 90.0, 20000)
+        exact = six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ(Q_bo, FPA_bo)
+
+        for method in ('bilinear', 'bicubic'):
+            maxError = table.getMaxError(method)
+            self.assertLess(maxError, 0.5, method)
+
+            error = numpy.abs(table.getFreeFlightAngle(Q_bo, FPA_bo, method) - exact)
+            self.assertLessEqual(error.max(), maxError, method)
+
+        # queries outside of the table are not extrapolated
+        self.assertTrue(numpy.isnan(table.getFreeFlightAngle(1.5, 30.0)))
+
+    def test_DefaultDomain(self):
+        """
+        The default table leaves out the jump of psi at Q = 1, FPA = 0, so its bound is meaningful.
+        """
+        table = RangeTable.build()
+        self.assertLess(table.getMaxError('bilinear'), 1.0)
+        self.assertLess(table.getMaxError('bicubic'), 0.5)
+
+        generator = numpy.random.default_rng(6213)
+        Q_bo = generator.uniform(0.0, 1.8, 20000)
+        FPA_bo = generator.uniform(1.0, 90.0, 20000)
+        exact = six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ(Q_bo, FPA_bo)
+        for method in ('bilinear', 'bicubic'):
+            error = numpy.abs(table.getFreeFlightAngle(Q_bo, FPA_bo, method) - exact)
+            self.assertLessEqual(error.max(), table.getMaxError(method), method)
+
+    def test_SaveAndMemoryMap(self):
+        """
+        A saved table is memory-mapped on load and answers exactly like the table that was built.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'range_table.npy')
+
+            built = RangeTable.loadOrBuild(path, qPoints=51, fpaPoints=46)
+            self.assertTrue(os.path.exists(path + '.json'))
+
+            loaded = RangeTable.load(path)
+            self.assertIsInstance(loaded.getValues(), numpy.memmap)
+            self.assertEqual(loaded.getMaxError('bicubic'), built.getMaxError('bicubic'))
+
+            Q_bo = numpy.linspace(0.1, 1.7, 7)
+            numpy.testing.assert_array_equal(loaded.getFreeFlightAngle(Q_bo, 35.0, 'bicubic'),
+                                             built.getFreeFlightAngle(Q_bo, 35.0, 'bicubic'))
+            del built, loaded
+
+    def test_RebuildOnChange(self):
+        """
+        A saved table is reused for the same build arguments and rebuilt for others or from an older format.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'range_table.npy')
+            RangeTable.loadOrBuild(path, qPoints=51, fpaPoints=46)
+            modified = os.stat(path).st_mtime_ns
+            os.utime(path, ns=(modified - 10**9, modified - 10**9))
+
+            # the same arguments, given or defaulted, reuse the file
+            same = RangeTable.loadOrBuild(path, fpaPoints=46, qPoints=51, fpaMin=1.0)
+            self.assertEqual(os.stat(path).st_mtime_ns, modified - 10**9)
+            self.assertEqual(same.getValues().shape, (51, 46))
+
+            finer = RangeTable.loadOrBuild(path, qPoints=61, fpaPoints=46)
+            self.assertEqual(finer.getValues().shape, (61, 46))
+
+            # a table saved before the build arguments were recorded, e.g. with the old defaults down to FPA = 0
+            with open(path + '.json') as metadataFile:
+                metadata = json.load(metadataFile)
+            del metadata['version'], metadata['build']
+            metadata['yMin'] = 0.0
+            with open(path + '.json', 'w') as metadataFile:
+                json.dump(metadata, metadataFile)
+            rebuilt = RangeTable.loadOrBuild(path, qPoints=61, fpaPoints=46)
+            with open(path + '.json') as metadataFile:
+                metadata = json.load(metadataFile)
+            self.assertEqual((metadata['version'], metadata['yMin']), (RangeTable.formatVersion, 1.0))
+            self.assertEqual(rebuilt.getMaxError('bicubic'), finer.getMaxError('bicubic'))
+            del same, finer, rebuilt
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(Six02RangeTableTests('test_ErrorBound'))
+    suite.addTest(Six02RangeTableTests('test_DefaultDomain'))
+    suite.addTest(Six02RangeTableTests('test_SaveAndMemoryMap'))
+    suite.addTest(Six02RangeTableTests('test_RebuildOnChange'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+
+import numpy
+
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem
+from six_ballisticMissileTrajectories.six_02_targeting import solveForTargetingSolutions
+
+
+class Six02TargetingTests(unittest.TestCase):
+    """
+    Batch targeting against the scalar equations 6.2-16, 6.2-18 and 6.2-20
+    """
+
+    def test_MinimumEnergyTargets(self):
+        """
+        Problem on pg. 295 (1st ed): an 8000 nm target needs Q = 0.957, along with a sweep of other ranges.
+        """
+        module = six_02_general_ballistic_missile_problem
+        freeFlightRange = numpy.array([132.9, 10.0, 90.0, 179.0])
+
+        solutions = solveForTargetingSolutions(freeFlightRange)
+        self.assertTrue(solutions['reachable'].all())
+        self.assertAlmostEqual(solutions['minimumEnergyQ'][0], 0.957, 2)
+
+        for solution in solutions:
+            psi = float(solution['freeFlightRange'])
+            self.assertAlmostEqual(solution['minimumEnergyQ'], module.solveForRequiredQAtMaxRange(psi), 12)
+            self.assertAlmostEqual(solution['lowFPA'], module.solveForMaxBurnoutFlightPathAngle(psi), 12)
+            self.assertEqual(solution['lowFPA'], solution['highFPA'])
+
+        # flying the minimum-energy Q explicitly lands on the same single trajectory
+        explicit = solveForTargetingSolutions(freeFlightRange, solutions['minimumEnergyQ'])
+        numpy.testing.assert_allclose(explicit['highFPA'], solutions['maxRangeFPA'], atol=1e-5)
+
+    def test_ReachabilityMask(self):
+        """
+        Problem on pg. 244 (2nd ed) plus targets that the available Q cannot reach.
+        """
+        module = six_02_general_ballistic_missile_problem
+        freeFlightRange = numpy.array([104.4775, 60.0, 170.0, 0.0])
+        Q_bo = numpy.array([1.1933, 0.9, 0.9, 0.9])
+
+        solutions = solveForTargetingSolutions(freeFlightRange, Q_bo)
+        numpy.testing.assert_array_equal(solutions['reachable'], [True, True, False, False])
+        self.assertAlmostEqual(solutions['highFPA'][0], 47.9776, delta=0.5)
+        self.assertTrue(numpy.isnan(solutions['lowFPA'][2]))
+
+        # escape trajectories never come back down, and a low trajectory below the horizontal is dropped
+        escapes = solveForTargetingSolutions([30.0, 90.0, 170.0], [2.0, 2.5, 3.0])
+        self.assertFalse(escapes['reachable'].any())
+        self.assertTrue(numpy.isnan(escapes['lowFPA']).all())
+        fast = solveForTargetingSolutions(30.0, 1.2)
+        self.assertTrue(fast['reachable'])
+        self.assertTrue(numpy.isnan(fast['lowFPA']))
+        self.assertGreater(fast['highFPA'], 0.0)
+
+        # beyond psi = 180 the minimum energy trajectory would start below the horizontal; a faster one need not
+        beyond = solveForTargetingSolutions([180.0, 200.0, 250.0])
+        numpy.testing.assert_array_equal(beyond['reachable'], [True, False, False])
+        numpy.testing.assert_array_equal(beyond['maxRangeFPA'], [0.0, -5.0, -17.5])
+        self.assertTrue(numpy.isnan(beyond['highFPA'][1:]).all())
+        faster = solveForTargetingSolutions([200.0, 250.0], 1.5)
+        self.assertTrue(faster['reachable'].all())
+        self.assertTrue((faster['highFPA'] > 0.0).all())
+
+        for solution in solutions[solutions['reachable']]:
+            lowFPA, highFPA = module.solveForFlightPathAngle(float(solution['freeFlightRange']), float(solution['Q_bo']))
+            if lowFPA >= 0.0:
+                self.assertAlmostEqual(solution['lowFPA'], lowFPA, 9)
+            else:
+                self.assertTrue(numpy.isnan(solution['lowFPA']))
+            self.assertAlmostEqual(solution['highFPA'], highFPA, 9)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(Six02TargetingTests('test_MinimumEnergyTargets'))
+    suite.addTest(Six02TargetingTests('test_ReachabilityMask'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
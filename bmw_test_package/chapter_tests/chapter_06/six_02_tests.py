@@ -4,7 +4,7 @@ import unittest
 from constants import earth, trig, conversions
 from constants.earth import ReturnType
 from one_twoBodyOrbitalMecanics import one_04_constants_of_the_motion
-from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem, six_02_geodesy
 
 
 class Six02Tests(unittest.TestCase):
@@ -118,6 +118,8 @@ class Six02Tests(unittest.TestCase):
 
         freeFlightAngle = math.acos(cosFreeFlightAngle) * trig.radians2degrees
         # should be 128.68218745
+        self.assertAlmostEqual(six_02_geodesy.solveForFreeFlightAngleFromCoordinates(lat_bo, lon_bo, lat_re, lon_re),
+                               freeFlightAngle, 10, "Wrong freeFlightAngle from coordinates")
 
         # find flight path angles
         fpa_bo = six_02_general_ballistic_missile_problem.solveForFlightPathAngle(freeFlightAngle, Q_bo)
@@ -394,6 +396,30 @@ class Six02Tests(unittest.TestCase):
         print("Velocity at burnout:> %.4f km/s" % v_bo)
         print()
 
+    def test_AnomalyOfEllipse(self):
+        """
+        Equation 6.2-6 solved for the true anomaly: the angle whose cosine is (p - r) / (e r).
+
+        Checked at the ends of the latus rectum and the apsides of an ellipse, and at burnout for the example
+        problem starting on page 290, where it must agree with equation 6.2-7.
+        """
+        module = six_02_general_ballistic_missile_problem
+
+        self.assertAlmostEqual(module.solveForAnomalyOfEllipse(1.0, 0.5, 1.0), 90.0, 12)
+        self.assertEqual(module.solveForAnomalyOfEllipse(1.5, 0.5, 1.0), 0.0)
+        self.assertAlmostEqual(module.solveForAnomalyOfEllipse(1.0, 0.5, 2.0), 180.0, 12)
+        self.assertAlmostEqual(module.solveForAnomalyOfEllipse(1.0, 0.5, 0.8), 60.0, 12)
+
+        typeUsed = ReturnType.CANONICAL
+        r_bo = earth.getMeanEquatorialRadius(typeUsed) + 1.0/5.0
+        fpa_bo = 51.31781255
+        Q_bo = module.solveForNondimentionalParametericParameter621(2.0/3.0, r_bo, typeUsed)
+        p = r_bo * Q_bo * math.cos(fpa_bo * trig.degrees2radians)**2
+        e = module.solveForEccentricity(Q_bo, fpa_bo)
+        v_bo = module.solveForAnomalyOfEllipse(p, e, r_bo)
+        self.assertAlmostEqual(v_bo, 180.0 - module.solveForFreeFlightAngleFromQ(Q_bo, fpa_bo)/2.0, 9)
+        self.assertAlmostEqual(v_bo, 161.8, 1, "Wrong anomaly at burnout")
+
 
 def suite():
     suite = unittest.TestSuite()
@@ -407,6 +433,7 @@ def suite():
     suite.addTest(Six02Tests('test_GeneralBallisticMissileProblem6'))
     suite.addTest(Six02Tests('test_GeneralBallisticMissileProblem7'))
     suite.addTest(Six02Tests('test_GeneralBallisticMissileProblem8'))
+    suite.addTest(Six02Tests('test_AnomalyOfEllipse'))
 
     return suite
 
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from bmw_test_package import batch_evaluator
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories.six_02_range_table import RangeTable
+from six_ballisticMissileTrajectories.six_02_time_of_flight_table import TimeOfFlightTable
+
+
+class Six02TimeOfFlightTableTests(unittest.TestCase):
+    """
+    Interpolated time of free flight table against the exact equations 6.2-21 and 6.2-22
+    """
+
+    def test_ErrorBound(self):
+        """
+        Random queries in metric units stay within the error bound measured when the table was built.
+        """
+        typeUsed = ReturnType.METRIC
+        table = TimeOfFlightTable.build(qPoints=181, fpaPoints=177, qMax=1.6, fpaMin=2.0)
+
+        generator = numpy.random.default_rng(6222)
+        r_bo = generator.uniform(6500.0, 7000.0, 20000)
+        Q_bo = generator.uniform(0.0, 1.6, 20000)
+        FPA_bo = generator.uniform(2.0, 90.0, 20000)
+        v_bo = six_02_general_ballistic_missile_problem_vectorized.solveForVelocity621(Q_bo, r_bo, typeUsed)
+        exact = six_02_general_ballistic_missile_problem_vectorized.solveForTimeOfFreeFlightFromBurnout(r_bo, v_bo, FPA_bo, typeUsed)
+
+        for method in ('bilinear', 'bicubic'):
+            maxError = table.getMaxTimeOfFlightError(r_bo, typeUsed, method)
+            # under a minute on flights of up to a few hours
+            self.assertLess(maxError.max(), 60.0, method)
+
+            error = numpy.abs(table.getTimeOfFlight(Q_bo, FPA_bo, r_bo, typeUsed, method) - exact)
+            self.assertTrue(numpy.all(error <= maxError), method)
+
+        # queries outside of the table are not extrapolated
+        self.assertTrue(numpy.isnan(table.getTimeOfFlight(1.9, 30.0)))
+
+    def test_SaveAndMemoryMap(self):
+        """
+        A saved table is memory-mapped on load, answers like the table that was built and is not taken for a range table.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'time_of_flight_table.npy')
+
+            built = TimeOfFlightTable.loadOrBuild(path, qPoints=46, fpaPoints=46)
+            loaded = TimeOfFlightTable.load(path)
+            self.assertIsInstance(loaded.getValues(), numpy.memmap)
+            self.assertEqual(loaded.getMaxError('bicubic'), built.getMaxError('bicubic'))
+
+            Q_bo = numpy.linspace(0.1, 1.7, 7)
+            numpy.testing.assert_array_equal(loaded.getTimeOfFlight(Q_bo, 35.0, 1.05, method='bicubic'),
+                                             built.getTimeOfFlight(Q_bo, 35.0, 1.05, method='bicubic'))
+
+            with self.assertRaises(ValueError):
+                RangeTable.load(path)
+
+            # other build arguments rebuild the saved table
+            coarser = TimeOfFlightTable.loadOrBuild(path, qPoints=31, fpaPoints=46)
+            self.assertEqual(coarser.getValues().shape, (31, 46))
+            self.assertEqual(TimeOfFlightTable.load(path).getValues().shape, (31, 46))
+            del built, loaded, coarser
+
+    def test_BatchEvaluator(self):
+        """
+        The batch evaluator answers from the table within its bound, and solves exactly without one.
+        """
+        r_bo = numpy.linspace(1.01, 1.1, 50)
+        v_bo = numpy.linspace(0.5, 1.1, 50)
+        fpa_bo = numpy.linspace(5.0, 80.0, 50)
+        table = TimeOfFlightTable.build(qPoints=91, fpaPoints=91, fpaMin=2.0)
+
+        exact = batch_evaluator.evaluateChunk(r_bo, v_bo, fpa_bo, ReturnType.CANONICAL)
+        interpolated = batch_evaluator.evaluateChunk(r_bo, v_bo, fpa_bo, ReturnType.CANONICAL, table)
+
+        numpy.testing.assert_array_equal(exact['timeOfFlight'], six_02_general_ballistic_missile_problem_vectorized.
+                                         solveForTimeOfFreeFlightFromBurnout(r_bo, v_bo, fpa_bo, ReturnType.CANONICAL))
+        error = numpy.abs(interpolated['timeOfFlight'] - exact['timeOfFlight'])
+        self.assertTrue(numpy.all(error <= table.getMaxTimeOfFlightError(r_bo)))
+        numpy.testing.assert_array_equal(interpolated['freeFlightAngle'], exact['freeFlightAngle'])
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(Six02TimeOfFlightTableTests('test_ErrorBound'))
+    suite.addTest(Six02TimeOfFlightTableTests('test_SaveAndMemoryMap'))
+    suite.addTest(Six02TimeOfFlightTableTests('test_BatchEvaluator'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
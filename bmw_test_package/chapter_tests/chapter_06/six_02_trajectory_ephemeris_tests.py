@@ -0,0 +1,85 @@
+import math
+import unittest
+
+import numpy
+
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem
+from six_ballisticMissileTrajectories.six_02_trajectory_ephemeris import ephemerisDtype, generateEphemeris
+
+
+class Six02TrajectoryEphemerisTests(unittest.TestCase):
+    """
+    Points along the free-flight ellipse against the endpoint equations and the constants of the motion
+    """
+
+    r_bo = numpy.array([1.1, 1.05, 1.02, 1.1])
+    v_bo = numpy.array([0.905, 0.95, 0.7, 2.0])
+    fpa_bo = numpy.array([30.0, 20.0, 45.0, 30.0])
+
+    def test_EndpointsAndConstantsOfTheMotion(self):
+        """
+        Burnout and re-entry match the burnout state, equation 6.2-12 and equation 6.2-22; energy and angular
+        momentum stay constant in between.
+        """
+        module = six_02_general_ballistic_missile_problem
+        typeUsed = ReturnType.CANONICAL
+
+        for sampling in ('time', 'anomaly'):
+            ephemeris = generateEphemeris(self.r_bo, self.v_bo, self.fpa_bo, typeUsed, samples=51, sampling=sampling)
+            self.assertEqual(ephemeris.shape, (4, 51))
+
+            for i in range(3):
+                r_bo, v_bo, fpa_bo = float(self.r_bo[i]), float(self.v_bo[i]), float(self.fpa_bo[i])
+                track = ephemeris[i]
+                Q_bo = module.solveForNondimentionalParametericParameter621(v_bo, r_bo, typeUsed)
+                psi = module.solveForFreeFlightAngleFromQ(Q_bo, fpa_bo)
+                e = module.solveForEccentricity(Q_bo, fpa_bo)
+                a = module.solveForSemiMajorAxis(r_bo, Q_bo)
+                timeOfFlight = module.solveForTimeOfFreeFlight(module.solveForEccentricAnomalyFromMaxRange(e, psi), e, a, typeUsed)
+
+                self.assertAlmostEqual(track['radius'][0], r_bo, 12)
+                self.assertAlmostEqual(track['velocity'][0], v_bo, 12)
+                self.assertAlmostEqual(track['flightPathAngle'][0], fpa_bo, 9)
+                self.assertAlmostEqual(track['radius'][-1], r_bo, 12)
+                self.assertAlmostEqual(track['flightPathAngle'][-1], -fpa_bo, 9)
+                self.assertAlmostEqual(track['rangeAngle'][-1], psi, 9)
+                self.assertTrue(math.isclose(track['time'][-1], timeOfFlight, rel_tol=1e-12))
+                self.assertTrue(numpy.all(numpy.diff(track['time']) > 0.0))
+
+                energy = track['velocity'] ** 2 / 2.0 - 1.0 / track['radius']
+                angularMomentum = track['radius'] * track['velocity'] * numpy.cos(numpy.radians(track['flightPathAngle']))
+                numpy.testing.assert_allclose(energy, energy[0], rtol=1e-12)
+                numpy.testing.assert_allclose(angularMomentum, angularMomentum[0], rtol=1e-12)
+
+            # escape speed has no free-flight ellipse
+            self.assertTrue(numpy.isnan(ephemeris[3]['radius']).all())
+
+    def test_TimeSamplesAreEvenAndConsistent(self):
+        """
+        Evenly timed points land on the positions the anomaly sampling puts at those times.
+        """
+        byTime = generateEphemeris(self.r_bo[:3], self.v_bo[:3], self.fpa_bo[:3], ReturnType.CANONICAL, samples=21)
+        steps = numpy.diff(byTime['time'], axis=1)
+        numpy.testing.assert_allclose(steps, numpy.broadcast_to(steps[:, :1], steps.shape), rtol=1e-9)
+
+        byAnomaly = generateEphemeris(self.r_bo[:3], self.v_bo[:3], self.fpa_bo[:3], ReturnType.CANONICAL, samples=2001, sampling='anomaly')
+        for i in range(3):
+            numpy.testing.assert_allclose(byTime['rangeAngle'][i],
+                                          numpy.interp(byTime['time'][i], byAnomaly['time'][i], byAnomaly['rangeAngle'][i]), atol=1e-3)
+
+        buffer = numpy.empty((3, 21), dtype=ephemerisDtype)
+        self.assertIs(generateEphemeris(self.r_bo[:3], self.v_bo[:3], self.fpa_bo[:3], ReturnType.CANONICAL, samples=21, out=buffer), buffer)
+        numpy.testing.assert_array_equal(buffer, byTime)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(Six02TrajectoryEphemerisTests('test_EndpointsAndConstantsOfTheMotion'))
+    suite.addTest(Six02TrajectoryEphemerisTests('test_TimeSamplesAreEvenAndConsistent'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
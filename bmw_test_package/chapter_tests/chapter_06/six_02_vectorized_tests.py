@@ -0,0 +1,181 @@
+import math
+import unittest
+
+import numpy
+
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+
+
+class Six02VectorizedTests(unittest.TestCase):
+    """
+    Checks that the array version of Chapter 6, Section 2 agrees with the scalar equations
+    """
+
+    def assertMatchesScalar(self, vectorized, scalar, expected):
+        # tolerance documented in six_02_general_ballistic_missile_problem_vectorized
+        numpy.testing.assert_allclose(vectorized, expected, rtol=1e-12, atol=1e-9, err_msg=scalar.__name__)
+
+    def test_FreeFlightAngleGrid(self):
+        """
+        The Figure 6.2-6 grid evaluated in one call must match the scalar equation 6.2-12 point for point.
+        """
+        qSweep = numpy.array([0.3, 0.4, 0.5, 0.6, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 1.0, 1.2, 1.9])
+        fpaSweep = numpy.arange(0, 90.5, 0.5)
+
+        psi = six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ(qSweep[:, None], fpaSweep)
+        self.assertEqual(psi.shape, (qSweep.size, fpaSweep.size))
+
+        expected = [[six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(float(q), float(fpa))
+                     for fpa in fpaSweep] for q in qSweep]
+        self.assertMatchesScalar(psi, six_02_general_ballistic_missile_problem.solveForFreeFlightAngle, expected)
+
+    def test_BurnoutStateFunctions(self):
+        """
+        Burnout-state based equations over a sweep of metric burnout conditions.
+        """
+        typeUsed = ReturnType.METRIC
+
+        r_bo = numpy.linspace(6500.0, 7500.0, 7)[:, None]
+        v_bo = numpy.linspace(4.0, 7.0, 11)
+        fpa_bo = 30.0
+
+        module = six_02_general_ballistic_missile_problem
+        vectorized = six_02_general_ballistic_missile_problem_vectorized
+
+        Q = vectorized.solveForNondimentionalParametericParameter621(v_bo, r_bo, typeUsed)
+        psi = vectorized.solveForFreeFlightAngleFromBurnout(r_bo, v_bo, fpa_bo, typeUsed)
+        a = vectorized.solveForSemiMajorAxis(r_bo, Q)
+        maxRange = vectorized.solveForMaxRangeAngle(Q)
+        lowFpa, highFpa = vectorized.solveForFlightPathAngle(psi, Q)
+
+        for i, r in enumerate(r_bo[:, 0]):
+            for j, v in enumerate(v_bo):
+                r, v = float(r), float(v)
+                q = module.solveForNondimentionalParametericParameter621(v, r, typeUsed)
+                freeFlightAngle = module.solveForFreeFlightAngle(r, v, fpa_bo, typeUsed)
+                fpas = module.solveForFlightPathAngle(freeFlightAngle, q)
+
+                self.assertAlmostEqual(Q[i, j], q, 12)
+                self.assertAlmostEqual(psi[i, j], freeFlightAngle, 9)
+                self.assertAlmostEqual(a[i, j], module.solveForSemiMajorAxis(r, q), 6)
+                self.assertAlmostEqual(maxRange[i, j], module.solveForMaxRangeAngle(q), 9)
+                self.assertAlmostEqual(lowFpa[i, j], fpas[0], 9)
+                self.assertAlmostEqual(highFpa[i, j], fpas[1], 9)
+
+    def test_TimeOfFreeFlight(self):
+        """
+        Equations 6.2-20 through 6.2-23 over a range sweep, using the problem on pg. 249 (2nd ed) as the anchor.
+        """
+        typeUsed = ReturnType.METRIC
+        module = six_02_general_ballistic_missile_problem
+        vectorized = six_02_general_ballistic_missile_problem_vectorized
+
+        freeFlightRange = numpy.linspace(10.0, 170.0, 33)
+        r_bo = 7015.235
+
+        Q = vectorized.solveForRequiredQAtMaxRange(freeFlightRange)
+        v = vectorized.solveForVelocity621(Q, r_bo, typeUsed)
+        a = vectorized.solveForSemiMajorAxis(r_bo, Q)
+        e = numpy.full_like(Q, 0.5)
+        E = vectorized.solveForEccentricAnomalyFromMaxRange(e, freeFlightRange)
+        tof = vectorized.solveForTimeOfFreeFlight(E, e, a, typeUsed)
+
+        for i, psi in enumerate(freeFlightRange):
+            psi = float(psi)
+            q = module.solveForRequiredQAtMaxRange(psi)
+            capE = module.solveForEccentricAnomalyFromMaxRange(0.5, psi)
+            self.assertAlmostEqual(Q[i], q, 12)
+            self.assertAlmostEqual(v[i], module.solveForVelocity621(q, r_bo, typeUsed), 9)
+            self.assertAlmostEqual(E[i], capE, 9)
+            self.assertTrue(math.isclose(tof[i], module.solveForTimeOfFreeFlight(capE, 0.5, a[i], typeUsed), rel_tol=1e-12))
+
+        self.assertTrue(math.isclose(vectorized.solveForFreeFlightTime(r_bo, typeUsed),
+                                     module.solveForFreeFlightTime(r_bo, typeUsed), rel_tol=1e-12))
+
+    def test_TimeOfFreeFlightFromBurnout(self):
+        """
+        The time of free flight of any symmetric trajectory against the maximum range equations and the limiting cases.
+        """
+        typeUsed = ReturnType.CANONICAL
+        module = six_02_general_ballistic_missile_problem
+        vectorized = six_02_general_ballistic_missile_problem_vectorized
+
+        r_bo = numpy.linspace(1.0, 1.2, 9)[:, None, None]
+        v_bo = numpy.linspace(0.3, 1.2, 10)[None, :, None]
+        fpa_bo = numpy.linspace(5.0, 85.0, 17)
+        tof = vectorized.solveForTimeOfFreeFlightFromBurnout(r_bo, v_bo, fpa_bo, typeUsed)
+        self.assertEqual(tof.shape, (9, 10, 17))
+
+        for (i, j, k), value in numpy.ndenumerate(tof):
+            r, v, fpa = float(r_bo[i, 0, 0]), float(v_bo[0, j, 0]), float(fpa_bo[k])
+            Q_bo = module.solveForNondimentionalParametericParameter621(v, r, typeUsed)
+            e = module.solveForEccentricity(Q_bo, fpa)
+            psi = module.solveForFreeFlightAngleFromQ(Q_bo, fpa)
+            expected = module.solveForTimeOfFreeFlight(module.solveForEccentricAnomalyFromMaxRange(e, psi), e,
+                                                       module.solveForSemiMajorAxis(r, Q_bo), typeUsed)
+            scalar = module.solveForTimeOfFreeFlightFromBurnout(r, v, fpa, typeUsed)
+            self.assertTrue(math.isclose(scalar, expected, rel_tol=1e-9), (r, v, fpa))
+            self.assertTrue(math.isclose(value, scalar, rel_tol=1e-12), (r, v, fpa))
+
+        # straight up and down at Q = 1 rises to r = 2 a, E = 90 degrees: 2 (pi/2 + 1) sqrt(a^3 / mu)
+        self.assertAlmostEqual(module.solveForTimeOfFreeFlightFromBurnout(1.0, 1.0, 90.0, typeUsed), math.pi + 2.0, 12)
+        # horizontal burnout above circular speed flies a whole orbit
+        self.assertAlmostEqual(module.solveForTimeOfFreeFlightFromBurnout(1.0, math.sqrt(1.2), 0.0, typeUsed),
+                               module.solveForFreeFlightTime(1.0 / 0.8, typeUsed), 12)
+        # short flights keep their precision: t -> 2 r sin(FPA) / g for a slow, steep shot
+        self.assertTrue(math.isclose(module.solveForTimeOfFreeFlightFromBurnout(1.0, 1e-6, 60.0, typeUsed),
+                                     2e-6 * math.sin(math.radians(60.0)), rel_tol=1e-9))
+
+        self.assertTrue(numpy.isnan(vectorized.solveForTimeOfFreeFlightFromBurnout(1.0, [0.9, 1.5], 30.0, typeUsed)[1]))
+
+    def test_OutOfDomainIsNaN(self):
+        """
+        Values the scalar equations reject come back as NaN without affecting the rest of the batch.
+        """
+        vectorized = six_02_general_ballistic_missile_problem_vectorized
+
+        maxRange = vectorized.solveForMaxRangeAngle([0.5, 1.5])
+        self.assertFalse(numpy.isnan(maxRange[0]))
+        self.assertTrue(numpy.isnan(maxRange[1]))
+
+        lowFpa, highFpa = vectorized.solveForFlightPathAngle([90.0, 170.0], 0.9)
+        self.assertFalse(numpy.isnan(lowFpa[0]))
+        self.assertTrue(numpy.isnan(highFpa[1]))
+
+    def test_FreeFlightAngleShim(self):
+        """
+        The compatibility entry point takes ints, NumPy scalars and arrays and selects the equation by argument count.
+        """
+        module = six_02_general_ballistic_missile_problem
+        expected = module.solveForFreeFlightAngleFromQ(0.8, 30.0)
+
+        self.assertEqual(module.solveForFreeFlightAngle(0.8, 30), expected)
+        self.assertEqual(module.solveForFreeFlightAngle(numpy.float64(0.8), numpy.int64(30)), expected)
+        self.assertEqual(module.solveForFreeFlightAngle(1.1, 0.905, 30, ReturnType.CANONICAL),
+                         module.solveForFreeFlightAngleFromBurnout(1.1, 0.905, 30.0, ReturnType.CANONICAL))
+        self.assertEqual(module.solveForFreeFlightAngle(120.0), module.solveForFreeFlightAngleFromAnomaly(120.0))
+
+        psi = module.solveForFreeFlightAngle(numpy.array([0.8, 0.9]), 30.0)
+        self.assertEqual(psi.shape, (2,))
+        self.assertAlmostEqual(psi[0], expected, 9)
+
+        with self.assertRaises(TypeError):
+            module.solveForFreeFlightAngle(0.8, 30.0, 1.0)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(Six02VectorizedTests('test_FreeFlightAngleGrid'))
+    suite.addTest(Six02VectorizedTests('test_BurnoutStateFunctions'))
+    suite.addTest(Six02VectorizedTests('test_TimeOfFreeFlight'))
+    suite.addTest(Six02VectorizedTests('test_TimeOfFreeFlightFromBurnout'))
+    suite.addTest(Six02VectorizedTests('test_OutOfDomainIsNaN'))
+    suite.addTest(Six02VectorizedTests('test_FreeFlightAngleShim'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import math
+import unittest
+
+import numpy
+
+from constants import trig
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem, six_03_launching_errors_on_range
+from six_ballisticMissileTrajectories import six_03_covariance_propagation
+from six_ballisticMissileTrajectories.six_03_monte_carlo_dispersion import BurnoutErrorModel, runDispersion
+
+
+class Six03CovariancePropagationTests(unittest.TestCase):
+    """
+    Linear propagation of burnout error covariances to impact miss covariances and error ellipses
+    """
+
+    def setUp(self):
+        self.errorModel = BurnoutErrorModel(dv_bo=('normal', 1e-5, 1e-4), dr_bo=('normal', 0.0, 5e-4),
+                                            dfpa_bo=('normal', 0.0, 0.01), lateral=('uniform', -0.01, 0.02),
+                                            azimuthal=('normal', 0.0, 0.02))
+
+    def test_JacobianMatchesScalarEquations(self):
+        """
+        The Jacobian columns are the influence coefficients and the small angle cross-range functions.
+        """
+        typeUsed = ReturnType.CANONICAL
+        module = six_03_launching_errors_on_range
+        r_bo, v_bo, fpa_bo = 1.1, 0.905, 30.0
+        psi = six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromBurnout(r_bo, v_bo, fpa_bo, typeUsed)
+
+        jacobian = six_03_covariance_propagation.solveForMissJacobian(r_bo, v_bo, fpa_bo, typeUsed)
+        expected = [[module.solveForInfluenceCoefficientBurnoutVelocity(r_bo, v_bo, fpa_bo, psi, typeUsed) * trig.radians2degrees,
+                     module.solveForInfluenceCoefficientBurnoutHeight(r_bo, v_bo, fpa_bo, psi, typeUsed) * trig.radians2degrees,
+                     module.solveForInfluenceCoefficientFPAError(psi, fpa_bo), 0.0, 0.0],
+                    [0.0, 0.0, 0.0,
+                     module.solveForCrossRangeErrorLateralSmallAngleApprox(psi, 1.0),
+                     module.solveForCrossRangeErrorAzimuthalSmallAngleApprox(psi, 1.0)]]
+        numpy.testing.assert_allclose(jacobian, expected, rtol=1e-12, atol=1e-15)
+
+    def test_AgreesWithMonteCarlo(self):
+        """
+        The analytical bias, covariance and error ellipse of one trajectory match a large Monte Carlo run.
+        """
+        typeUsed = ReturnType.CANONICAL
+        bias, covariance = six_03_covariance_propagation.solveForMissStatistics(
+            1.1, 0.905, 30.0, typeUsed, self.errorModel.getCovariance(), self.errorModel.getMeans())
+        statistics = runDispersion(1.1, 0.905, 30.0, typeUsed, self.errorModel, 400000, seed=16)
+
+        numpy.testing.assert_allclose(bias, statistics.getBias(), rtol=0.0, atol=5e-4)
+        numpy.testing.assert_allclose(covariance, statistics.getCovariance(), rtol=0.02, atol=2e-5)
+        semiMajor, semiMinor, _ = six_03_covariance_propagation.solveForErrorEllipses(covariance, 0.5)
+        expectedMajor, expectedMinor, _ = statistics.getErrorEllipse(0.5)
+        self.assertTrue(math.isclose(semiMajor, expectedMajor, rel_tol=0.01))
+        self.assertTrue(math.isclose(semiMinor, expectedMinor, rel_tol=0.01))
+
+    def test_StackedTrajectories(self):
+        """
+        A stack of trajectories, each with its own burnout covariance, gives the same answer as one at a time,
+        and the closed form ellipses agree with an eigen decomposition.
+        """
+        typeUsed = ReturnType.CANONICAL
+        generator = numpy.random.default_rng(16)
+        count = 50
+        v_bo = generator.uniform(0.8, 0.95, count)
+        fpa_bo = generator.uniform(10.0, 50.0, count)
+        factors = generator.normal(size=(count, 5, 5)) * 1e-3
+        burnoutCovariance = factors @ numpy.swapaxes(factors, -1, -2)
+        burnoutMean = generator.normal(size=(count, 5)) * 1e-4
+
+        bias, covariance = six_03_covariance_propagation.solveForMissStatistics(
+            1.05, v_bo, fpa_bo, typeUsed, burnoutCovariance, burnoutMean)
+        self.assertEqual(bias.shape, (count, 2))
+        self.assertEqual(covariance.shape, (count, 2, 2))
+        semiMajor, semiMinor, orientation = six_03_covariance_propagation.solveForErrorEllipses(covariance, 0.9)
+
+        scale = -2.0 * math.log(0.1)
+        for i in range(count):
+            oneBias, oneCovariance = six_03_covariance_propagation.solveForMissStatistics(
+                1.05, v_bo[i], fpa_bo[i], typeUsed, burnoutCovariance[i], burnoutMean[i])
+            numpy.testing.assert_allclose(bias[i], oneBias, rtol=1e-12)
+            numpy.testing.assert_allclose(covariance[i], oneCovariance, rtol=1e-12)
+
+            eigenvalues, eigenvectors = numpy.linalg.eigh(covariance[i])
+            self.assertTrue(math.isclose(semiMajor[i], math.sqrt(eigenvalues[1] * scale), rel_tol=1e-9))
+            self.assertTrue(math.isclose(semiMinor[i], math.sqrt(max(eigenvalues[0], 0.0) * scale), rel_tol=1e-6, abs_tol=1e-12))
+            angle = math.radians(orientation[i])
+            self.assertAlmostEqual(abs(math.cos(angle) * eigenvectors[0, 1] + math.sin(angle) * eigenvectors[1, 1]), 1.0, 9)
+            self.assertTrue(-90.0 < orientation[i] <= 90.0)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(Six03CovariancePropagationTests('test_JacobianMatchesScalarEquations'))
+    suite.addTest(Six03CovariancePropagationTests('test_AgreesWithMonteCarlo'))
+    suite.addTest(Six03CovariancePropagationTests('test_StackedTrajectories'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import math
+import unittest
+
+import numpy
+
+from constants import trig
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem, six_03_launching_errors_on_range
+from six_ballisticMissileTrajectories import six_03_launching_errors_on_range_vectorized
+from six_ballisticMissileTrajectories.six_03_monte_carlo_dispersion import BurnoutErrorModel, runDispersion
+
+
+class Six03MonteCarloTests(unittest.TestCase):
+    """
+    Array influence coefficients and the Monte Carlo dispersion engine built on them
+    """
+
+    def test_VectorizedInfluenceCoefficients(self):
+        """
+        The array equations agree with the scalar ones over a sweep of flight path angles.
+        """
+        typeUsed = ReturnType.CANONICAL
+        module = six_03_launching_errors_on_range
+        vectorized = six_03_launching_errors_on_range_vectorized
+
+        r_bo = 1.1
+        v_bo = 0.905
+        fpa_bo = numpy.linspace(5.0, 60.0, 12)
+        psi = six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(r_bo, v_bo, fpa_bo, typeUsed)
+
+        icHeight = vectorized.solveForInfluenceCoefficientBurnoutHeight(r_bo, v_bo, fpa_bo, psi, typeUsed)
+        icVelocity = vectorized.solveForInfluenceCoefficientBurnoutVelocity(r_bo, v_bo, fpa_bo, psi, typeUsed)
+        icFPA = vectorized.solveForInfluenceCoefficientFPAError(psi, fpa_bo)
+        lateral = vectorized.solveForCrossRangeErrorLateral(psi, 0.01)
+        azimuthal = vectorized.solveForCrossRangeErrorAzimuthal(psi, 0.01)
+
+        for i, fpa in enumerate(fpa_bo):
+            fpa, freeFlightAngle = float(fpa), float(psi[i])
+            self.assertTrue(math.isclose(icHeight[i], module.solveForInfluenceCoefficientBurnoutHeight(r_bo, v_bo, fpa, freeFlightAngle, typeUsed), rel_tol=1e-12))
+            self.assertTrue(math.isclose(icVelocity[i], module.solveForInfluenceCoefficientBurnoutVelocity(r_bo, v_bo, fpa, freeFlightAngle, typeUsed), rel_tol=1e-12))
+            self.assertTrue(math.isclose(icFPA[i], module.solveForInfluenceCoefficientFPAError(freeFlightAngle, fpa), rel_tol=1e-12))
+            self.assertAlmostEqual(lateral[i], module.solveForCrossRangeErrorLateral(freeFlightAngle, 0.01), 6)
+            self.assertAlmostEqual(azimuthal[i], module.solveForCrossRangeErrorAzimuthal(freeFlightAngle, 0.01), 6)
+
+    def test_FusedInfluenceCoefficients(self):
+        """
+        One pass gives psi and every coefficient of the separate equations, as scalars and as arrays.
+        """
+        typeUsed = ReturnType.CANONICAL
+        module = six_03_launching_errors_on_range
+
+        r_bo = numpy.array([1.1, 1.05, 1.02, 1.0])
+        v_bo = numpy.array([0.905, 0.8, 0.95, 1.2])
+        fpa_bo = numpy.array([30.0, 10.0, 60.0, 5.0])
+        fused = six_03_launching_errors_on_range_vectorized.solveForInfluenceCoefficients(r_bo, v_bo, fpa_bo, typeUsed)
+
+        for i in range(len(r_bo)):
+            r, v, fpa = float(r_bo[i]), float(v_bo[i]), float(fpa_bo[i])
+            coefficients = module.solveForInfluenceCoefficients(r, v, fpa, typeUsed)
+            psi = six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromBurnout(r, v, fpa, typeUsed)
+            expected = (psi,
+                        module.solveForInfluenceCoefficientFPAError(psi, fpa),
+                        module.solveForInfluenceCoefficientBurnoutHeight(r, v, fpa, psi, typeUsed),
+                        module.solveForInfluenceCoefficientBurnoutVelocity(r, v, fpa, psi, typeUsed),
+                        module.solveForCrossRangeErrorLateralSmallAngleApprox(psi, 1.0),
+                        module.solveForCrossRangeErrorAzimuthalSmallAngleApprox(psi, 1.0))
+
+            self.assertEqual(coefficients.freeFlightAngle, psi)
+            for name, value, expectedValue in zip(coefficients._fields, coefficients, expected):
+                self.assertTrue(math.isclose(value, expectedValue, rel_tol=1e-12, abs_tol=1e-14), name)
+                self.assertTrue(math.isclose(getattr(fused, name)[i], value, rel_tol=1e-12, abs_tol=1e-14), name)
+
+    def test_FixedErrorsReproduceBookProblem(self):
+        """
+        Problem on pg. 305 (1st ed) run through the engine with the burnout errors fixed.
+        """
+        typeUsed = ReturnType.CANONICAL
+        r_bo, v_bo, fpa_bo = 1.1, 0.905, 30.0
+        dv_bo, dr_bo, dfpa_bo = -5e-5, 5e-4, -1e-4
+
+        errorModel = BurnoutErrorModel(dv_bo=('fixed', dv_bo), dr_bo=('fixed', dr_bo),
+                                       dfpa_bo=('fixed', dfpa_bo * trig.radians2degrees))
+        statistics = runDispersion(r_bo, v_bo, fpa_bo, typeUsed, errorModel, 10, chunkSize=4)
+
+        module = six_03_launching_errors_on_range
+        psi = six_02_general_ballistic_missile_problem.solveForFreeFlightAngle(r_bo, v_bo, fpa_bo, typeUsed)
+        errorTot = module.solveForInfluenceCoefficientFPAError(psi, fpa_bo) * dfpa_bo + \
+            module.solveForInfluenceCoefficientBurnoutHeight(r_bo, v_bo, fpa_bo, psi, typeUsed) * dr_bo + \
+            module.solveForInfluenceCoefficientBurnoutVelocity(r_bo, v_bo, fpa_bo, psi, typeUsed) * dv_bo
+
+        self.assertEqual(statistics.getCount(), 10)
+        self.assertAlmostEqual(statistics.getBias()[0], errorTot * trig.radians2degrees, 12)
+        self.assertAlmostEqual(statistics.getBias()[1], 0.0, 12)
+
+    def test_StatisticsAreReproducible(self):
+        """
+        Normal errors: the sample statistics match the linear model and do not depend on chunking across processes.
+        """
+        typeUsed = ReturnType.CANONICAL
+        errorModel = BurnoutErrorModel(dv_bo=('normal', 0.0, 1e-4), dr_bo=('normal', 0.0, 1e-4),
+                                       lateral=('normal', 0.0, 0.01), azimuthal=('uniform', -0.01, 0.01))
+
+        single = runDispersion(1.1, 0.905, 30.0, typeUsed, errorModel, 200000, chunkSize=50000, seed=63)
+        pooled = runDispersion(1.1, 0.905, 30.0, typeUsed, errorModel, 200000, chunkSize=50000, seed=63, processes=2)
+
+        numpy.testing.assert_allclose(pooled.getBias(), single.getBias(), rtol=0, atol=1e-15)
+        numpy.testing.assert_allclose(pooled.getCovariance(), single.getCovariance(), rtol=1e-12)
+        self.assertEqual(pooled.getCEP(), single.getCEP())
+
+        # jointly normal misses have a CEP between the 50% ellipse's semi-minor and semi-major axes
+        semiMajor, semiMinor, orientation = single.getErrorEllipse(0.5)
+        self.assertLess(semiMinor, single.getCEP())
+        self.assertLess(single.getCEP(), semiMajor)
+        self.assertLess(abs(single.getBias()[0]), 5 * math.sqrt(single.getCovariance()[0, 0] / single.getCount()))
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(Six03MonteCarloTests('test_VectorizedInfluenceCoefficients'))
+    suite.addTest(Six03MonteCarloTests('test_FusedInfluenceCoefficients'))
+    suite.addTest(Six03MonteCarloTests('test_FixedErrorsReproduceBookProblem'))
+    suite.addTest(Six03MonteCarloTests('test_StatisticsAreReproducible'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import asyncio
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from bmw_test_package import batch_evaluator, solver_service
+from constants.earth import ReturnType
+
+
+class SolverServiceTests(unittest.TestCase):
+    """
+    The solver service on localhost: batching of concurrent requests, results, errors and statistics
+    """
+
+    def setUp(self):
+        self.r_bo = numpy.linspace(1.01, 1.1, 40)
+        self.v_bo = numpy.linspace(0.8, 0.95, 40)
+        self.fpa_bo = numpy.linspace(10.0, 50.0, 40)
+
+    def _run(self, coroutine):
+        return asyncio.run(asyncio.wait_for(coroutine, 30.0))
+
+    async def _evaluateAll(self, client):
+        return await asyncio.gather(*(client.call('evaluate', r_bo=r, v_bo=v, fpa_bo=f)
+                                      for r, v, f in zip(self.r_bo.tolist(), self.v_bo.tolist(), self.fpa_bo.tolist())))
+
+    def test_BatchesConcurrentRequests(self):
+        """
+        Concurrent requests from several connections are answered in a few batches with the array solver results.
+        """
+        async def scenario():
+            service = solver_service.SolverService(window=0.05)
+            port = await service.start()
+            clients = [await solver_service.SolverClient.connect(port=port) for _ in range(2)]
+            try:
+                results = await asyncio.gather(self._evaluateAll(clients[0]), self._evaluateAll(clients[1]))
+                stats = await clients[0].call('stats')
+            finally:
+                for client in clients:
+                    await client.close()
+                await service.close()
+            return results, stats
+
+        results, stats = self._run(scenario())
+
+        expected = batch_evaluator.evaluateChunk(self.r_bo, self.v_bo, self.fpa_bo, ReturnType.CANONICAL)
+        for connectionResults in results:
+            for name in batch_evaluator.resultColumns:
+                # NaN comes back as null
+                values = numpy.array([result[name] for result in connectionResults], dtype=float)
+                numpy.testing.assert_allclose(values, expected[name], rtol=1e-14)
+
+        self.assertEqual(stats['requests'], 2 * self.r_bo.size)
+        self.assertLess(stats['batches'], 2 * self.r_bo.size)
+        self.assertGreater(stats['meanBatchSize'], 1.0)
+        self.assertGreater(stats['requestsPerSecond'], 0.0)
+        self.assertGreaterEqual(stats['latencyP99'], stats['latencyP50'])
+
+    def test_MaxBatchAndMethods(self):
+        """
+        Full batches are evaluated without waiting for the window; tuple, named tuple and NaN results are encoded.
+        """
+        async def scenario():
+            service = solver_service.SolverService(window=60.0, maxBatch=4)
+            port = await service.start()
+            client = await solver_service.SolverClient.connect(port=port)
+            try:
+                angles = await asyncio.gather(*(client.call('flightPathAngles', Q_bo=0.9, freeFlightRange=psi)
+                                                for psi in (30.0, 60.0, 90.0, 120.0)))
+                influence = await asyncio.gather(*(client.call('influenceCoefficients', r_bo=1.05, v_bo=0.9, fpa_bo=fpa, units='canonical')
+                                                   for fpa in (20.0, 25.0, 30.0, 35.0)))
+                unreachable = await asyncio.gather(*(client.call('flightPathAngles', Q_bo=0.5, freeFlightRange=psi)
+                                                     for psi in (150.0, 160.0, 170.0, 175.0)))
+            finally:
+                await client.close()
+                await service.close()
+            return angles, influence, unreachable, service.getStats()
+
+        angles, influence, unreachable, stats = self._run(scenario())
+        expected = solver_service._six_02.solveForFlightPathAngle(numpy.array([30.0, 60.0, 90.0, 120.0]), 0.9)
+        numpy.testing.assert_allclose(numpy.array(angles, dtype=float), numpy.transpose(expected), rtol=1e-14)
+        self.assertEqual(set(influence[0]), set(solver_service._six_03.InfluenceCoefficients._fields))
+        self.assertEqual(unreachable, [[None, None]] * 4)
+        self.assertEqual(stats.getBatches(), 3)
+
+    def test_Errors(self):
+        """
+        Bad requests get an error response and leave the connection usable.
+        """
+        async def scenario():
+            service = solver_service.SolverService(window=0.001)
+            port = await service.start()
+            client = await solver_service.SolverClient.connect(port=port)
+            errors = []
+            try:
+                for method, params in (('noSuchMethod', {}), ('evaluate', {'r_bo': 1.1}),
+                                       ('evaluate', {'r_bo': 1.1, 'v_bo': 0.9, 'fpa_bo': 30.0, 'units': 'furlongs'})):
+                    with self.assertRaises(RuntimeError) as context:
+                        await client.call(method, **params)
+                    errors.append(str(context.exception))
+                result = await client.call('requiredQ', r_bo=1.0, v_bo=1.0)
+                # a circular orbit fired horizontally: infinite influence coefficients
+                singular = await client.call('evaluate', r_bo=1.0, v_bo=1.0, fpa_bo=0.0)
+            finally:
+                await client.close()
+                await service.close()
+            return errors, result, singular, service.getStats()
+
+        errors, result, singular, stats = self._run(scenario())
+        self.assertIsNone(singular['icFPAError'])
+        self.assertIsNone(singular['icBurnoutVelocity'])
+        self.assertIn('noSuchMethod', errors[0])
+        self.assertIn('v_bo', errors[1])
+        self.assertIn('furlongs', errors[2])
+        self.assertAlmostEqual(result, 1.0, places=14)
+        self.assertEqual(stats.toDict()['errors'], 3)
+
+    def test_MalformedMessages(self):
+        """
+        Messages that are not JSON objects are answered with an error and leave the connection usable.
+        """
+        async def scenario():
+            service = solver_service.SolverService(window=0.001)
+            port = await service.start()
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            try:
+                replies = []
+                for line in (b'[1, 2]\n', b'not json\n', b'{"id": 7, "method": "requiredQ", "params": {"r_bo": 1.0, "v_bo": 1.0}}\n'):
+                    writer.write(line)
+                    await writer.drain()
+                    replies.append(json.loads(await reader.readline()))
+            finally:
+                writer.close()
+                await service.close()
+            return replies
+
+        replies = self._run(scenario())
+        self.assertEqual(replies[0], {'id': None, 'error': 'bad message: not an object'})
+        self.assertIsNone(replies[1]['id'])
+        self.assertIn('bad message', replies[1]['error'])
+        self.assertEqual(replies[2]['id'], 7)
+        self.assertAlmostEqual(replies[2]['result'], 1.0, places=14)
+
+    @unittest.skipUnless(hasattr(asyncio, 'start_unix_server'), "Unix sockets are not available")
+    def test_UnixSocket(self):
+        async def scenario(path):
+            service = solver_service.SolverService(window=0.01)
+            await service.startUnix(path)
+            client = await solver_service.SolverClient.connectUnix(path)
+            try:
+                return await self._evaluateAll(client)
+            finally:
+                await client.close()
+                await service.close()
+
+        with tempfile.TemporaryDirectory() as directory:
+            results = self._run(scenario(os.path.join(directory, 'solver.sock')))
+        self.assertEqual(len(results), self.r_bo.size)
+
+    @unittest.skipUnless(importlib.util.find_spec('msgpack'), "msgpack is not installed")
+    def test_Msgpack(self):
+        async def scenario():
+            service = solver_service.SolverService(window=0.01, codec='msgpack')
+            port = await service.start()
+            client = await solver_service.SolverClient.connect(port=port, codec='msgpack')
+            try:
+                return await client.call('freeFlightAngle', Q_bo=0.9, fpa_bo=30.0)
+            finally:
+                await client.close()
+                await service.close()
+
+        expected = solver_service._six_02.solveForFreeFlightAngleFromQ(0.9, 30.0)
+        self.assertAlmostEqual(self._run(scenario()), expected, places=12)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(SolverServiceTests('test_BatchesConcurrentRequests'))
+    suite.addTest(SolverServiceTests('test_MaxBatchAndMethods'))
+    suite.addTest(SolverServiceTests('test_Errors'))
+    suite.addTest(SolverServiceTests('test_MalformedMessages'))
+    suite.addTest(SolverServiceTests('test_UnixSocket'))
+    suite.addTest(SolverServiceTests('test_Msgpack'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
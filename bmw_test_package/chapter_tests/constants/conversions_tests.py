@@ -0,0 +1,87 @@
+import math
+import unittest
+
+import numpy
+
+from constants import conversions
+
+
+class ConversionsTests(unittest.TestCase):
+    """
+    Fused unit conversions of whole arrays
+    """
+
+    def test_FusedFactors(self):
+        """
+        A fused factor agrees with converting through canonical units with the scalar functions, and is exact
+        between English and metric units.
+        """
+        self.assertTrue(math.isclose(conversions.getConversionFactor('ft/sec', 'km/sec'),
+                                     conversions.convertCanonical2KmPerSec(conversions.convertFtPerSec2Canonical(1.0)), rel_tol=1e-9))
+        self.assertEqual(conversions.getConversionFactor('ft/sec', 'km/sec'), 0.0003048)
+        self.assertEqual(conversions.getConversionFactor('ft', 'km'), 0.0003048)
+        self.assertEqual(conversions.getConversionFactor('km', 'ft'), 3280.839895013123)
+        self.assertEqual(conversions.getConversionFactor('mi', 'ft'), 5280.0)
+        self.assertEqual(conversions.getConversionFactor('deg', 'km'), conversions.convertDEG2KM(1.0))
+        self.assertEqual(conversions.getConversionFactor('nm', 'km'), conversions.convertNM2KM(1.0))
+        self.assertTrue(math.isclose(conversions.getConversionFactor('km', 'DU'), conversions.km2c, rel_tol=1e-15))
+        self.assertEqual(conversions.getConversionFactor('nm', 'nm'), 1.0)
+        self.assertEqual(conversions.convert(22000.0, 'ft/sec', 'DU/TU'), 22000.0 * conversions.ftPerSec2c)
+
+        with self.assertRaises(ValueError):
+            conversions.getConversionFactor('ft', 'sec')
+        with self.assertRaises(ValueError):
+            conversions.getConversionFactor('furlong', 'ft')
+
+    def test_ArraysInPlace(self):
+        """
+        Arrays are converted with or without a copy.
+        """
+        values = numpy.linspace(0.0, 25000.0, 11)
+        expected = values * conversions.getConversionFactor('ft/sec', 'km/sec')
+
+        copied = conversions.convert(values, 'ft/sec', 'km/sec')
+        self.assertIsNot(copied, values)
+        numpy.testing.assert_array_equal(copied, expected)
+
+        converted = conversions.convert(values, 'ft/sec', 'km/sec', inPlace=True)
+        self.assertIs(converted, values)
+        numpy.testing.assert_array_equal(values, expected)
+
+    def test_StructuredColumns(self):
+        """
+        Columns of a structured array are converted from a unit spec; unlisted columns are left alone.
+        """
+        table = numpy.zeros(3, dtype=[('h_bo', float), ('v_bo', float), ('fpa_bo', float)])
+        table['h_bo'] = [100.0, 200.0, 300.0]
+        table['v_bo'] = [20000.0, 22000.0, 24000.0]
+        table['fpa_bo'] = 30.0
+        spec = {'h_bo': ('nm', 'DU'), 'v_bo': ('ft/sec', 'DU/TU')}
+
+        converted = conversions.convertColumns(table, spec)
+        self.assertEqual(table['h_bo'][0], 100.0)
+        self.assertAlmostEqual(converted['h_bo'][1], conversions.convertNauticalMiles2Canonical(200.0), 15)
+        self.assertAlmostEqual(converted['v_bo'][2], conversions.convertFtPerSec2Canonical(24000.0), 15)
+        numpy.testing.assert_array_equal(converted['fpa_bo'], table['fpa_bo'])
+
+        result = conversions.convertColumns(table, spec, inPlace=True)
+        self.assertIs(result, table)
+        numpy.testing.assert_array_equal(table, converted)
+
+        # a dictionary of arrays is not changed by a copying conversion
+        columns = {'v_bo': numpy.array([22000.0])}
+        conversions.convertColumns(columns, {'v_bo': ('ft/sec', 'km/sec')})
+        self.assertEqual(columns['v_bo'][0], 22000.0)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(ConversionsTests('test_FusedFactors'))
+    suite.addTest(ConversionsTests('test_ArraysInPlace'))
+    suite.addTest(ConversionsTests('test_StructuredColumns'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import multiprocessing
+import os
+import unittest
+
+import numpy
+
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories import six_03_launching_errors_on_range_vectorized
+from utilities import parallel_sweep, sweep_engine
+
+
+def _sharedMemoryBlocks() -> set:
+    return set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+
+
+class ParallelSweepTests(unittest.TestCase):
+    """
+    Sweeps split across processes give the single call result, report progress and can be cancelled
+    """
+
+    def setUp(self):
+        self.grid = {'Q_bo': numpy.linspace(0.2, 1.2, 37), 'FPA_bo': numpy.linspace(0.0, 90.0, 53)}
+        self.function = six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ
+
+    def test_MatchesSingleCall(self):
+        """
+        Every number of processes and block size writes the values of one broadcast call.
+        """
+        expected = sweep_engine.sweep(self.function, self.grid).getValues()
+        blocksBefore = _sharedMemoryBlocks()
+
+        for processes, chunkSize in ((1, 100), (2, 97), (3, 1)):
+            result = sweep_engine.sweep(self.function, self.grid,
+                                        executor=parallel_sweep.SweepExecutor(processes, chunkSize=chunkSize))
+            numpy.testing.assert_array_equal(result.getValues(), expected)
+
+        influence = {'r_bo': [1.01, 1.05, 1.1], 'fpa_bo': numpy.linspace(10.0, 60.0, 11)}
+        fixed = {'v_bo': 0.9, 'returntype': ReturnType.CANONICAL}
+        single = sweep_engine.sweep(six_03_launching_errors_on_range_vectorized.solveForInfluenceCoefficients, influence, fixed)
+        parallel = sweep_engine.sweep(six_03_launching_errors_on_range_vectorized.solveForInfluenceCoefficients, influence, fixed,
+                                      executor=parallel_sweep.SweepExecutor(2, chunkSize=5))
+        self.assertEqual(parallel.getOutputNames(), single.getOutputNames())
+        for name in single.getOutputNames():
+            numpy.testing.assert_array_equal(parallel.getValues(name), single.getValues(name))
+
+        self.assertEqual(_sharedMemoryBlocks(), blocksBefore)
+
+    def test_Spawn(self):
+        """
+        Workers started without fork attach to the shared outputs by name.
+        """
+        executor = parallel_sweep.SweepExecutor(2, chunkSize=500, context=multiprocessing.get_context('spawn'))
+        result = sweep_engine.sweep(self.function, self.grid, executor=executor)
+        numpy.testing.assert_array_equal(result.getValues(), sweep_engine.sweep(self.function, self.grid).getValues())
+
+    def test_ProgressAndCancel(self):
+        total = self.grid['Q_bo'].size * self.grid['FPA_bo'].size
+        reports = []
+        executor = parallel_sweep.SweepExecutor(2, chunkSize=100, progress=lambda completed, points: reports.append((completed, points)))
+        sweep_engine.sweep(self.function, self.grid, executor=executor)
+        self.assertEqual(reports[-1], (total, total))
+        self.assertEqual([completed for completed, _ in reports], sorted(completed for completed, _ in reports))
+
+        blocksBefore = _sharedMemoryBlocks()
+        for processes in (1, 2):
+            def cancelEarly(completed, points):
+                if completed >= 300:
+                    executor.cancel()
+
+            executor = parallel_sweep.SweepExecutor(processes, chunkSize=100, progress=cancelEarly)
+            with self.assertRaises(parallel_sweep.SweepCancelled) as context:
+                sweep_engine.sweep(self.function, self.grid, executor=executor)
+            self.assertLess(context.exception.completed, total)
+            self.assertFalse(executor.isCancelled())
+        self.assertEqual(_sharedMemoryBlocks(), blocksBefore)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(ParallelSweepTests('test_MatchesSingleCall'))
+    suite.addTest(ParallelSweepTests('test_Spawn'))
+    suite.addTest(ParallelSweepTests('test_ProgressAndCancel'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
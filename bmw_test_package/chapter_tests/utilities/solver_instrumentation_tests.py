@@ -0,0 +1,110 @@
+import json
+import unittest
+
+import numpy
+
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from utilities import solver_instrumentation
+
+
+class SolverInstrumentationTests(unittest.TestCase):
+    """
+    Opt-in call counting and timing of the solver modules
+    """
+
+    def tearDown(self):
+        solver_instrumentation.disable()
+        solver_instrumentation.reset()
+
+    def test_DisabledLeavesSolversUntouched(self):
+        """
+        Outside of `instrumented` the module functions are the originals.
+        """
+        original = six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ
+
+        with solver_instrumentation.instrumented():
+            self.assertTrue(solver_instrumentation.isEnabled())
+            self.assertIsNot(six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ, original)
+            self.assertIs(six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ.__wrapped__, original)
+
+        self.assertFalse(solver_instrumentation.isEnabled())
+        self.assertIs(six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ, original)
+        self.assertEqual(six_02_general_ballistic_missile_problem._outcomeListeners, [])
+
+    def test_CountsAndOutcomes(self):
+        """
+        Calls, nested calls, clamped values, exceptions and NaN elements are all counted.
+        """
+        module = six_02_general_ballistic_missile_problem
+        vectorized = six_02_general_ballistic_missile_problem_vectorized
+
+        with solver_instrumentation.instrumented():
+            for fpa in (10.0, 20.0, 30.0):
+                module.solveForFreeFlightAngleFromBurnout(1.1, 0.905, fpa, ReturnType.CANONICAL)
+            # circular orbit fired horizontally: the denominator of 6.2-12 is exactly 0
+            module.solveForFreeFlightAngleFromQ(1.0, 0.0)
+            vectorized.solveForFreeFlightAngleFromQ(numpy.array([1.0, 1.0]), numpy.array([0.0, 30.0]))
+            with self.assertRaises(ValueError):
+                module.solveForMaxRangeAngle(1.5)
+            vectorized.solveForMaxRangeAngle(numpy.array([0.5, 1.5, 1.8]))
+
+        statistics = solver_instrumentation.getStatistics()
+        fromQ = statistics['six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ']
+        self.assertEqual(statistics['six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromBurnout']['calls'], 3)
+        self.assertEqual(fromQ['calls'], 4)
+        self.assertEqual(fromQ['clamped'], 1)
+        self.assertLessEqual(fromQ['p50Seconds'], fromQ['p99Seconds'])
+        self.assertEqual(statistics['six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ']['clamped'], 1)
+        self.assertEqual(statistics['six_02_general_ballistic_missile_problem.solveForMaxRangeAngle']['exceptions'], 1)
+        self.assertEqual(statistics['six_02_general_ballistic_missile_problem_vectorized.solveForMaxRangeAngle']['nan'], 2)
+
+    def test_ResetWhileEnabled(self):
+        """
+        Calls made after a reset, or inside of a nested `instrumented` block, are still counted.
+        """
+        module = six_02_general_ballistic_missile_problem
+        name = 'six_02_general_ballistic_missile_problem.solveForRequiredQAtMaxRange'
+
+        with solver_instrumentation.instrumented():
+            module.solveForRequiredQAtMaxRange(90.0)
+            solver_instrumentation.reset()
+            self.assertEqual(solver_instrumentation.getStatistics(), {})
+            module.solveForRequiredQAtMaxRange(90.0)
+            self.assertEqual(solver_instrumentation.getStatistics()[name]['calls'], 1)
+
+            with solver_instrumentation.instrumented():
+                module.solveForRequiredQAtMaxRange(60.0)
+            module.solveForRequiredQAtMaxRange(30.0)
+        self.assertEqual(solver_instrumentation.getStatistics()[name]['calls'], 2)
+
+    def test_Export(self):
+        """
+        JSON and Prometheus text exports of the same statistics.
+        """
+        with solver_instrumentation.instrumented():
+            six_02_general_ballistic_missile_problem.solveForRequiredQAtMaxRange(90.0)
+
+        exported = json.loads(solver_instrumentation.toJson())
+        self.assertEqual(list(exported), ['six_02_general_ballistic_missile_problem.solveForRequiredQAtMaxRange'])
+
+        text = solver_instrumentation.toPrometheus()
+        name = 'function="six_02_general_ballistic_missile_problem.solveForRequiredQAtMaxRange"'
+        self.assertIn('bmw_solver_calls_total{%s} 1' % name, text)
+        self.assertIn('bmw_solver_duration_seconds_bucket{%s,le="+Inf"} 1' % name, text)
+        self.assertIn('bmw_solver_duration_seconds_count{%s} 1' % name, text)
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(SolverInstrumentationTests('test_DisabledLeavesSolversUntouched'))
+    suite.addTest(SolverInstrumentationTests('test_CountsAndOutcomes'))
+    suite.addTest(SolverInstrumentationTests('test_ResetWhileEnabled'))
+    suite.addTest(SolverInstrumentationTests('test_Export'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
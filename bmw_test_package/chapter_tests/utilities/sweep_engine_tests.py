@@ -0,0 +1,169 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories import six_03_launching_errors_on_range_vectorized
+from utilities import sweep_engine
+
+
+class SweepEngineTests(unittest.TestCase):
+    """
+    Families of curves over parameter grids, with the on-disk cache
+    """
+
+    def setUp(self):
+        self.qSweep = [0.3, 0.6, 0.9]
+        self.fpaSweep = numpy.arange(0.0, 90.5, 10.0)
+
+    def test_MatchesBroadcast(self):
+        """
+        A scalar equation is swept through its array version, one axis per grid parameter.
+        """
+        result = sweep_engine.sweep(six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ,
+                                    {'Q_bo': self.qSweep, 'FPA_bo': self.fpaSweep})
+
+        self.assertFalse(result.isCached())
+        self.assertEqual(result.getOutputNames(), ('value',))
+        self.assertEqual(list(result.getAxes()), ['Q_bo', 'FPA_bo'])
+        expected = six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ(
+            numpy.array(self.qSweep)[:, None], self.fpaSweep[None, :])
+        numpy.testing.assert_array_equal(result.getValues(), expected)
+        numpy.testing.assert_array_equal(result.getValues('value'), expected)
+
+        with self.assertRaises(ValueError):
+            sweep_engine.sweep(six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ,
+                               {'Q_bo': self.qSweep, 'FPA_bo': self.fpaSweep}, fixed={'Q_bo': 0.5})
+
+    def test_NamedOutputs(self):
+        """
+        Named tuples give one output per field, plain tuples one per position, and fixed arguments are passed through.
+        """
+        influence = sweep_engine.sweep(six_03_launching_errors_on_range_vectorized.solveForInfluenceCoefficients,
+                                       {'r_bo': [1.01, 1.05], 'fpa_bo': [20.0, 30.0, 40.0]},
+                                       fixed={'v_bo': 0.9, 'returntype': ReturnType.CANONICAL})
+        self.assertEqual(influence.getOutputNames(), six_03_launching_errors_on_range_vectorized.InfluenceCoefficients._fields)
+        self.assertEqual(influence.getValues('fpaError').shape, (2, 3))
+
+        angles = sweep_engine.sweep(six_02_general_ballistic_missile_problem_vectorized.solveForFlightPathAngle,
+                                    {'Q_bo': self.qSweep, 'freeFlightRange': [30.0, 60.0]})
+        self.assertEqual(angles.getOutputNames(), ('output0', 'output1'))
+        self.assertEqual(angles.getValues(1).shape, (3, 2))
+
+    def test_PositionalEntryPoint(self):
+        """
+        solveForFreeFlightAngle only takes positional arguments; the grid names select the equation it stands for.
+        """
+        six_02 = six_02_general_ballistic_missile_problem
+        vectorized = six_02_general_ballistic_missile_problem_vectorized
+        fromQ = sweep_engine.sweep(six_02.solveForFreeFlightAngle, {'Q_bo': self.qSweep, 'FPA_bo': self.fpaSweep},
+                                   fixed={'errors': 'mask'})
+        self.assertTrue(fromQ.getFunctionName().endswith('_vectorized.solveForFreeFlightAngleFromQ'))
+        numpy.testing.assert_array_equal(fromQ.getValues(), vectorized.solveForFreeFlightAngleFromQ(
+            numpy.array(self.qSweep)[:, None], self.fpaSweep[None, :]))
+        self.assertEqual(fromQ.getValues('status').shape, (3, len(self.fpaSweep)))
+
+        fromBurnout = sweep_engine.sweep(six_02.solveForFreeFlightAngle, {'r_bo': [1.01, 1.05], 'v_bo': [0.7, 0.8, 0.9]},
+                                         fixed={'FPA_bo': 30.0, 'returntype': ReturnType.CANONICAL})
+        numpy.testing.assert_array_equal(fromBurnout.getValues(), vectorized.solveForFreeFlightAngleFromBurnout(
+            numpy.array([[1.01], [1.05]]), numpy.array([0.7, 0.8, 0.9]), 30.0, ReturnType.CANONICAL))
+        fromAnomaly = sweep_engine.sweep(six_02.solveForFreeFlightAngle, {'v_bo': [100.0, 120.0]})
+        numpy.testing.assert_array_equal(fromAnomaly.getValues(), vectorized.solveForFreeFlightAngleFromAnomaly([100.0, 120.0]))
+
+        with self.assertRaises(TypeError):
+            sweep_engine.sweep(six_02.solveForFreeFlightAngle, {'Q_bo': self.qSweep})
+
+    def test_Cache(self):
+        """
+        A repeated sweep is read back from the cache, a different grid is computed again.
+        """
+        calls = []
+
+        def counted(Q_bo, FPA_bo):
+            calls.append(1)
+            return six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ(Q_bo, FPA_bo)
+
+        with tempfile.TemporaryDirectory() as directory:
+            first = sweep_engine.sweep(counted, {'Q_bo': self.qSweep, 'FPA_bo': self.fpaSweep}, cacheDirectory=directory)
+            second = sweep_engine.sweep(counted, {'Q_bo': self.qSweep, 'FPA_bo': self.fpaSweep}, cacheDirectory=directory)
+            self.assertEqual(len(calls), 1)
+            self.assertTrue(second.isCached())
+            numpy.testing.assert_array_equal(first.getValues(), second.getValues())
+
+            sweep_engine.sweep(counted, {'Q_bo': self.qSweep, 'FPA_bo': self.fpaSweep + 0.5}, cacheDirectory=directory)
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(len([name for name in os.listdir(directory) if name.endswith('.npz')]), 2)
+
+    def test_CacheKeys(self):
+        """
+        Fixed arrays are keyed on every element, not on their (elided) repr, and keys are stable.
+        """
+        function = six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ
+        grid = {'FPA_bo': numpy.linspace(1.0, 89.0, 1200)}
+        Q_bo = numpy.full(1200, 0.5)
+        changed = Q_bo.copy()
+        changed[1000] = 1.5
+
+        with tempfile.TemporaryDirectory() as directory:
+            sweep_engine.sweep(function, grid, {'Q_bo': Q_bo}, cacheDirectory=directory)
+            result = sweep_engine.sweep(function, grid, {'Q_bo': changed}, cacheDirectory=directory)
+            self.assertFalse(result.isCached())
+            numpy.testing.assert_array_equal(result.getValues(), function(changed, grid['FPA_bo']))
+
+        self.assertEqual(sweep_engine._cacheKey(function, grid, {'Q_bo': Q_bo}),
+                         sweep_engine._cacheKey(function, grid, {'Q_bo': Q_bo.copy()}))
+        self.assertNotEqual(sweep_engine._cacheKey(function, grid, {'Q_bo': Q_bo}),
+                            sweep_engine._cacheKey(function, grid, {'Q_bo': Q_bo.astype(numpy.float32)}))
+
+    @unittest.skipUnless(importlib.util.find_spec('pandas'), "pandas is not installed")
+    def test_DataFrame(self):
+        result = sweep_engine.sweep(six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ,
+                                    {'Q_bo': self.qSweep, 'FPA_bo': self.fpaSweep})
+
+        wide = result.toDataFrame(x='FPA_bo')
+        self.assertEqual(wide.shape, (self.fpaSweep.size, len(self.qSweep)))
+        numpy.testing.assert_array_equal(wide['Q_bo = 0.6'].to_numpy(), result.getValues()[1])
+
+        long = result.toDataFrame()
+        self.assertEqual(long.shape, (self.fpaSweep.size * len(self.qSweep), 1))
+
+    @unittest.skipUnless(importlib.util.find_spec('matplotlib'), "matplotlib is not installed")
+    def test_SavePlot(self):
+        """
+        Charts are written without a display, in the format of the file extension.
+        """
+        result = sweep_engine.sweep(six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ,
+                                    {'Q_bo': self.qSweep, 'FPA_bo': self.fpaSweep})
+
+        with tempfile.TemporaryDirectory() as directory:
+            png = os.path.join(directory, 'range.png')
+            svg = os.path.join(directory, 'range.svg')
+            result.savePlot(png, x='FPA_bo')
+            result.savePlot(svg, x='FPA_bo')
+
+            with open(png, 'rb') as file:
+                self.assertEqual(file.read(8), b'\x89PNG\r\n\x1a\n')
+            with open(svg) as file:
+                self.assertIn('<svg', file.read())
+
+
+def suite():
+    suite = unittest.TestSuite()
+    suite.addTest(SweepEngineTests('test_MatchesBroadcast'))
+    suite.addTest(SweepEngineTests('test_NamedOutputs'))
+    suite.addTest(SweepEngineTests('test_PositionalEntryPoint'))
+    suite.addTest(SweepEngineTests('test_Cache'))
+    suite.addTest(SweepEngineTests('test_CacheKeys'))
+    suite.addTest(SweepEngineTests('test_DataFrame'))
+    suite.addTest(SweepEngineTests('test_SavePlot'))
+
+    return suite
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,382 @@
+"""
+Local asyncio service answering Chapter 6 solver requests, one trajectory per request.
+
+Requests that arrive within `window` seconds of each other for the same method and units are coalesced into
+one call of the array solvers, so many concurrent single-trajectory clients cost about as much as one batch.
+Every message is a JSON object, one per line (or, with `codec='msgpack'`, a msgpack map behind a 4 byte
+big-endian length):
+
+    {"id": 1, "method": "evaluate", "params": {"r_bo": 1.1, "v_bo": 0.905, "fpa_bo": 30.0, "units": "CANONICAL"}}
+    {"id": 1, "result": {"Q_bo": 0.9009..., "freeFlightAngle": 103.2..., ...}}
+
+Errors come back as `{"id": 1, "error": "..."}` and NaN or infinite results as null.  `units` defaults to CANONICAL.
+The methods are listed in `methods`; `stats` returns the request count, batch sizes, latency percentiles and
+throughput of the service.
+
+    python -m bmw_test_package.solver_service --port 8765
+    python -m bmw_test_package.solver_service --unix /tmp/bmw.sock
+
+The service only listens on the local host or a Unix socket; msgpack is optional and imported when used.
+"""
+import argparse
+import asyncio
+import collections
+import itertools
+import json
+import math
+import struct
+import sys
+import time
+
+import numpy
+
+from bmw_test_package import batch_evaluator
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized as _six_02
+from six_ballisticMissileTrajectories import six_03_launching_errors_on_range_vectorized as _six_03
+
+methods = {
+    # name: (parameters, array function of the parameters and a ReturnType)
+    'evaluate': (('r_bo', 'v_bo', 'fpa_bo'), batch_evaluator.evaluateChunk),
+    'requiredQ': (('r_bo', 'v_bo'), lambda r_bo, v_bo, returntype: _six_02.solveForNondimentionalParametericParameter621(v_bo, r_bo, returntype)),
+    'freeFlightAngle': (('Q_bo', 'fpa_bo'), lambda Q_bo, fpa_bo, returntype: _six_02.solveForFreeFlightAngleFromQ(Q_bo, fpa_bo)),
+    'flightPathAngles': (('Q_bo', 'freeFlightRange'), lambda Q_bo, freeFlightRange, returntype: _six_02.solveForFlightPathAngle(freeFlightRange, Q_bo)),
+    'influenceCoefficients': (('r_bo', 'v_bo', 'fpa_bo'), _six_03.solveForInfluenceCoefficients),
+}
+"""
+Methods served in batches.  `flightPathAngles` gives the [low, high] burnout flight path angles (equation 6.2-16),
+`influenceCoefficients` the fields of `InfluenceCoefficients`, `evaluate` the `batch_evaluator.resultColumns`.
+"""
+
+defaultWindow = 0.002
+defaultMaxBatch = 4096
+
+
+def _jsonValue(value):
+    value = value.item() if isinstance(value, numpy.generic) else value
+    # NaN and infinity are not valid JSON
+    return None if isinstance(value, float) and not math.isfinite(value) else value
+
+
+def _splitResults(result, count: int) -> list:
+    # one JSON-ready result per element of a batch
+    if isinstance(result, dict):
+        names, values = list(result), [numpy.broadcast_to(value, (count,)) for value in result.values()]
+    elif hasattr(result, '_fields'):
+        names, values = list(result._fields), [numpy.broadcast_to(value, (count,)) for value in result]
+    elif isinstance(result, tuple):
+        columns = [numpy.broadcast_to(value, (count,)) for value in result]
+        return [[_jsonValue(column[i]) for column in columns] for i in range(count)]
+    else:
+        values = numpy.broadcast_to(result, (count,))
+        return [_jsonValue(values[i]) for i in range(count)]
+    return [{name: _jsonValue(column[i]) for name, column in zip(names, values)} for i in range(count)]
+
+
+class ServiceStats():
+    """
+    Counters and recent latencies of a `SolverService`
+    """
+
+    def __init__(self, latencySamples: int = 10000):
+        self._start = time.perf_counter()
+        self._requests = 0
+        self._errors = 0
+        self._batches = 0
+        self._batchedRequests = 0
+        self._largestBatch = 0
+        self._latencies = collections.deque(maxlen=latencySamples)
+
+    def recordBatch(self, size: int):
+        self._batches += 1
+        self._batchedRequests += size
+        self._largestBatch = max(self._largestBatch, size)
+
+    def recordRequest(self, latency: float, failed: bool = False):
+        self._requests += 1
+        self._errors += failed
+        self._latencies.append(latency)
+
+    def getRequests(self) -> int:
+        return self._requests
+
+    def getBatches(self) -> int:
+        return self._batches
+
+    def getLatencyPercentile(self, percentile: float) -> float:
+        """
+        Latency (seconds) from the arrival of a request to its response, over the most recent requests
+        """
+        if not self._latencies:
+            return math.nan
+        return float(numpy.percentile(numpy.fromiter(self._latencies, float), percentile))
+
+    def toDict(self) -> dict:
+        uptime = time.perf_counter() - self._start
+        return {'requests': self._requests,
+                'errors': self._errors,
+                'batches': self._batches,
+                'meanBatchSize': self._batchedRequests / self._batches if self._batches else 0.0,
+                'largestBatch': self._largestBatch,
+                'latencyP50': _jsonValue(self.getLatencyPercentile(50.0)),
+                'latencyP99': _jsonValue(self.getLatencyPercentile(99.0)),
+                'uptime': uptime,
+                'requestsPerSecond': self._requests / uptime if uptime > 0.0 else 0.0}
+
+
+class _JsonCodec():
+
+    @staticmethod
+    async def read(reader: asyncio.StreamReader):
+        line = await reader.readline()
+        while line and not line.strip():
+            line = await reader.readline()
+        return json.loads(line) if line else None
+
+    @staticmethod
+    def write(writer: asyncio.StreamWriter, message: dict):
+        writer.write(json.dumps(message, allow_nan=False).encode() + b'\n')
+
+
+class _MsgpackCodec():
+
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+
+    async def read(self, reader: asyncio.StreamReader):
+        try:
+            header = await reader.readexactly(4)
+        except asyncio.IncompleteReadError:
+            return None
+        return self._msgpack.unpackb(await reader.readexactly(struct.unpack('>I', header)[0]))
+
+    def write(self, writer: asyncio.StreamWriter, message: dict):
+        body = self._msgpack.packb(message)
+        writer.write(struct.pack('>I', len(body)) + body)
+
+
+def _codec(name: str):
+    if name == 'json':
+        return _JsonCodec()
+    elif name == 'msgpack':
+        return _MsgpackCodec()
+    raise ValueError("codec must be 'json' or 'msgpack', not %r" % name)
+
+
+class SolverService():
+    """
+    Serves `methods` over a local socket, coalescing concurrent requests into batches.
+    Args:
+        window (float): seconds the first request of a batch waits for others
+        maxBatch (int): a batch is evaluated as soon as it reaches this many requests
+        codec (str): 'json' (newline-delimited) or 'msgpack' (length-prefixed)
+    """
+
+    def __init__(self, window: float = defaultWindow, maxBatch: int = defaultMaxBatch, codec: str = 'json'):
+        self._window = window
+        self._maxBatch = maxBatch
+        self._codec = _codec(codec)
+        self._stats = ServiceStats()
+        self._pending = {}
+        self._server = None
+
+    def getStats(self) -> ServiceStats:
+        return self._stats
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> int:
+        """
+        Listens on a local TCP port (0 picks a free one)
+
+        Returns:
+            int: the port listened on
+        """
+        self._server = await asyncio.start_server(self._handleConnection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def startUnix(self, path: str):
+        """
+        Listens on a Unix socket
+        """
+        self._server = await asyncio.start_unix_server(self._handleConnection, path)
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serveForever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def submit(self, method: str, params: dict):
+        """
+        Solves one request, batched with the other requests waiting for the same method and units
+        """
+        if method == 'stats':
+            return self._stats.toDict()
+        if method not in methods:
+            raise ValueError("Unknown method %r, expected one of %s" % (method, ', '.join(sorted(methods) + ['stats'])))
+        names, _ = methods[method]
+        missing = [name for name in names if name not in params]
+        if missing:
+            raise ValueError("%s needs %s" % (method, ', '.join(missing)))
+        units = str(params.get('units', 'CANONICAL')).upper()
+        if units not in ReturnType.__members__:
+            raise ValueError("Unknown units %r" % params['units'])
+
+        key = (method, units)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            asyncio.get_running_loop().call_later(self._window, self._flush, key, batch)
+        future = asyncio.get_running_loop().create_future()
+        batch.append(([float(params[name]) for name in names], future))
+        if len(batch) >= self._maxBatch:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: tuple, batch: list):
+        # runs once per batch: when the window closes or when the batch is full, whichever comes first
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+        method, units = key
+        names, function = methods[method]
+        arguments = numpy.array([values for values, _ in batch], dtype=float).T
+        self._stats.recordBatch(len(batch))
+        try:
+            results = _splitResults(function(*arguments, ReturnType[units]), len(batch))
+        except Exception as exception:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exception)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _answer(self, message: dict, writer: asyncio.StreamWriter):
+        start = time.perf_counter()
+        response = {'id': message.get('id')}
+        try:
+            response['result'] = await self.submit(message.get('method'), message.get('params') or {})
+        except Exception as exception:
+            response['error'] = "%s: %s" % (type(exception).__name__, exception)
+        self._stats.recordRequest(time.perf_counter() - start, 'error' in response)
+        if not writer.is_closing():
+            self._codec.write(writer, response)
+
+    async def _handleConnection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        tasks = set()
+        try:
+            while True:
+                try:
+                    message = await self._codec.read(reader)
+                except (ValueError, UnicodeDecodeError) as exception:
+                    self._codec.write(writer, {'id': None, 'error': "bad message: %s" % exception})
+                    continue
+                if message is None:
+                    break
+                if not isinstance(message, dict):
+                    self._codec.write(writer, {'id': None, 'error': "bad message: not an object"})
+                    continue
+                # each request is answered on its own, so one connection can have many requests in one batch
+                task = asyncio.create_task(self._answer(message, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                await writer.drain()
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class SolverClient():
+    """
+    Asyncio client of a `SolverService`; any number of calls may be awaited at once over one connection.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, codec: str = 'json'):
+        self._reader = reader
+        self._writer = writer
+        self._codec = _codec(codec)
+        self._ids = itertools.count(1)
+        self._waiting = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, host: str = '127.0.0.1', port: int = 8765, codec: str = 'json') -> 'SolverClient':
+        return cls(*await asyncio.open_connection(host, port), codec=codec)
+
+    @classmethod
+    async def connectUnix(cls, path: str, codec: str = 'json') -> 'SolverClient':
+        return cls(*await asyncio.open_unix_connection(path), codec=codec)
+
+    async def call(self, method: str, **params):
+        """
+        Sends one request and waits for its result; a service error is raised as a RuntimeError
+        """
+        requestId = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[requestId] = future
+        self._codec.write(self._writer, {'id': requestId, 'method': method, 'params': params})
+        await self._writer.drain()
+        response = await future
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response['result']
+
+    async def _receive(self):
+        try:
+            while True:
+                response = await self._codec.read(self._reader)
+                if response is None:
+                    break
+                future = self._waiting.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("connection to the solver service closed"))
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+        await self._receiver
+
+
+async def _serve(args):
+    service = SolverService(args.window_ms / 1e3, args.max_batch, args.codec)
+    if args.unix:
+        await service.startUnix(args.unix)
+        print("listening on %s" % args.unix, file=sys.stderr)
+    else:
+        port = await service.start(args.host, args.port)
+        print("listening on %s:%d" % (args.host, port), file=sys.stderr)
+    await service.serveForever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the Chapter 6 solvers on a local socket, batching concurrent requests")
+    parser.add_argument('--host', default='127.0.0.1', help="local address to listen on")
+    parser.add_argument('--port', type=int, default=8765, help="TCP port")
+    parser.add_argument('--unix', default=None, help="listen on this Unix socket instead of TCP")
+    parser.add_argument('--window-ms', type=float, default=defaultWindow * 1e3, help="milliseconds a batch waits for requests")
+    parser.add_argument('--max-batch', type=int, default=defaultMaxBatch, help="largest batch")
+    parser.add_argument('--codec', choices=('json', 'msgpack'), default='json', help="message encoding")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 
 
+from fractions import Fraction
 from typing import Callable
 
 # Python migration of constant variables from Java source.
@@ -262,3 +263,103 @@ def convertDEG2KM(deg: float) -> float:
     :rtype:
     """
     return DEG2KM(deg)
+
+
+# Unit registry for converting whole arrays.  Every unit is registered with its dimension and the factor that
+# takes it to canonical units (DU, TU and DU/TU), so any two units of one dimension convert with a single
+# multiply.  Degrees are degrees of central angle as a distance, 60 nautical miles each like `DEG2NM`.
+unitFactors = {
+    'length': {'DU': 1.0, 'ft': ft2c, 'mi': mi2c, 'nm': nm2c, 'km': km2c, 'deg': degrees2NauticalMiles * nm2c},
+    'time': {'TU': 1.0, 'sec': sec2c},
+    'velocity': {'DU/TU': 1.0, 'ft/sec': ftPerSec2c, 'km/sec': kmPerSec2c},
+}
+
+# The English and metric units are related exactly by definition (1 ft = 0.3048 m, 1 mi = 5280 ft, 1 nm = 1852 m),
+# so between two of them the factor is composed from these exact factors to m, sec and m/sec, and rounded once,
+# instead of going through the rounded canonical constants above.  Only conversions to or from DU, TU and DU/TU
+# use `unitFactors`.
+exactFactors = {
+    'length': {'ft': Fraction('0.3048'), 'mi': 5280 * Fraction('0.3048'), 'nm': Fraction(1852), 'km': Fraction(1000),
+               'deg': 60 * Fraction(1852)},
+    'time': {'sec': Fraction(1)},
+    'velocity': {'ft/sec': Fraction('0.3048'), 'km/sec': Fraction(1000)},
+}
+_fusedFactors = {}
+
+
+def _findUnit(unit: str) -> (str, float):
+    for dimension, factors in unitFactors.items():
+        if unit in factors:
+            return dimension, factors[unit]
+    raise ValueError("Unknown unit: %s" % unit)
+
+
+def getConversionFactor(fromUnit: str, toUnit: str) -> float:
+    """
+    This fuses a conversion into one factor, e.g. ft/sec to km/sec without a separate trip through canonical units.
+    Units are the names in `unitFactors`.  Between English and metric units the factor is exact (`exactFactors`);
+    only conversions involving DU, TU or DU/TU use the canonical constants.  Factors are cached, so looking one up
+    in a loop is one dictionary access.
+    :param fromUnit: unit the values are in
+    :type fromUnit: str
+    :param toUnit: unit wanted
+    :type toUnit: str
+    :return: factor to multiply values in `fromUnit` by
+    :rtype: float
+    """
+    key = (fromUnit, toUnit)
+    factor = _fusedFactors.get(key)
+    if factor is None:
+        fromDimension, fromFactor = _findUnit(fromUnit)
+        toDimension, toFactor = _findUnit(toUnit)
+        if fromDimension != toDimension:
+            raise ValueError("Cannot convert %s (%s) to %s (%s)" % (fromUnit, fromDimension, toUnit, toDimension))
+        exact = exactFactors[fromDimension]
+        if fromUnit == toUnit:
+            factor = 1.0
+        elif fromUnit in exact and toUnit in exact:
+            factor = float(exact[fromUnit] / exact[toUnit])
+        else:
+            factor = fromFactor / toFactor
+        _fusedFactors[key] = factor
+    return factor
+
+
+def convert(values, fromUnit: str, toUnit: str, inPlace: bool = False):
+    """
+    This converts a float or a whole array of values with a single fused multiply.
+    :param values: float, or anything supporting `*` and `*=` with a float such as an ndarray or a pandas Series
+    :param fromUnit: unit the values are in
+    :type fromUnit: str
+    :param toUnit: unit wanted
+    :type toUnit: str
+    :param inPlace: multiply a float array in place instead of allocating a new one
+    :type inPlace: bool
+    :return: converted values (`values` itself when converted in place)
+    """
+    factor = getConversionFactor(fromUnit, toUnit)
+    if inPlace:
+        values *= factor
+        return values
+    return values * factor
+
+
+def convertColumns(table, unitSpec: dict, inPlace: bool = False):
+    """
+    This converts the columns of a structured ndarray or a pandas DataFrame from a unit spec.
+    :param table: structured ndarray, DataFrame, or dictionary of float arrays
+    :param unitSpec: column name -> (fromUnit, toUnit), e.g. `{'v_bo': ('ft/sec', 'DU/TU')}`
+    :type unitSpec: dict
+    :param inPlace: convert the columns of `table` itself instead of a copy
+    :type inPlace: bool
+    :return: the converted table
+    """
+    if not inPlace:
+        table = table.copy()
+        for column, (fromUnit, toUnit) in unitSpec.items():
+            table[column] = table[column] * getConversionFactor(fromUnit, toUnit)
+        return table
+
+    for column, (fromUnit, toUnit) in unitSpec.items():
+        table[column] *= getConversionFactor(fromUnit, toUnit)
+    return table
@@ -1,12 +1,11 @@
+import math
 from enum import Enum
 
-import numpy as np
-
 
 class EarthConstants():
     _name = ''
-    _mu = np.NaN
-    _radius = np.NaN
+    _mu = math.nan
+    _radius = math.nan
 
     def __init__(self, name, mu, radius):
         self._name = name
@@ -1,4 +1,5 @@
 import math
+import sys
 
 from constants import trig
 
@@ -17,3 +18,80 @@ def solveforEccentricAnomoly(e: float, v: float) -> float:
     cosV = math.cos(v * trig.degrees2radians)
     tmp = (e + cosV)/(1.0 + e*cosV)
     return math.acos(tmp)*trig.radians2degrees
+
+
+def solveForMeanAnomaly(e: float, capE: float) -> float:
+    """
+    This solves Kepler's equation M = E - e sin(E) for the mean anomaly.
+    This is based on section 4.2 of the BMW book
+    :param e: eccentricity
+    :type e: float
+    :param capE: eccentric anomaly (degrees)
+    :type capE: float
+    :return: mean anomaly (degrees)
+    :rtype: float
+    """
+    ERads = capE * trig.degrees2radians
+    return (ERads - e*math.sin(ERads))*trig.radians2degrees
+
+
+def solveForEccentricAnomalyFromMeanAnomaly(e: float, meanAnomaly: float, tolerance: float = 1e-12, maxIterations: int = 16) -> float:
+    """
+    This solves Kepler's equation for the eccentric anomaly, i.e. position as a function of time, with
+    Halley's method from Danby's starting guess (from a cubic expansion of Kepler's equation for e near 1
+    and M near 0).  Any number of turns is kept: M = 400 gives E > 360.
+    This is based on section 4.2 of the BMW book
+    :param e: eccentricity, 0 <= e < 1
+    :type e: float
+    :param meanAnomaly: mean anomaly (degrees)
+    :type meanAnomaly: float
+    :param tolerance: size of the last correction (degrees) at which E counts as converged, unless rounding
+        error of Kepler's equation is larger
+    :type tolerance: float
+    :param maxIterations: iteration cap
+    :type maxIterations: int
+    :return: eccentric anomaly (degrees), NaN if e is outside of [0, 1) or E did not converge
+    :rtype: float
+    """
+    if not 0.0 <= e < 1.0 or not math.isfinite(meanAnomaly):
+        return math.nan
+
+    M = meanAnomaly * trig.degrees2radians
+    turns = math.floor((M + math.pi) / (2.0*math.pi))
+    M -= 2.0*math.pi*turns
+    toleranceRads = tolerance * trig.degrees2radians
+
+    if e > 0.8 and abs(M) < 1.0:
+        # real root of (e/6) E^3 + (1 - e) E = |M| (Cardano), where Danby's guess is far off
+        p = 6.0*(1.0 - e)/e
+        q = 6.0*abs(M)/e
+        w = (0.5*q + math.sqrt(0.25*q*q + p*p*p/27.0))**(1.0/3.0)
+        capE = math.copysign(w - p/(3.0*w), M) if w > 0.0 else 0.0
+    else:
+        capE = M + math.copysign(0.85*e, math.sin(M))
+    for _ in range(maxIterations):
+        eSinE = e*math.sin(capE)
+        f = capE - eSinE - M
+        fPrime = 1.0 - e*math.cos(capE)
+        step = f / (fPrime - 0.5*f*eSinE/fPrime)
+        capE -= step
+        # converged, or down to the rounding error of Kepler's equation itself
+        if abs(step) <= max(toleranceRads, 4.0*sys.float_info.epsilon*(abs(capE) + abs(M))/fPrime):
+            return (capE + 2.0*math.pi*turns)*trig.radians2degrees
+    return math.nan
+
+
+def solveForTrueAnomalyFromEccentricAnomaly(e: float, capE: float) -> float:
+    """
+    This converts the eccentric anomaly to the true anomaly, keeping the turn: E in [0, 360) gives v in [0, 360).
+    This inverts equation 4.2-8 from the BMW book
+    :param e: eccentricity
+    :type e: float
+    :param capE: eccentric anomaly (degrees)
+    :type capE: float
+    :return: true anomaly (degrees)
+    :rtype: float
+    """
+    ERads = capE * trig.degrees2radians
+    beta = e / (1.0 + math.sqrt(1.0 - e*e))
+    return (ERads + 2.0*math.atan2(beta*math.sin(ERads), 1.0 - beta*math.cos(ERads)))*trig.radians2degrees
@@ -0,0 +1,116 @@
+import numpy
+
+from constants import trig
+
+_epsilon = numpy.finfo(float).eps
+
+
+def solveforEccentricAnomoly(e: numpy.ndarray, v: numpy.ndarray) -> numpy.ndarray:
+    """
+    This is the array version of `four_02_time_of_flight_eccentric_anomoly.solveforEccentricAnomoly`.
+    This is based on the equation 4.2-8 from the BMW book
+    :param e: eccentricity
+    :type e: numpy.ndarray
+    :param v: True anomaly
+    :type v: numpy.ndarray
+    :return: eccentric anomaly
+    :rtype: numpy.ndarray
+    """
+    e = numpy.asarray(e, dtype=float)
+    cosV = numpy.cos(numpy.asarray(v, dtype=float) * trig.degrees2radians)
+    tmp = (e + cosV)/(1.0 + e*cosV)
+    with numpy.errstate(invalid='ignore'):
+        return numpy.arccos(tmp)*trig.radians2degrees
+
+
+def solveForMeanAnomaly(e: numpy.ndarray, capE: numpy.ndarray) -> numpy.ndarray:
+    """
+    This is the array version of `four_02_time_of_flight_eccentric_anomoly.solveForMeanAnomaly`.
+    This is based on section 4.2 of the BMW book
+    :param e: eccentricity
+    :type e: numpy.ndarray
+    :param capE: eccentric anomaly (degrees)
+    :type capE: numpy.ndarray
+    :return: mean anomaly (degrees)
+    :rtype: numpy.ndarray
+    """
+    ERads = numpy.asarray(capE, dtype=float) * trig.degrees2radians
+    return (ERads - numpy.asarray(e, dtype=float)*numpy.sin(ERads))*trig.radians2degrees
+
+
+def _cubicStartingGuess(e: numpy.ndarray, M: numpy.ndarray) -> numpy.ndarray:
+    # real root of (e/6) E^3 + (1 - e) E = |M| (Cardano), where Danby's guess is far off: e near 1 and M near 0
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        p = 6.0*(1.0 - e)/e
+        q = 6.0*numpy.abs(M)/e
+        w = numpy.cbrt(0.5*q + numpy.sqrt(0.25*q*q + p*p*p/27.0))
+        return numpy.sign(M)*(w - p/(3.0*w))
+
+
+def solveForEccentricAnomalyFromMeanAnomaly(e: numpy.ndarray, meanAnomaly: numpy.ndarray, tolerance: float = 1e-12,
+                                            maxIterations: int = 16) -> numpy.ndarray:
+    """
+    This is the array version of `four_02_time_of_flight_eccentric_anomoly.solveForEccentricAnomalyFromMeanAnomaly`.
+    Every element stops iterating as soon as its own correction is below `tolerance`, so a few slow elements
+    (e near 1 and M near 0) do not cost a pass over the whole array.
+    This is based on section 4.2 of the BMW book
+    :param e: eccentricity, 0 <= e < 1
+    :type e: numpy.ndarray
+    :param meanAnomaly: mean anomaly (degrees)
+    :type meanAnomaly: numpy.ndarray
+    :param tolerance: size of the last correction (degrees) at which E counts as converged, unless rounding
+        error of Kepler's equation is larger
+    :type tolerance: float
+    :param maxIterations: iteration cap
+    :type maxIterations: int
+    :return: eccentric anomaly (degrees), NaN where e is outside of [0, 1) or E did not converge
+    :rtype: numpy.ndarray
+    """
+    e, M = numpy.broadcast_arrays(numpy.asarray(e, dtype=float), numpy.asarray(meanAnomaly, dtype=float) * trig.degrees2radians)
+    shape = M.shape
+    e = e.reshape(-1)
+    M = M.reshape(-1)
+
+    turns = numpy.floor((M + numpy.pi) / (2.0*numpy.pi))
+    M = M - 2.0*numpy.pi*turns
+    toleranceRads = tolerance * trig.degrees2radians
+
+    capE = numpy.where((e > 0.8) & (numpy.abs(M) < 1.0), _cubicStartingGuess(e, M), M + 0.85*e*numpy.sign(numpy.sin(M)))
+    converged = numpy.zeros(M.shape, dtype=bool)
+    active = numpy.flatnonzero((e >= 0.0) & (e < 1.0) & numpy.isfinite(M))
+    for _ in range(maxIterations):
+        if active.size == 0:
+            break
+        activeE = capE[active]
+        activeEcc = e[active]
+        eSinE = activeEcc*numpy.sin(activeE)
+        f = activeE - eSinE - M[active]
+        fPrime = 1.0 - activeEcc*numpy.cos(activeE)
+        step = f / (fPrime - 0.5*f*eSinE/fPrime)
+        capE[active] = activeE - step
+
+        # converged, or down to the rounding error of Kepler's equation itself
+        done = numpy.abs(step) <= numpy.maximum(toleranceRads, 4.0*_epsilon*(numpy.abs(activeE) + numpy.abs(M[active]))/fPrime)
+        converged[active[done]] = True
+        active = active[~done]
+
+    capE = numpy.where(converged, capE + 2.0*numpy.pi*turns, numpy.nan)
+    return (capE*trig.radians2degrees).reshape(shape)
+
+
+def solveForTrueAnomalyFromEccentricAnomaly(e: numpy.ndarray, capE: numpy.ndarray) -> numpy.ndarray:
+    """
+    This is the array version of `four_02_time_of_flight_eccentric_anomoly.solveForTrueAnomalyFromEccentricAnomaly`.
+    This inverts equation 4.2-8 from the BMW book
+    :param e: eccentricity
+    :type e: numpy.ndarray
+    :param capE: eccentric anomaly (degrees)
+    :type capE: numpy.ndarray
+    :return: true anomaly (degrees)
+    :rtype: numpy.ndarray
+    """
+    e = numpy.asarray(e, dtype=float)
+    ERads = numpy.asarray(capE, dtype=float) * trig.degrees2radians
+    with numpy.errstate(invalid='ignore'):
+        beta = e / (1.0 + numpy.sqrt(1.0 - e*e))
+    return (ERads + 2.0*numpy.arctan2(beta*numpy.sin(ERads), 1.0 - beta*numpy.cos(ERads)))*trig.radians2degrees
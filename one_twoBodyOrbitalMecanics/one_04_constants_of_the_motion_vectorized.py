@@ -0,0 +1,89 @@
+import numpy
+
+from constants import earth, trig
+from constants.earth import ReturnType
+
+
+def solveForSpecificMechanicalEnergy(v: numpy.ndarray, r: numpy.ndarray, returntype: ReturnType) -> numpy.ndarray:
+    """
+This is the array version of `one_04_constants_of_the_motion.solveForSpecificMechanicalEnergy`.
+This is based on the equation 1.4-2 from the BMW book
+    :param v: velocity
+    :type v: numpy.ndarray
+    :param r: radius
+    :type r: numpy.ndarray
+    :param returntype: what unit type are the inputs and outputs to be provided in
+    :type returntype: ReturnType
+    :return: mechanical energy
+    :rtype: numpy.ndarray
+    """
+    v = numpy.asarray(v, dtype=float)
+    return (v*v/2.0) - (earth.getMu(returntype) / numpy.asarray(r, dtype=float))
+
+
+def solveForVelocityFromSpecificEnergy(energy: numpy.ndarray, r: numpy.ndarray, type: ReturnType) -> numpy.ndarray:
+    """
+This is the array version of `one_04_constants_of_the_motion.solveForVelocityFromSpecificEnergy`.
+This is based on equation 1.4-2 from the BMW book.  Energies too low to reach `r` give NaN.
+    :param energy: Specific energy
+    :type energy: numpy.ndarray
+    :param r: Radius
+    :type r: numpy.ndarray
+    :param type: what unit type are the inputs and outputs
+    :type type: ReturnType
+    :return: Velocity in specified units
+    :rtype: numpy.ndarray
+    """
+    toRoot = 2.0 * (earth.getMu(type)/numpy.asarray(r, dtype=float) + numpy.asarray(energy, dtype=float))
+    with numpy.errstate(invalid='ignore'):
+        return numpy.sqrt(toRoot)
+
+
+def solveForAngularMomentum(v: numpy.ndarray, r: numpy.ndarray) -> numpy.ndarray:
+    """
+This is the array version of `one_04_constants_of_the_motion.solveForAngularMomentum`.
+This is based on the equation 1.4-3 from BMW
+    :param v: Velocity
+    :type v: numpy.ndarray
+    :param r: radius
+    :type r: numpy.ndarray
+    :return: angualr velocity
+    :rtype: numpy.ndarray
+    """
+    return numpy.asarray(v, dtype=float)*numpy.asarray(r, dtype=float)
+
+
+def solveForAngularmoment(v: numpy.ndarray, r: numpy.ndarray, FPA: numpy.ndarray) -> numpy.ndarray:
+    """
+This is the array version of `one_04_constants_of_the_motion.solveForAngularmoment`.
+This is based on equation 1.4-4 in BMW
+    :param v: velocity
+    :type v: numpy.ndarray
+    :param r: radius
+    :type r: numpy.ndarray
+    :param FPA: flight path angle (degrees)
+    :type FPA: numpy.ndarray
+    :return: angular momentum
+    :rtype: numpy.ndarray
+    """
+    fpa_in_rad = numpy.asarray(FPA, dtype=float) * trig.degrees2radians
+    return numpy.asarray(v, dtype=float) * numpy.asarray(r, dtype=float) * numpy.cos(fpa_in_rad)
+
+
+def solveForFPAFromAngularMomentum(h: numpy.ndarray, v: numpy.ndarray, r: numpy.ndarray) -> numpy.ndarray:
+    """
+This is the array version of `one_04_constants_of_the_motion.solveForFPAFromAngularMomentum`.
+This is a reorganization of the equation 1.4-4 solving for FPA vs h in the BMW book.  h > rv gives NaN.
+    :param h: Angular Momentum
+    :type h: numpy.ndarray
+    :param v: Velocity
+    :type v: numpy.ndarray
+    :param r: radius
+    :type r: numpy.ndarray
+    :return: FPA (degrees)
+    :rtype: numpy.ndarray
+    """
+    rv = numpy.asarray(r, dtype=float) * numpy.asarray(v, dtype=float)
+    hOverRV = numpy.asarray(h, dtype=float)/rv
+    with numpy.errstate(invalid='ignore'):
+        return numpy.arccos(hOverRV) * trig.radians2degrees
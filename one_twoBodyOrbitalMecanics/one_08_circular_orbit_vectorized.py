@@ -0,0 +1,18 @@
+import numpy
+
+from constants import earth
+from constants.earth import ReturnType
+
+
+def circularSatelliteSpeed(r: numpy.ndarray, type: ReturnType) -> numpy.ndarray:
+    """
+This is the array version of `one_08_circular_orbit.circularSatelliteSpeed`.
+This is based on equation 1.8-2 from the BMW book
+    :param r: radius or circular orbit
+    :type r: numpy.ndarray
+    :param type: what unit type are the inputs and outputs
+    :type type: ReturnType
+    :return: circular satellite speed
+    :rtype: numpy.ndarray
+    """
+    return numpy.sqrt(earth.getMu(type) / numpy.asarray(r, dtype=float))
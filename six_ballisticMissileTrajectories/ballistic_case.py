@@ -0,0 +1,212 @@
+"""
+One burnout state, or a whole array of them, with every Chapter 1 and 6 quantity derived from it on demand.
+
+An analysis such as the example on page 290 chains energy, angular momentum, Q, psi and the range by hand, and
+recomputes Q, a, e and E whenever one input changes.  A `BallisticCase` holds the burnout inputs and evaluates a
+quantity the first time it is asked for, together with whatever it depends on, then keeps it:
+
+    case = BallisticCase(r_bo=1.2, v_bo=2.0/3.0, fpa_bo=51.3178, returntype=ReturnType.CANONICAL)
+    case.freeFlightAngle          # evaluates Q_bo, then psi
+    case.eccentricAnomaly         # reuses Q_bo and psi, evaluates e and E
+    case.set(v_bo=0.7)            # forgets everything that depends on v_bo, keeps circularSpeed
+
+The equations are the array versions, so every input may be an array and the quantities are the arrays of the
+whole case set.  `set(where=...)` changes the inputs of some of the cases only, and recomputes the quantities
+already evaluated at those elements only:
+
+    cases.set(where=slice(100, 200), v_bo=newSpeeds)
+
+`quantities` lists each quantity with its equation and the inputs or quantities that it depends on.
+`eccentricAnomaly` is the eccentric anomaly at burnout of any symmetric trajectory (equation 6.2-21), and
+equation 6.2-22 gives the time of flight from it, a and e.  `timeOfFlight` is nonetheless evaluated from the
+burnout state with the atan2 form of `solveForTimeOfFreeFlightFromBurnout`, for its precision near E = 180
+degrees (short flights), where pi - E from the arccos of 6.2-21 loses most of its digits; it recomputes Q, e
+and a for that instead of reusing the cached ones.
+"""
+import collections
+
+import numpy
+
+from constants import earth, trig
+from constants.earth import ReturnType
+from one_twoBodyOrbitalMecanics import one_04_constants_of_the_motion_vectorized, one_08_circular_orbit_vectorized
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories import six_03_launching_errors_on_range_vectorized
+
+inputs = ('r_bo', 'v_bo', 'fpa_bo', 'returntype')
+
+
+def _semiLatusRectum(h, returntype: ReturnType) -> numpy.ndarray:
+    # p = h^2 / mu
+    h = numpy.asarray(h, dtype=float)
+    return h*h / earth.getMu(returntype)
+
+
+def _freeFlightRange(freeFlightAngle, returntype: ReturnType) -> numpy.ndarray:
+    # ground range of the free flight, in the length unit of returntype
+    return numpy.asarray(freeFlightAngle, dtype=float) * trig.degrees2radians * earth.getMeanEquatorialRadius(returntype)
+
+
+_six_02 = six_02_general_ballistic_missile_problem_vectorized
+_six_03 = six_03_launching_errors_on_range_vectorized
+
+# name: (equation, arguments), each listed after the quantities that it depends on
+quantities = {
+    'energy': (one_04_constants_of_the_motion_vectorized.solveForSpecificMechanicalEnergy, ('v_bo', 'r_bo', 'returntype')),
+    'angularMomentum': (one_04_constants_of_the_motion_vectorized.solveForAngularmoment, ('v_bo', 'r_bo', 'fpa_bo')),
+    'circularSpeed': (one_08_circular_orbit_vectorized.circularSatelliteSpeed, ('r_bo', 'returntype')),
+    'Q_bo': (_six_02.solveForNondimentionalParametericParameter621, ('v_bo', 'r_bo', 'returntype')),
+    'semiMajorAxis': (_six_02.solveForSemiMajorAxis, ('r_bo', 'Q_bo')),
+    'eccentricity': (_six_02.solveForEccentricity, ('Q_bo', 'fpa_bo')),
+    'semiLatusRectum': (_semiLatusRectum, ('angularMomentum', 'returntype')),
+    'freeFlightAngle': (_six_02.solveForFreeFlightAngleFromQ, ('Q_bo', 'fpa_bo')),
+    'freeFlightRange': (_freeFlightRange, ('freeFlightAngle', 'returntype')),
+    # eccentric anomaly at burnout of any symmetric trajectory; timeOfFlight uses the atan2 form instead, which
+    # keeps its precision near E = 180 (short flights)
+    'eccentricAnomaly': (_six_02.solveForEccentricAnomalyFromMaxRange, ('eccentricity', 'freeFlightAngle')),
+    'timeOfFlight': (_six_02.solveForTimeOfFreeFlightFromBurnout, ('r_bo', 'v_bo', 'fpa_bo', 'returntype')),
+    'icFPAError': (_six_03.solveForInfluenceCoefficientFPAError, ('freeFlightAngle', 'fpa_bo')),
+    'icBurnoutHeight': (_six_03.solveForInfluenceCoefficientBurnoutHeight,
+                        ('r_bo', 'v_bo', 'fpa_bo', 'freeFlightAngle', 'returntype')),
+    'icBurnoutVelocity': (_six_03.solveForInfluenceCoefficientBurnoutVelocity,
+                          ('r_bo', 'v_bo', 'fpa_bo', 'freeFlightAngle', 'returntype')),
+}
+
+
+def _findDependents() -> dict:
+    # every quantity that has to be forgotten when an input or a quantity changes, in the order of `quantities`
+    dependents = {name: [] for name in inputs + tuple(quantities)}
+    for name, (_, arguments) in quantities.items():
+        for argument in arguments:
+            for changed in [argument] + [upstream for upstream, names in dependents.items() if argument in names]:
+                if name not in dependents[changed]:
+                    dependents[changed].append(name)
+    order = list(quantities)
+    return {name: tuple(sorted(names, key=order.index)) for name, names in dependents.items()}
+
+
+_dependents = _findDependents()
+
+
+class BallisticCase():
+    """
+    Burnout radius, velocity, flight path angle (degrees) and unit system of one case or an array of cases, with
+    the `quantities` evaluated lazily and cached.  The quantities are also attributes, e.g. `case.Q_bo`.
+    Args:
+        r_bo (numpy.ndarray): radius at burnout
+        v_bo (numpy.ndarray): velocity at burnout
+        fpa_bo (numpy.ndarray): flight path angle at burnout (degrees)
+        returntype (ReturnType): How the units are given and expected to return
+    """
+
+    def __init__(self, r_bo, v_bo, fpa_bo, returntype: ReturnType = ReturnType.CANONICAL):
+        self._inputs = {'returntype': returntype}
+        self._cache = {}
+        self._evaluations = collections.Counter()
+        self._setInputs({'r_bo': r_bo, 'v_bo': v_bo, 'fpa_bo': fpa_bo})
+
+    @classmethod
+    def fromStates(cls, states):
+        """
+        Cases for the states of a `burnout_state.BurnoutStateArray`, sharing its columns until they are changed
+        """
+        return cls(states.getR(), states.getV(), states.getFPA(), states.getReturnType())
+
+    def __repr__(self) -> str:
+        return "BallisticCase(%s, %s, cached: %s)" % (self.getShape(), self._inputs['returntype'].name,
+                                                      ", ".join(self._cache) or "none")
+
+    def __getattr__(self, name: str):
+        if name in quantities:
+            return self.get(name)
+        raise AttributeError("%s has no attribute or quantity %r" % (type(self).__name__, name))
+
+    def getShape(self) -> tuple:
+        return numpy.broadcast_shapes(*(numpy.shape(self._inputs[name]) for name in inputs[:-1]))
+
+    def getInput(self, name: str):
+        return self._inputs[name]
+
+    def getReturnType(self) -> ReturnType:
+        return self._inputs['returntype']
+
+    def isCached(self, name: str) -> bool:
+        return name in self._cache
+
+    def getEvaluationCounts(self) -> collections.Counter:
+        """
+        Number of times each quantity has been evaluated, all of it or some of its elements
+        """
+        return collections.Counter(self._evaluations)
+
+    def get(self, name: str):
+        """
+        A quantity, evaluated with the quantities it depends on the first time it is asked for
+        Args:
+            name (str): name in `quantities`
+
+        Returns:
+            numpy.ndarray: the quantity, a numpy.float64 for a single case
+        """
+        value = self._evaluate(name)
+        return value[()] if value.ndim == 0 else value
+
+    def _evaluate(self, name: str) -> numpy.ndarray:
+        if name in self._inputs:
+            return self._inputs[name]
+        value = self._cache.get(name)
+        if value is None:
+            function, arguments = quantities[name]
+            value = numpy.asarray(function(*(self._evaluate(argument) for argument in arguments)))
+            self._evaluations[name] += 1
+            self._cache[name] = value
+        return value
+
+    def _setInputs(self, values: dict):
+        for name, value in values.items():
+            if name not in inputs:
+                raise TypeError("%s is not an input of a BallisticCase, one of %s" % (name, ", ".join(inputs)))
+            self._inputs[name] = value if name == 'returntype' else numpy.asarray(value, dtype=float)
+
+    def set(self, where=None, **values):
+        """
+        Changes inputs and forgets the quantities that depend on them; the others are kept.
+        With `where`, only the selected cases change, and the cached dependents are recomputed at those elements
+        only instead of being forgotten.
+        Args:
+            where: index, slice or boolean mask of the cases to change (all of them when not given)
+            **values: new r_bo, v_bo, fpa_bo or returntype
+        """
+        if where is None:
+            self._setInputs(values)
+            for name in set().union(*(_dependents[changed] for changed in values)):
+                self._cache.pop(name, None)
+            return
+
+        if 'returntype' in values:
+            raise ValueError("the unit system is shared by all of the cases, set it without `where`")
+        shape = self.getShape()
+        if not shape:
+            raise ValueError("`where` selects among an array of cases, this is a single case")
+        updated = {}
+        for name, value in values.items():
+            if name not in inputs:
+                raise TypeError("%s is not an input of a BallisticCase, one of %s" % (name, ", ".join(inputs)))
+            column = numpy.array(numpy.broadcast_to(self._inputs[name], shape), dtype=float)
+            column[where] = value
+            updated[name] = column
+        self._inputs.update(updated)
+
+        # a cached quantity only depends on cached quantities, so going through them in the order of `quantities`
+        # recomputes each one from arguments that are already up to date
+        changed = set().union(*(_dependents[name] for name in values))
+        for name in [name for name in quantities if name in changed and name in self._cache]:
+            function, arguments = quantities[name]
+            selected = (self._inputs['returntype'] if argument == 'returntype' else
+                        numpy.broadcast_to(self._evaluate(argument), shape)[where] for argument in arguments)
+            value = self._cache[name]
+            if value.shape != shape or not value.flags.writeable:
+                value = numpy.array(numpy.broadcast_to(value, shape))
+            value[where] = function(*selected)
+            self._evaluations[name] += 1
+            self._cache[name] = value
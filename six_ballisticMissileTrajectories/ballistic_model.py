@@ -0,0 +1,211 @@
+"""
+The Chapter 1, 4 and 6 equations bound to one set of Earth constants.
+
+The module level equations take a `ReturnType` and look the gravitational parameter up on every call
+(`earth.getMu(returntype)` resolves the enum value and calls a getter).  A `BallisticModel` resolves mu and the
+equatorial radius once, when it is built, so a loop over one unit system does no enum or constants lookups:
+
+    model = BallisticModel(ReturnType.METRIC)
+    for r_bo, v_bo, fpa_bo in states:
+        psi = model.solveForFreeFlightAngleFromBurnout(r_bo, v_bo, fpa_bo)
+
+It also takes a custom `EarthConstants`, e.g. `BallisticModel(EarthConstants('JGM-3', 3.986004415e5, 6378.1363))`.
+
+Every method evaluates its equation with the same operations as the module function of the same name, so the
+results are identical.  Equations that do not depend on the unit system are the module functions themselves.
+"""
+import math
+
+from constants import trig
+from constants.earth import EarthConstants, ReturnType
+from four_position_and_velocity_a_funcion_of_time import four_02_time_of_flight_eccentric_anomoly
+from one_twoBodyOrbitalMecanics import one_04_constants_of_the_motion
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem, six_03_launching_errors_on_range
+
+
+class BallisticModel():
+    """
+    Chapter 1, 4 and 6 equations for one set of Earth constants.
+    Args:
+        constants (ReturnType or EarthConstants): unit system, or custom constants in a consistent unit system
+    """
+    __slots__ = ('_constants', '_name', '_mu', '_radius')
+
+    def __init__(self, constants):
+        if isinstance(constants, ReturnType):
+            constants = constants.value
+        if not isinstance(constants, EarthConstants):
+            raise TypeError("BallisticModel needs a ReturnType or EarthConstants, not %s" % type(constants).__name__)
+
+        self._constants = constants
+        self._name = constants.getName()
+        self._mu = constants.getMu()
+        self._radius = constants.getRadius()
+
+    def __repr__(self):
+        return "BallisticModel(%s, mu=%r, radius=%r)" % (self._name, self._mu, self._radius)
+
+    def getConstants(self) -> EarthConstants:
+        return self._constants
+
+    def getName(self) -> str:
+        return self._name
+
+    def getMu(self) -> float:
+        return self._mu
+
+    def getMeanEquatorialRadius(self) -> float:
+        return self._radius
+
+    # chapter 1
+    def solveForSpecificMechanicalEnergy(self, v: float, r: float) -> float:
+        """
+        This is based on the equation 1.4-2 from the BMW book
+        """
+        return (v*v/2.0) - (self._mu / r)
+
+    def solveForVelocityFromSpecificEnergy(self, energy: float, r: float) -> float:
+        """
+        This is based on equation 1.4-2 from the BMW book.
+        """
+        toRoot = 2.0 * (self._mu/r + energy)
+        return math.sqrt(toRoot)
+
+    solveForAngularMomentum = staticmethod(one_04_constants_of_the_motion.solveForAngularMomentum)
+    solveForAngularmoment = staticmethod(one_04_constants_of_the_motion.solveForAngularmoment)
+    solveForFPAFromAngularMomentum = staticmethod(one_04_constants_of_the_motion.solveForFPAFromAngularMomentum)
+
+    def circularSatelliteSpeed(self, r: float) -> float:
+        """
+        This is based on equation 1.8-2 from the BMW book
+        """
+        return math.sqrt(self._mu / r)
+
+    # chapter 4
+    solveforEccentricAnomoly = staticmethod(four_02_time_of_flight_eccentric_anomoly.solveforEccentricAnomoly)
+
+    # chapter 6, section 2
+    def solveForNondimentionalParametericParameter621(self, v: float, r: float) -> float:
+        """
+        This is based on the equation 6.2-1 in the BMW book
+        """
+        return (v * v * r)/self._mu
+
+    def solveForVelocity621(self, q: float, r: float) -> float:
+        """
+        This is based on the equation 6.2-1 from the BMW book.
+        """
+        return math.sqrt(self._mu * (q/r))
+
+    def solveForNondimentionalParameter622(self, v: float, r: float) -> float:
+        """
+        This is based on equation 6.2-2 from the BMW book
+        """
+        v_cs = math.sqrt(self._mu / r)
+        return math.pow(v/v_cs, 2.0)
+
+    solveForSemiMajorAxis = staticmethod(six_02_general_ballistic_missile_problem.solveForSemiMajorAxis)
+    solveForNondimentionalParameter624 = staticmethod(six_02_general_ballistic_missile_problem.solveForNondimentionalParameter624)
+    solveForEccentricity = staticmethod(six_02_general_ballistic_missile_problem.solveForEccentricity)
+    solveForRadiusOfEllipse = staticmethod(six_02_general_ballistic_missile_problem.solveForRadiusOfEllipse)
+    solveForAnomalyOfEllipse = staticmethod(six_02_general_ballistic_missile_problem.solveForAnomalyOfEllipse)
+    solveForFreeFlightAngleFromAnomaly = staticmethod(six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromAnomaly)
+    solveForAnomalyAngleAtBurnout = staticmethod(six_02_general_ballistic_missile_problem.solveForAnomalyAngleAtBurnout)
+    solveForFreeFlightAngleFromQ = staticmethod(six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ)
+
+    def solveForFreeFlightAngleFromBurnout(self, r_bo: float, v_bo: float, FPA_bo: float) -> float:
+        """
+        This is a modification of the equation 6.2-12 from the BMW book
+        """
+        return six_02_general_ballistic_missile_problem.solveForFreeFlightAngleFromQ((v_bo * v_bo * r_bo)/self._mu, FPA_bo)
+
+    solveForFlightPathAngle = staticmethod(six_02_general_ballistic_missile_problem.solveForFlightPathAngle)
+    solveForMaxBurnoutFlightPathAngle = staticmethod(six_02_general_ballistic_missile_problem.solveForMaxBurnoutFlightPathAngle)
+    solveForMaxRangeAngle = staticmethod(six_02_general_ballistic_missile_problem.solveForMaxRangeAngle)
+    solveForRequiredQAtMaxRange = staticmethod(six_02_general_ballistic_missile_problem.solveForRequiredQAtMaxRange)
+    solveForEccentricAnomalyFromMaxRange = staticmethod(six_02_general_ballistic_missile_problem.solveForEccentricAnomalyFromMaxRange)
+
+    def solveForTimeOfFreeFlight(self, capE: float, lowE: float, a: float) -> float:
+        """
+        This is based on equation 6.2-22 from the BMW book.
+        """
+        ERads = capE * trig.degrees2radians
+        tmp1 = math.sqrt(math.pow(a, 3.0) / self._mu)
+        tmp2 = math.pi - ERads + (lowE * math.sin(ERads))
+
+        return 2.0 * tmp1 * tmp2
+
+    def solveForTimeOfFreeFlightFromBurnout(self, r_bo: float, v_bo: float, FPA_bo: float) -> float:
+        """
+        This is based on the equations 6.2-12, 6.2-21 and 6.2-22 from the BMW book
+        """
+        six_02 = six_02_general_ballistic_missile_problem
+        Q_bo = (v_bo * v_bo * r_bo)/self._mu
+        fpaRadians = FPA_bo * trig.degrees2radians
+        sinFPA = math.sin(fpaRadians)
+        cosFPA = math.cos(fpaRadians)
+        e = six_02.solveForEccentricity(Q_bo, FPA_bo)
+        cosHalfRange = 1.0 - Q_bo * cosFPA*cosFPA
+
+        if cosHalfRange >= 0.0:
+            halfAnomaly = math.atan2((1.0 + e) * math.sqrt(Q_bo) * sinFPA, math.sqrt(2.0 - Q_bo) * (1.0 + e - Q_bo * cosFPA*cosFPA))
+        else:
+            halfAnomaly = math.atan2((1.0 + e) * math.sqrt(Q_bo) * (e - cosHalfRange), math.sqrt(2.0 - Q_bo) * Q_bo*Q_bo * sinFPA * cosFPA*cosFPA)
+
+        a = six_02.solveForSemiMajorAxis(r_bo, Q_bo)
+        return 2.0 * math.sqrt(math.pow(a, 3.0) / self._mu) * (2.0 * halfAnomaly + e * math.sin(2.0 * halfAnomaly))
+
+    def solveForFreeFlightTime(self, r_bo: float) -> float:
+        """
+        This is based on the equation 6.2-23 from the BWM book.
+        """
+        r3 = math.pow(r_bo, 3.0)
+        root = math.sqrt(r3/self._mu)
+
+        return 2.0 * math.pi * root
+
+    # chapter 6, section 3
+    solveForCrossRangeErrorLateral = staticmethod(six_03_launching_errors_on_range.solveForCrossRangeErrorLateral)
+    solveForCrossRangeErrorLateralSmallAngleApprox = staticmethod(six_03_launching_errors_on_range.solveForCrossRangeErrorLateralSmallAngleApprox)
+    solveForCrossRangeErrorAzimuthal = staticmethod(six_03_launching_errors_on_range.solveForCrossRangeErrorAzimuthal)
+    solveForCrossRangeErrorAzimuthalSmallAngleApprox = staticmethod(six_03_launching_errors_on_range.solveForCrossRangeErrorAzimuthalSmallAngleApprox)
+    solveForDownRangeError = staticmethod(six_03_launching_errors_on_range.solveForDownRangeError)
+    solveForInfluenceCoefficientFPAError = staticmethod(six_03_launching_errors_on_range.solveForInfluenceCoefficientFPAError)
+
+    def solveForInfluenceCoefficientBurnoutHeight(self, r_bo: float, v_bo: float, fpa_bo: float, freelightRange: float) -> float:
+        """
+        This is based on equation 6.3-16 from the BMW book
+        """
+        tmp1 = (4.0 * self._mu)/(v_bo*v_bo * r_bo*r_bo)
+
+        halfAngle = (freelightRange*trig.degrees2radians)/2.0
+        fpaRad = 2.0*fpa_bo*trig.degrees2radians
+
+        sinHalfAngle = math.sin(halfAngle)
+
+        tmp2 = (sinHalfAngle*sinHalfAngle)/math.sin(fpaRad)
+
+        return tmp1*tmp2
+
+    def solveForInfluenceCoefficientBurnoutVelocity(self, r_bo: float, v_bo: float, fpa_bo: float, freeFlightRange: float) -> float:
+        """
+        This is based on equation 6.3-18 from the BMW book
+        """
+        tmp1 = (8.0 * self._mu) / (math.pow(v_bo, 3.0) * r_bo)
+
+        halfAngle = freeFlightRange*trig.degrees2radians/2.0
+        fpaRad = 2.0*fpa_bo*trig.degrees2radians
+
+        sinHalfAngle = math.sin(halfAngle)
+
+        tmp2 = (sinHalfAngle*sinHalfAngle)/math.sin(fpaRad)
+
+        return tmp1*tmp2
+
+    solveForInfluenceCoefficientBurnoutVelocityAlternative = staticmethod(six_03_launching_errors_on_range.solveForInfluenceCoefficientBurnoutVelocityAlternative)
+
+    def solveForInfluenceCoefficients(self, r_bo: float, v_bo: float, fpa_bo: float) -> six_03_launching_errors_on_range.InfluenceCoefficients:
+        """
+        This is based on equations 6.2-12, 6.3-2, 6.3-4, 6.3-13, 6.3-16 and 6.3-18 from the BMW book
+        """
+        return six_03_launching_errors_on_range._influenceCoefficients(r_bo, v_bo, fpa_bo, self._mu)
@@ -0,0 +1,225 @@
+"""
+Compact container for large batches of burnout states.
+
+A `BurnoutStateArray` keeps r_bo, v_bo and FPA_bo (degrees) of n states as the rows of one (3, n) float block, a
+structure of arrays, so every column is a contiguous array that the array solvers use without a copy, together
+with the `ReturnType` the radii and velocities are given in:
+
+    states = BurnoutStateArray.fromColumns(r_bo, v_bo, fpa_bo, ReturnType.METRIC)
+    psi = states.apply(six_02.solveForFreeFlightAngleFromBurnout)
+    Q_bo = states.apply(six_02.solveForNondimentionalParametericParameter621, columns={'v': 'v_bo', 'r': 'r_bo'})
+    results = states[:1000].apply(batch_evaluator.evaluateChunk, errors='mask')
+
+Slices are views of the block, and so are the columns of a slice.  A catalog is saved as a `.npy` file next to
+a `.json` file with its units, like `six_02_range_table.GridTable`, and memory-mapped when opened, so catalogs
+larger than memory are processed one `chunks` view at a time.  `create` makes a writable memory-mapped catalog
+to be filled chunk by chunk.
+"""
+import inspect
+import json
+
+import numpy
+from numpy.lib import format as npyFormat
+
+from constants import conversions
+from constants.earth import ReturnType
+
+fields = ('r_bo', 'v_bo', 'fpa_bo')
+
+# solver parameter names that are bound to each column by `apply`
+_parameterNames = {'r_bo': 0, 'v_bo': 1, 'FPA_bo': 2, 'fpa_bo': 2}
+
+# conversions.unitFactors names of the length and velocity unit of each unit system
+_units = {ReturnType.CANONICAL: ('DU', 'DU/TU'),
+          ReturnType.ENGLISH: ('ft', 'ft/sec'),
+          ReturnType.METRIC: ('km', 'km/sec')}
+
+
+class BurnoutStateArray():
+    """
+    Burnout radius, velocity and flight path angle (degrees) of n states in one unit system
+    """
+    _values = None
+    _returntype = ReturnType.CANONICAL
+
+    def __init__(self, values: numpy.ndarray, returntype: ReturnType):
+        values = numpy.asanyarray(values)
+        if values.ndim != 2 or values.shape[0] != len(fields):
+            raise ValueError("burnout states are a (%d, n) array, not %s" % (len(fields), values.shape))
+        self._values = values
+        self._returntype = returntype
+
+    @classmethod
+    def fromColumns(cls, r_bo, v_bo, fpa_bo, returntype: ReturnType):
+        """
+        Copies broadcastable columns into a new block
+        Args:
+            r_bo (numpy.ndarray): radius at burnout
+            v_bo (numpy.ndarray): velocity at burnout
+            fpa_bo (numpy.ndarray): flight path angle at burnout (degrees)
+            returntype (ReturnType): units of the radii and velocities
+
+        Returns:
+            BurnoutStateArray: the states, flattened to one dimension
+        """
+        columns = numpy.broadcast_arrays(*(numpy.asarray(column, dtype=float) for column in (r_bo, v_bo, fpa_bo)))
+        values = numpy.empty((len(fields), columns[0].size))
+        for row, column in zip(values, columns):
+            row[:] = column.reshape(-1)
+        return cls(values, returntype)
+
+    def getValues(self) -> numpy.ndarray:
+        return self._values
+
+    def getReturnType(self) -> ReturnType:
+        return self._returntype
+
+    def getR(self) -> numpy.ndarray:
+        return self._values[0]
+
+    def getV(self) -> numpy.ndarray:
+        return self._values[1]
+
+    def getFPA(self) -> numpy.ndarray:
+        return self._values[2]
+
+    def getColumn(self, name: str) -> numpy.ndarray:
+        """
+        A column as a view
+        Args:
+            name (str): 'r_bo', 'v_bo' or 'fpa_bo'
+
+        Returns:
+            numpy.ndarray: the column
+        """
+        return self._values[fields.index(name)]
+
+    def __len__(self) -> int:
+        return self._values.shape[1]
+
+    def __getitem__(self, index):
+        """
+        States selected like the elements of a one dimensional array: slices are views, index arrays and masks
+        copies, and an integer gives the (r_bo, v_bo, fpa_bo) of one state
+        """
+        if isinstance(index, (int, numpy.integer)):
+            return tuple(float(value) for value in self._values[:, index])
+        return type(self)(self._values[:, index], self._returntype)
+
+    def __repr__(self) -> str:
+        return "%s(%d states, %s)" % (type(self).__name__, len(self), self._returntype.name)
+
+    def chunks(self, chunkSize: int):
+        """
+        Yields consecutive views of at most `chunkSize` states; only the chunk being used is read from a
+        memory-mapped catalog
+        """
+        for start in range(0, len(self), chunkSize):
+            yield self[start:start + chunkSize]
+
+    def apply(self, function, columns: dict = None, **kwargs):
+        """
+        Calls an array solver with the columns passed to its r_bo, v_bo and FPA_bo (or fpa_bo) parameters and the
+        unit system to its returntype parameter, e.g. `states.apply(six_02.solveForTimeOfFreeFlightFromBurnout)`.
+        Solvers that name them otherwise (`v` and `r` in `solveForNondimentionalParametericParameter621` and
+        `six21`, `r` in `solveForVelocity621`) are given the column of each such parameter in `columns`; `v` and `r`
+        are never bound by themselves, as `v` is the true anomaly elsewhere (`solveForRadiusOfEllipse`).
+        Args:
+            function: array solver
+            columns (dict): column ('r_bo', 'v_bo' or 'fpa_bo') of more parameters, e.g. {'v': 'v_bo', 'r': 'r_bo'}
+            **kwargs: its other arguments, which may also override the bound ones
+
+        Returns:
+            whatever `function` returns
+        """
+        parameters = inspect.signature(function).parameters
+        bound = {name: self._values[row] for name, row in _parameterNames.items() if name in parameters}
+        for name, column in (columns or {}).items():
+            if name not in parameters:
+                raise TypeError("%s has no parameter %s" % (function.__name__, name))
+            bound[name] = self.getColumn(column)
+        if not bound:
+            raise TypeError("%s has none of the parameters %s, map its parameters with `columns`"
+                            % (function.__name__, ", ".join(_parameterNames)))
+        if 'returntype' in parameters:
+            bound['returntype'] = self._returntype
+        bound.update(kwargs)
+        return function(**bound)
+
+    def convertTo(self, returntype: ReturnType):
+        """
+        Copy of the states with the radii and velocities converted to another unit system
+        Args:
+            returntype (ReturnType): units wanted
+
+        Returns:
+            BurnoutStateArray: the converted states
+        """
+        values = numpy.array(self._values)
+        for row, fromUnit, toUnit in zip(values, _units[self._returntype], _units[returntype]):
+            conversions.convert(row, fromUnit, toUnit, inPlace=True)
+        return type(self)(values, returntype)
+
+    def _metadata(self) -> dict:
+        return {'kind': type(self).__name__,
+                'fields': list(fields),
+                'size': len(self),
+                'units': self._returntype.name}
+
+    def save(self, path: str):
+        """
+        Writes the states to `path` (a `.npy` file) and their units to `path + '.json'`
+        Args:
+            path (str): file name of the catalog
+        """
+        with open(path, 'wb') as valuesFile:
+            numpy.save(valuesFile, numpy.ascontiguousarray(self._values), allow_pickle=False)
+        self._saveMetadata(path)
+
+    def _saveMetadata(self, path: str):
+        with open(path + '.json', 'w') as metadataFile:
+            json.dump(self._metadata(), metadataFile, indent=2)
+
+    @classmethod
+    def create(cls, path: str, size: int, returntype: ReturnType):
+        """
+        Makes a catalog of `size` zeroed states on disk, memory-mapped for writing, e.g. one chunk at a time with
+        `states.getValues()[:, start:stop] = ...`.  Call `flush` when done.
+        Args:
+            path (str): file name of the catalog
+            size (int): number of states
+            returntype (ReturnType): units of the radii and velocities
+
+        Returns:
+            BurnoutStateArray: the writable states
+        """
+        values = npyFormat.open_memmap(path, mode='w+', dtype=float, shape=(len(fields), size))
+        states = cls(values, returntype)
+        states._saveMetadata(path)
+        return states
+
+    @classmethod
+    def open(cls, path: str, mode: str = 'r'):
+        """
+        Memory-maps a catalog written by `save` or `create`
+        Args:
+            path (str): file name of the catalog
+            mode (str): numpy.memmap mode, 'r' (default), 'r+' to update in place or 'c' for copy on write
+
+        Returns:
+            BurnoutStateArray: the states
+        """
+        with open(path + '.json') as metadataFile:
+            metadata = json.load(metadataFile)
+        if metadata['kind'] != cls.__name__:
+            raise ValueError("%s holds a %s, not a %s" % (path, metadata['kind'], cls.__name__))
+
+        values = numpy.load(path, mmap_mode=mode, allow_pickle=False)
+        return cls(values, ReturnType[metadata['units']])
+
+    def flush(self):
+        """
+        Writes changes to a memory-mapped catalog out to its file
+        """
+        if isinstance(self._values, numpy.memmap):
+            self._values.flush()
@@ -0,0 +1,114 @@
+"""
+Per-element status codes for the array solvers' `errors='mask'` mode.
+
+By default (`errors='nan'`) an array function returns NaN where its scalar counterpart would raise, and nothing
+else.  With `errors='mask'` it returns a `MaskedResult` instead: the same values, plus a `status` array of
+`Status` codes that says why an element is NaN (or was nudged), so a sweep never has to branch into exception
+handling to find out:
+
+    psi, status = six_02.solveForFreeFlightAngleFromQ(Q_bo, FPA_bo, errors='mask')
+    print(domain_status.countStatuses(status))     # {'ok': 9998, 'clamped': 1, 'degenerate': 1, 'unreachable': 0}
+
+The codes are ordered by severity, so the status of a chain of equations is the element-wise maximum of the
+statuses of its steps (`combine`).
+
+The mode is taken by the six_02 and six_03 array equations, the inverse range solver, the range and time of
+flight tables (UNREACHABLE outside of the table), `six_02_targeting.solveForTargetingSolutions` (one status per
+target) and `six_02_trajectory_ephemeris.generateEphemeris` (one status per missile), whose values are structured
+arrays.  The scalar functions keep raising.
+"""
+import enum
+from typing import Any, NamedTuple
+
+import numpy
+
+errorModes = ('nan', 'mask')
+
+
+class Status(enum.IntEnum):
+    """
+    Outcome of one element, from least to most severe
+    """
+    OK = 0
+    CLAMPED = 1  # a rounding excursion just outside of the domain (e.g. cos(psi/2) = 1 + 1e-15) was clamped
+    DEGENERATE = 2  # the equation is singular there (division by zero, circular orbit, FPA of 0 or 90 degrees)
+    UNREACHABLE = 3  # no trajectory satisfies the inputs (e.g. asin/acos out of range, Q of 2 or more)
+
+
+statusType = numpy.uint8
+
+
+class MaskedResult(NamedTuple):
+    """
+    Values of an array function (an array, or the tuple it normally returns) and their `Status` codes
+    """
+    values: Any
+    status: numpy.ndarray
+
+
+def checkErrors(errors: str):
+    """
+    Raises a ValueError for an unknown `errors` mode
+    Args:
+        errors (str): 'nan' or 'mask'
+    """
+    if errors not in errorModes:
+        raise ValueError("errors must be one of %s, not %r" % (", ".join(errorModes), errors))
+
+
+def _arrays(values) -> tuple:
+    return tuple(values) if isinstance(values, tuple) else (values,)
+
+
+def classify(values, clamped=None, degenerate=None, unreachable=None) -> MaskedResult:
+    """
+    Builds the status of each element from boolean masks; the most severe mask that holds wins.  NaN values that
+    none of the masks explain are UNREACHABLE.
+    Args:
+        values: result array, or tuple of result arrays of one shape
+        clamped (numpy.ndarray): elements that were clamped
+        degenerate (numpy.ndarray): elements where the equation is singular
+        unreachable (numpy.ndarray): elements without a trajectory
+
+    Returns:
+        MaskedResult: the values and their status codes
+    """
+    arrays = [numpy.asarray(array) for array in _arrays(values)]
+    shape = numpy.broadcast_shapes(*(array.shape for array in arrays))
+
+    status = numpy.zeros(shape, dtype=statusType)
+    for mask, code in ((clamped, Status.CLAMPED), (degenerate, Status.DEGENERATE), (unreachable, Status.UNREACHABLE)):
+        if mask is not None:
+            status[numpy.broadcast_to(mask, shape)] = code
+
+    undefined = numpy.zeros(shape, dtype=bool)
+    for array in arrays:
+        undefined |= ~numpy.isfinite(array)
+    status[undefined & (status == Status.OK)] = Status.UNREACHABLE
+
+    return MaskedResult(values, status)
+
+
+def combine(*statuses) -> numpy.ndarray:
+    """
+    Status of a chain of equations: the most severe status of each element
+    Args:
+        *statuses (numpy.ndarray): status arrays of broadcastable shapes
+
+    Returns:
+        numpy.ndarray: combined status codes
+    """
+    return numpy.maximum.reduce(numpy.broadcast_arrays(*statuses)).astype(statusType)
+
+
+def countStatuses(status) -> dict:
+    """
+    Number of elements with each status, for run summaries
+    Args:
+        status (numpy.ndarray): status codes
+
+    Returns:
+        dict: counts keyed by lower case status name, every status included
+    """
+    counts = numpy.bincount(numpy.asarray(status, dtype=statusType).reshape(-1), minlength=len(Status))
+    return {code.name.lower(): int(counts[code]) for code in Status}
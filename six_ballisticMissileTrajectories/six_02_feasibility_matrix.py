@@ -0,0 +1,164 @@
+"""
+Launch site x target feasibility on the minimum-energy trajectory, in tiles of bounded memory.
+
+For every site and target this gives the free-flight range angle (`six_02_geodesy`), the required Q
+(equation 6.2-20), the burnout flight path angle (equation 6.2-18), the time of free flight (equations 6.2-21
+and 6.2-22) and whether the site's maximum burnout velocity gives that Q (equation 6.2-1).  Powered flight,
+re-entry and the rotation of the Earth are left out, as in section 6.2.
+
+The table is worked through in tiles sized so that the tile and its temporaries stay under `memoryBudget`;
+each finished tile goes straight into the output, which can be a memory-mapped `.npy` file far larger than
+memory:
+
+    matrix = buildFeasibilityMatrix(sites, targets, ReturnType.CANONICAL, path='feasibility.npy')
+    matrix = numpy.load('feasibility.npy', mmap_mode='r')
+
+With `topK` only the best k feasible targets of each site are kept, so nothing of size sites x targets is
+ever written.
+"""
+import numpy
+from numpy.lib import format as npyformat
+
+from constants import earth
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized, six_02_geodesy
+
+feasibilityDtype = numpy.dtype([('freeFlightRange', numpy.float64),
+                                ('requiredQ', numpy.float64),
+                                ('burnoutFPA', numpy.float64),
+                                ('timeOfFlight', numpy.float64),
+                                ('reachable', numpy.bool_)])
+"""
+Fields of one site/target pair.  Angles are in degrees and the time of flight is in the time unit of the
+`ReturnType`.  The minimum-energy trajectory is filled in for every pair, `reachable` says whether the site
+can fly it.
+"""
+
+topKDtype = numpy.dtype([('target', numpy.int64)] + feasibilityDtype.descr)
+"""
+Fields of one of the best k targets of a site: the target's index followed by the `feasibilityDtype` fields.
+Unused slots, when a site has fewer than k feasible targets, have a target of -1.
+"""
+
+siteDtype = numpy.dtype([('lat', numpy.float64), ('lon', numpy.float64), ('r_bo', numpy.float64), ('v_max', numpy.float64)])
+"""
+Launch sites: latitude and longitude (degrees), burnout radius and maximum burnout velocity (units of the `ReturnType`).
+"""
+
+targetDtype = numpy.dtype([('lat', numpy.float64), ('lon', numpy.float64)])
+"""
+Targets: latitude and longitude (degrees).
+"""
+
+# bytes per site/target pair of one tile: its row of the result and the float temporaries of `_evaluateTile`
+_bytesPerPair = feasibilityDtype.itemsize + 14 * 8
+
+defaultMemoryBudget = 256 * 2**20
+
+
+def _tileShape(sites: int, targets: int, memoryBudget: int) -> tuple:
+    pairs = max(1, int(memoryBudget) // _bytesPerPair)
+    columns = max(1, min(targets, pairs))
+    rows = max(1, min(sites, pairs // columns))
+    return rows, columns
+
+
+def _evaluateTile(sites: numpy.ndarray, targets: numpy.ndarray, mu: float, returntype: ReturnType, tile: numpy.ndarray):
+    six_02 = six_02_general_ballistic_missile_problem_vectorized
+
+    psi, _ = six_02_geodesy.solveForRangeAndAzimuthMatrix(sites['lat'], sites['lon'], targets['lat'], targets['lon'])
+    r_bo = sites['r_bo'][:, None]
+    Q = six_02.solveForRequiredQAtMaxRange(psi)
+    fpa = six_02.solveForMaxBurnoutFlightPathAngle(psi)
+
+    e = six_02.solveForEccentricity(Q, fpa)
+    a = six_02.solveForSemiMajorAxis(r_bo, Q)
+    capE = six_02.solveForEccentricAnomalyFromMaxRange(e, psi)
+
+    tile['freeFlightRange'] = psi
+    tile['requiredQ'] = Q
+    tile['burnoutFPA'] = fpa
+    tile['timeOfFlight'] = six_02.solveForTimeOfFreeFlight(capE, e, a, returntype)
+    maxQ = sites['v_max'][:, None] ** 2 * r_bo / mu
+    tile['reachable'] = (psi > 0.0) & (Q <= maxQ)
+
+
+def _mergeTopK(best: numpy.ndarray, tile: numpy.ndarray, firstTarget: int, rankBy: str, k: int):
+    # best k of (best so far, this tile) per site; unreachable pairs rank last and are dropped afterwards
+    candidates = numpy.empty((tile.shape[0], k + tile.shape[1]), dtype=topKDtype)
+    candidates[:, :k] = best
+    for name in feasibilityDtype.names:
+        candidates[name][:, k:] = tile[name]
+    candidates['target'][:, k:] = numpy.arange(firstTarget, firstTarget + tile.shape[1])
+    candidates['target'][:, k:][~tile['reachable']] = -1
+
+    key = numpy.where(candidates['target'] >= 0, candidates[rankBy], numpy.inf)
+    if key.shape[1] > k:
+        keep = numpy.argpartition(key, k - 1, axis=1)[:, :k]
+        candidates = numpy.take_along_axis(candidates, keep, axis=1)
+        key = numpy.take_along_axis(key, keep, axis=1)
+    best[...] = numpy.take_along_axis(candidates, numpy.argsort(key, axis=1, kind='stable'), axis=1)
+    unused = best['target'] < 0
+    for name in feasibilityDtype.names:
+        best[name][unused] = False if name == 'reachable' else numpy.nan
+
+
+def buildFeasibilityMatrix(sites: numpy.ndarray, targets: numpy.ndarray, returntype: ReturnType, path: str = None,
+                           memoryBudget: int = defaultMemoryBudget, topK: int = None, rankBy: str = 'requiredQ') -> numpy.ndarray:
+    """
+    This builds the feasibility of every target from every launch site, one tile at a time.
+    Args:
+        sites (numpy.ndarray): launch sites, an array of `siteDtype` (or any structured array with its fields)
+        targets (numpy.ndarray): targets, an array of `targetDtype` (or any structured array with its fields)
+        returntype (ReturnType): unit system of the burnout radius, velocity and time of flight
+        path (str): optional `.npy` file to write the result to as a memory map; in memory if not given
+        memoryBudget (int): bytes that one tile and its temporaries may take
+        topK (int): keep only the k feasible targets of each site that rank lowest by `rankBy`
+        rankBy (str): `feasibilityDtype` field the targets are ranked by when `topK` is given
+
+    Returns:
+        numpy.ndarray: (sites x targets) array of `feasibilityDtype`, or (sites x topK) array of `topKDtype`
+            ordered best first; a `numpy.memmap` when `path` is given
+    """
+    sites = numpy.asarray(sites).reshape(-1)
+    targets = numpy.asarray(targets).reshape(-1)
+    if topK is not None and topK < 1:
+        raise ValueError("topK must be at least 1, not %r" % topK)
+    if rankBy not in feasibilityDtype.names or rankBy == 'reachable':
+        raise ValueError("rankBy must be one of %s, not %r" % (feasibilityDtype.names[:-1], rankBy))
+
+    if topK is None:
+        shape, dtype = (sites.shape[0], targets.shape[0]), feasibilityDtype
+    else:
+        shape, dtype = (sites.shape[0], topK), topKDtype
+    if path is None:
+        result = numpy.empty(shape, dtype=dtype)
+    else:
+        result = npyformat.open_memmap(path, mode='w+', dtype=dtype, shape=shape)
+    if topK is not None:
+        result['target'] = -1
+        for name in feasibilityDtype.names:
+            result[name] = False if name == 'reachable' else numpy.nan
+
+    mu = earth.getMu(returntype)
+    budget = memoryBudget if topK is None else memoryBudget // 2
+    rows, columns = _tileShape(sites.shape[0], targets.shape[0], budget)
+    if topK is not None:
+        rows = max(1, min(rows, budget // ((topK + columns) * topKDtype.itemsize)))
+    buffer = numpy.empty(rows * columns, dtype=feasibilityDtype)
+
+    for rowStart in range(0, sites.shape[0], rows):
+        siteBlock = sites[rowStart:rowStart + rows]
+        for columnStart in range(0, targets.shape[0], columns):
+            targetBlock = targets[columnStart:columnStart + columns]
+            tile = buffer[:siteBlock.shape[0] * targetBlock.shape[0]].reshape(siteBlock.shape[0], targetBlock.shape[0])
+            _evaluateTile(siteBlock, targetBlock, mu, returntype, tile)
+            if topK is None:
+                result[rowStart:rowStart + rows, columnStart:columnStart + columns] = tile
+            else:
+                best = result[rowStart:rowStart + rows]
+                _mergeTopK(best, tile, columnStart, rankBy, topK)
+
+    if path is not None:
+        result.flush()
+    return result
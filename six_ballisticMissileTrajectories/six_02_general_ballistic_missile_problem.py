@@ -1,5 +1,4 @@
 import math
-from multipledispatch import dispatch
 from typing import Callable
 
 from constants import earth, trig
@@ -11,6 +10,17 @@ six21: Callable[[float, float, ReturnType], float] = lambda v, r, rtype: ((v * v
 Lambda function or solving equation 6.2-1 from the BMW book
 """
 
+_outcomeListeners = []
+"""
+Callables `listener(module, function, outcome, count)` told when an equation had to clamp or discard a value
+(`outcome` is 'clamped' or 'nan').  Only the rare branches look at this, see `utilities.solver_instrumentation`.
+"""
+
+
+def _reportOutcome(function: str, outcome: str):
+    for listener in _outcomeListeners:
+        listener(__name__, function, outcome, 1)
+
 
 def solveForNondimentionalParametericParameter621(v: float, r: float, returntype: ReturnType) -> float:
     """
@@ -87,6 +97,21 @@ def solveForNondimentionalParameter624(r: float, a: float) -> float:
     return 2.0 - (r/a)
 
 
+def solveForEccentricity(Q_bo: float, FPA_bo: float) -> float:
+    """
+    This solves for the eccentricity of the ballistic orbit from Q and the flight path angle at burnout.
+    This substitutes p = r Q cos :sup:`2` (FPA) and a = r / (2 - Q) into e :sup:`2` = 1 - p/a
+    Args:
+        Q_bo (float): Nondimentional Parameter at burnout
+        FPA_bo (float): flight path angle at burnout (degrees)
+
+    Returns:
+        float: eccentricity
+    """
+    cosFPA = math.cos(FPA_bo * trig.degrees2radians)
+    return math.sqrt(1.0 + Q_bo*(Q_bo - 2.0) * cosFPA*cosFPA)
+
+
 def solveForRadiusOfEllipse(p: float, e: float, v: float) -> float:
     """
     Solve for the radius of the ballistic orbit using the properties of an ellipse.
@@ -116,10 +141,10 @@ def solveForAnomalyOfEllipse(p: float, e: float, r: float) -> float:
         float: total anomaly
     """
     tmp = (p - r) / (e * r)
-    return math.cos(tmp)*trig.radians2degrees
+    return math.acos(tmp)*trig.radians2degrees
 
 
-def solveForFreeFlightAngle(v_bo: float) -> float:
+def solveForFreeFlightAngleFromAnomaly(v_bo: float) -> float:
     """
     This solves for the free flight range based on the anomaly angle at burnout.
     This is based on the equation 6.2-7 from the BMW book
@@ -149,8 +174,7 @@ def solveForAnomalyAngleAtBurnout(freeFlightAngle: float) -> float:
     return math.acos(-cosHalfAngle) * trig.radians2degrees
 
 
-@dispatch(float, float)
-def solveForFreeFlightAngle(Q_bo: float, FPA_bo: float) -> float:
+def solveForFreeFlightAngleFromQ(Q_bo: float, FPA_bo: float) -> float:
     """
     This solves for the free-flight angle using the free-flight range equation.
     This uses Q at burnout and the flight path angle at burnout to find the free-flight angle
@@ -170,6 +194,7 @@ def solveForFreeFlightAngle(Q_bo: float, FPA_bo: float) -> float:
     den = math.sqrt(1.0 + Q_bo*(Q_bo - 2.0) * cosFPASquared)
     if math.isclose(den, 0.0):
         cosPsiDiv2 = 0
+        _reportOutcome('solveForFreeFlightAngleFromQ', 'clamped')
     else:
         cosPsiDiv2 = num/den
 
@@ -181,18 +206,19 @@ def solveForFreeFlightAngle(Q_bo: float, FPA_bo: float) -> float:
             cosPsiDiv2 = -1
         else:
             raise Exception("Cannot perform calculation due to cosPsiDiv2 being out of bounds")
+        _reportOutcome('solveForFreeFlightAngleFromQ', 'clamped')
 
     output = math.acos(cosPsiDiv2) * 2.0 * trig.radians2degrees
     if math.isnan(output):
         output = 0.0
+        _reportOutcome('solveForFreeFlightAngleFromQ', 'nan')
 
     return output
 
 
-@dispatch(float, float, float, ReturnType)
-def solveForFreeFlightAngle(r_bo: float, v_bo: float, FPA_bo: float, returntype: ReturnType) -> float:
+def solveForFreeFlightAngleFromBurnout(r_bo: float, v_bo: float, FPA_bo: float, returntype: ReturnType) -> float:
     """
-    This is a rewrite of the `solveForFreeFlightAngle` written to take in radius, velocity, and flight path angle at burnout.
+    This is a rewrite of the `solveForFreeFlightAngleFromQ` written to take in radius, velocity, and flight path angle at burnout.
     This is a modification of the equation 6.2-12 from the BMW book
     Args:
         r_bo (float): radius at burnout
@@ -204,7 +230,41 @@ def solveForFreeFlightAngle(r_bo: float, v_bo: float, FPA_bo: float, returntype:
         float: Free Flight Angle (degrees)
     """
     Q_bo = solveForNondimentionalParametericParameter621(v_bo, r_bo, returntype)
-    return solveForFreeFlightAngle(Q_bo, FPA_bo)
+    return solveForFreeFlightAngleFromQ(Q_bo, FPA_bo)
+
+
+_freeFlightAngleEquations = {1: solveForFreeFlightAngleFromAnomaly,
+                             2: solveForFreeFlightAngleFromQ,
+                             4: solveForFreeFlightAngleFromBurnout}
+_scalarTypes = (float, int, ReturnType)
+
+
+def solveForFreeFlightAngle(*args):
+    """
+    Compatibility entry point for the three free-flight angle equations, selected by the number of arguments:
+
+    - `solveForFreeFlightAngle(v_bo)` -> `solveForFreeFlightAngleFromAnomaly` (equation 6.2-7)
+    - `solveForFreeFlightAngle(Q_bo, FPA_bo)` -> `solveForFreeFlightAngleFromQ` (equation 6.2-12)
+    - `solveForFreeFlightAngle(r_bo, v_bo, FPA_bo, returntype)` -> `solveForFreeFlightAngleFromBurnout`
+
+    Any int, float or NumPy scalar is accepted.  If any argument is an array the call is handed to
+    `six_02_general_ballistic_missile_problem_vectorized`.  Hot loops should call the named functions directly.
+    Args:
+        *args: arguments of one of the equations above
+
+    Returns:
+        float: Free Flight Angle (degrees)
+    """
+    equation = _freeFlightAngleEquations.get(len(args))
+    if equation is None:
+        raise TypeError("solveForFreeFlightAngle takes 1, 2 or 4 arguments (%d given)" % len(args))
+
+    for arg in args:
+        if not isinstance(arg, _scalarTypes) and getattr(arg, 'ndim', 0):
+            from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem_vectorized
+            return getattr(six_02_general_ballistic_missile_problem_vectorized, equation.__name__)(*args)
+
+    return equation(*args)
 
 
 def solveForFlightPathAngle(freeFlightRange: float, Q_bo: float) -> (float, float):
@@ -318,6 +378,44 @@ def solveForTimeOfFreeFlight(capE: float, lowE: float, a: float, returntype: Ret
     return 2.0 * tmp1 * tmp2
 
 
+def solveForTimeOfFreeFlightFromBurnout(r_bo: float, v_bo: float, FPA_bo: float, returntype: ReturnType) -> float:
+    """
+    This solves for the free flight time of any symmetric ballistic trajectory from the burnout state.
+    This is based on the equations 6.2-12, 6.2-21 and 6.2-22 from the BMW book
+
+    Burnout sits at a true anomaly of 180 - psi/2 on every symmetric trajectory, not only the maximum range one,
+    so equation 6.2-21 gives its eccentric anomaly for any Q and flight path angle.  It is taken from a half angle
+    tangent instead of `acos`, which keeps short ranges (E close to 180 degrees) accurate, and stays finite for
+    vertical (radial) flight.
+    Args:
+        r_bo (float): radius at burnout
+        v_bo (float): velocity at burnout
+        FPA_bo (float): flight path angle at burnout (degrees), between 0 and 90
+        returntype (ReturnType): How the units are given and expected to return
+
+    Returns:
+        float: time for free flight in ReturnType units
+    """
+    Q_bo = solveForNondimentionalParametericParameter621(v_bo, r_bo, returntype)
+    fpaRadians = FPA_bo * trig.degrees2radians
+    sinFPA = math.sin(fpaRadians)
+    cosFPA = math.cos(fpaRadians)
+    e = solveForEccentricity(Q_bo, FPA_bo)
+    cosHalfRange = 1.0 - Q_bo * cosFPA*cosFPA  # e cos(psi/2), equation 6.2-12
+
+    # (180 - E)/2 from equation 6.2-21, tan(E/2) = sqrt((1 - e)/(1 + e)) tan(nu/2) with nu = 180 - psi/2, where
+    # tan(psi/4) = Q sin(FPA) cos(FPA) / (e + e cos(psi/2)) and 1 - e^2 = Q (2 - Q) cos^2(FPA)
+    if cosHalfRange >= 0.0:
+        halfAnomaly = math.atan2((1.0 + e) * math.sqrt(Q_bo) * sinFPA, math.sqrt(2.0 - Q_bo) * (1.0 + e - Q_bo * cosFPA*cosFPA))
+    else:
+        # past 180 degrees of range e + e cos(psi/2) cancels; multiplied through by e - e cos(psi/2) it does not,
+        # and horizontal burnout (a whole orbit) comes out as E = 0
+        halfAnomaly = math.atan2((1.0 + e) * math.sqrt(Q_bo) * (e - cosHalfRange), math.sqrt(2.0 - Q_bo) * Q_bo*Q_bo * sinFPA * cosFPA*cosFPA)
+
+    a = solveForSemiMajorAxis(r_bo, Q_bo)
+    return 2.0 * math.sqrt(math.pow(a, 3.0) / earth.getMu(returntype)) * (2.0 * halfAnomaly + e * math.sin(2.0 * halfAnomaly))
+
+
 def solveForFreeFlightTime(r_bo: float, returntype: ReturnType) -> float:
     """
     This solves for the free-flight time of circular orbit based on the burnout altitude.
@@ -0,0 +1,485 @@
+"""
+Array versions of the equations in `six_02_general_ballistic_missile_problem`.
+
+Every function takes array-like inputs, broadcasts them against each other the same way a NumPy ufunc does
+and evaluates the same equation, in the same order of operations, as its scalar counterpart.  Results agree
+with the scalar functions to within 1e-12 relative / 1e-9 absolute (degrees); the only differences come from
+the last bit of the NumPy and `math` transcendental functions.
+
+Where a scalar function raises on a value outside of its domain (e.g. `math.asin` of a number greater than 1)
+the array function returns NaN for that element instead, so one bad element does not abort the whole batch.
+The functions with a domain also take `errors='mask'`, which returns a `domain_status.MaskedResult` of the
+values and a per-element status code (clamped, degenerate or unreachable) instead of the values alone.
+"""
+import math
+
+import numpy
+
+from constants import earth, trig
+from constants.earth import ReturnType
+from one_twoBodyOrbitalMecanics import one_08_circular_orbit_vectorized
+from six_ballisticMissileTrajectories import domain_status
+
+
+def _asFloatArray(x) -> numpy.ndarray:
+    return numpy.asarray(x, dtype=float)
+
+
+_outcomeListeners = []
+"""
+Callables `listener(module, function, outcome, count)` told how many elements an equation had to clamp
+(`outcome` 'clamped'); the counting only happens while a listener is registered.
+"""
+
+
+def _isClose(a: numpy.ndarray, b: float) -> numpy.ndarray:
+    # element-wise `math.isclose` with its default tolerances, so the clamping matches the scalar code exactly
+    return numpy.abs(a - b) <= 1e-9 * numpy.maximum(numpy.abs(a), abs(b))
+
+
+def six21(v, r, rtype: ReturnType) -> numpy.ndarray:
+    """
+    Array version of the lambda for solving equation 6.2-1 from the BMW book
+    """
+    v = _asFloatArray(v)
+    return (v * v * _asFloatArray(r))/earth.getMu(rtype)
+
+
+def solveForNondimentionalParametericParameter621(v, r, returntype: ReturnType) -> numpy.ndarray:
+    """
+    This solves for the Nondimentional Parameter Q.
+    This is based on the equation 6.2-1 in the BMW book
+    Args:
+        v (numpy.ndarray): velocity
+        r (numpy.ndarray): radius of circular orbit
+        returntype (ReturnType): How the units are given and expected to return
+
+    Returns:
+        numpy.ndarray: nondimentional number
+    """
+    return six21(v, r, returntype)
+
+
+def solveForVelocity621(q, r, returntype: ReturnType) -> numpy.ndarray:
+    """
+    This solves or the velocity given a `Q` , a given `r` , and unit system.
+    this is based on the equation 6.2-1 from the BMW book.
+
+    Args:
+        q (numpy.ndarray): nondimentional number
+        r (numpy.ndarray): radius of circular orbit
+        returntype (ReturnType): How the units are provided and expected to be returned from
+
+    Returns:
+        numpy.ndarray: The velocity
+    """
+    return numpy.sqrt(earth.getMu(returntype) * (_asFloatArray(q)/_asFloatArray(r)))
+
+
+def solveForNondimentionalParameter622(v, r, returntype: ReturnType) -> numpy.ndarray:
+    """
+    This solves for the nondimentional parameter `Q`.
+    This is based on equation 6.2-2 from the BMW bok
+    Args:
+        v (numpy.ndarray): velocity
+        r (numpy.ndarray):radius of the ballistic orbit
+        returntype (ReturnType): How the units are given and expected to return
+
+    Returns:
+        numpy.ndarray: the nondimentional parameter
+    """
+    v_cs = one_08_circular_orbit_vectorized.circularSatelliteSpeed(r, returntype)
+    return numpy.power(_asFloatArray(v)/v_cs, 2.0)
+
+
+def solveForSemiMajorAxis(r, Q, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This makes a substitution for v :sup:`2` in the equation 1.4-2 and solves for the semi-major axis.
+
+    Q = 2 (a parabola) is degenerate and returned as NaN.
+    Args:
+        r (numpy.ndarray):  radius
+        Q (numpy.ndarray): nondimentional parameter
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: semi-major axis of the ballistic orbit
+    """
+    domain_status.checkErrors(errors)
+    denominator = 2.0 - _asFloatArray(Q)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        output = numpy.where(denominator == 0.0, numpy.nan, _asFloatArray(r)/denominator)
+
+    if errors == 'mask':
+        return domain_status.classify(output, degenerate=(denominator == 0.0))
+    return output
+
+
+def solveForNondimentionalParameter624(r, a) -> numpy.ndarray:
+    """
+    This makes a substitution for v :sup:`2` in the equation 1.4-2 and solves for the nondimentional parameter.
+    This is based on equation 6.2-4 from the BMW book.
+    Args:
+        r (numpy.ndarray): radius
+        a (numpy.ndarray): semi-major axis of the parabolic orbit
+
+    Returns:
+        numpy.ndarray: nondimentional number
+    """
+    return 2.0 - (_asFloatArray(r)/_asFloatArray(a))
+
+
+def solveForEccentricity(Q_bo, FPA_bo) -> numpy.ndarray:
+    """
+    This solves for the eccentricity of the ballistic orbit from Q and the flight path angle at burnout.
+    This substitutes p = r Q cos :sup:`2` (FPA) and a = r / (2 - Q) into e :sup:`2` = 1 - p/a
+    Args:
+        Q_bo (numpy.ndarray): Nondimentional Parameter at burnout
+        FPA_bo (numpy.ndarray): flight path angle at burnout (degrees)
+
+    Returns:
+        numpy.ndarray: eccentricity
+    """
+    Q_bo = _asFloatArray(Q_bo)
+    cosFPA = numpy.cos(_asFloatArray(FPA_bo) * trig.degrees2radians)
+    with numpy.errstate(invalid='ignore'):
+        return numpy.sqrt(1.0 + Q_bo*(Q_bo - 2.0) * cosFPA*cosFPA)
+
+
+def solveForRadiusOfEllipse(p, e, v) -> numpy.ndarray:
+    """
+    Solve for the radius of the ballistic orbit using the properties of an ellipse.
+    This is based on equation 6.2-5 from the BMW book
+    Args:
+        p (numpy.ndarray): the semi-latus rectum
+        e (numpy.ndarray): eccentricity
+        v (numpy.ndarray): total anomaly (degrees)
+
+    Returns:
+        numpy.ndarray: radius of the ballistic orbit
+    """
+    cosV = numpy.cos(_asFloatArray(v) * trig.degrees2radians)
+    return _asFloatArray(p)/(1.0 + _asFloatArray(e)*cosV)
+
+
+def solveForAnomalyOfEllipse(p, e, r, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the anomaly angle of ballistic orbit using the properties of an ellipse.
+    This is based on the equation 6.2-6 from the BMW book.
+
+    Radii the ellipse never reaches are returned as NaN (unreachable); circular orbits are degenerate.
+    Args:
+        p (numpy.ndarray): semi-latus rectum
+        e (numpy.ndarray): eccentricity
+        r (numpy.ndarray): radius of the ballistic orbit
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: total anomaly (degrees)
+    """
+    domain_status.checkErrors(errors)
+    r = _asFloatArray(r)
+    e = _asFloatArray(e)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        tmp = (_asFloatArray(p) - r) / (e * r)
+        output = numpy.arccos(tmp)*trig.radians2degrees
+
+    if errors == 'mask':
+        return domain_status.classify(output, degenerate=(e * r == 0.0))
+    return output
+
+
+def solveForFreeFlightAngleFromAnomaly(v_bo) -> numpy.ndarray:
+    """
+    This solves for the free flight range based on the anomaly angle at burnout.
+    This is based on the equation 6.2-7 from the BMW book
+    Args:
+        v_bo (numpy.ndarray): anomaly angle at burnout (degrees)
+
+    Returns:
+        numpy.ndarray: free flight range (degrees)
+    """
+    cosV = numpy.cos(_asFloatArray(v_bo) * trig.degrees2radians)
+    halfPsi = numpy.arccos(-cosV)
+    return halfPsi * 2.0 * trig.radians2degrees
+
+
+def solveForAnomalyAngleAtBurnout(freeFlightAngle) -> numpy.ndarray:
+    """
+    This solves for the anomaly angle at burnout based on the free flight range.
+    This is based on the equation 6.2-7 from the BMW book
+    Args:
+        freeFlightAngle (numpy.ndarray): Free Flight Angle at burnout (degrees)
+
+    Returns:
+        numpy.ndarray: anomaly angle at burnout (degrees)
+    """
+    halfAngle = _asFloatArray(freeFlightAngle) / 2.0
+    cosHalfAngle = numpy.cos(halfAngle * trig.degrees2radians)
+    return numpy.arccos(-cosHalfAngle) * trig.radians2degrees
+
+
+def solveForFreeFlightAngleFromQ(Q_bo, FPA_bo, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the free-flight angle using the free-flight range equation.
+    This uses Q at burnout and the flight path angle at burnout to find the free-flight angle
+    This is based on equation 6.2-12 from the BMW book
+
+    `cos(psi/2)` values that are within `math.isclose` of +/-1 are clamped exactly as the scalar version does;
+    anything further out of bounds is returned as NaN.  Horizontal burnout at circular speed (e = 0) is
+    degenerate and gives 180 degrees, as in the scalar version.
+    Args:
+        Q_bo (numpy.ndarray): Nondimentional Parameter at burnout
+        FPA_bo (numpy.ndarray): flight path angle at burn out (degrees)
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: Free Flight Angle (degrees)
+    """
+    domain_status.checkErrors(errors)
+    Q_bo = _asFloatArray(Q_bo)
+    fpaRadians = _asFloatArray(FPA_bo) * trig.degrees2radians
+    cosFPA = numpy.cos(fpaRadians)
+    cosFPASquared = cosFPA*cosFPA
+
+    num = (1.0 - Q_bo * cosFPASquared)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        den = numpy.sqrt(1.0 + Q_bo*(Q_bo - 2.0) * cosFPASquared)
+        cosPsiDiv2 = numpy.where(den == 0.0, 0.0, num/den)
+
+    if _outcomeListeners:
+        clamped = numpy.count_nonzero(den == 0.0) + \
+            numpy.count_nonzero((numpy.abs(cosPsiDiv2) > 1.0) & (_isClose(cosPsiDiv2, 1.0) | _isClose(cosPsiDiv2, -1.0)))
+        for listener in _outcomeListeners:
+            listener(__name__, 'solveForFreeFlightAngleFromQ', 'clamped', int(clamped))
+
+    if errors == 'mask':
+        clamped = (numpy.abs(cosPsiDiv2) > 1.0) & (_isClose(cosPsiDiv2, 1.0) | _isClose(cosPsiDiv2, -1.0))
+
+    # make sure the cos is between 1 and -1
+    cosPsiDiv2 = numpy.where(_isClose(cosPsiDiv2, 1.0), numpy.minimum(cosPsiDiv2, 1.0), cosPsiDiv2)
+    cosPsiDiv2 = numpy.where(_isClose(cosPsiDiv2, -1.0), numpy.maximum(cosPsiDiv2, -1.0), cosPsiDiv2)
+
+    with numpy.errstate(invalid='ignore'):
+        output = numpy.arccos(cosPsiDiv2) * 2.0 * trig.radians2degrees
+
+    if errors == 'mask':
+        return domain_status.classify(output, clamped=clamped, degenerate=(den == 0.0))
+    return output
+
+
+def solveForFreeFlightAngleFromBurnout(r_bo, v_bo, FPA_bo, returntype: ReturnType, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This is a rewrite of the `solveForFreeFlightAngleFromQ` written to take in radius, velocity, and flight path angle at burnout.
+    This is a modification of the equation 6.2-12 from the BMW book
+    Args:
+        r_bo (numpy.ndarray): radius at burnout
+        v_bo (numpy.ndarray): velocity at burnout
+        FPA_bo (numpy.ndarray): flight path angle at burnout (degrees)
+        returntype (ReturnType): How the units are given and expected to return
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: Free Flight Angle (degrees)
+    """
+    Q_bo = solveForNondimentionalParametericParameter621(v_bo, r_bo, returntype)
+    return solveForFreeFlightAngleFromQ(Q_bo, FPA_bo, errors)
+
+
+def solveForFlightPathAngle(freeFlightRange, Q_bo, errors: str = 'nan') -> (numpy.ndarray, numpy.ndarray):
+    """
+    This solves for the flight path angles that are represented by a Free-flight range angle and a Nondimentional Parameter.
+    This is based on equation 6.2-16 from the BMW book
+
+    Unreachable ranges (where the scalar version raises from `math.asin`) are returned as NaN; Q = 0 is degenerate.
+    Args:
+        freeFlightRange (numpy.ndarray): Free-Flight Range Angle in degrees
+        Q_bo (numpy.ndarray): Nondimentional Parameter at burnout
+        errors (str): 'nan', or 'mask' to also return one status for each pair of angles
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): low and high flight path angles (degrees)
+    """
+    domain_status.checkErrors(errors)
+    Q_bo = _asFloatArray(Q_bo)
+    freeFlightRangeRad = _asFloatArray(freeFlightRange) * trig.degrees2radians
+    halfAngle = freeFlightRangeRad/2.0
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        rightSide = (2.0 - Q_bo)/Q_bo * numpy.sin(halfAngle)
+        asin0 = numpy.arcsin(rightSide)
+    asin1 = (180.0 - (asin0 * trig.radians2degrees)) * trig.degrees2radians
+
+    asin0 = asin0 - halfAngle
+    asin1 = asin1 - halfAngle
+
+    output = (asin0 * trig.radians2degrees)/2.0, (asin1 * trig.radians2degrees)/2.0
+    if errors == 'mask':
+        return domain_status.classify(output, degenerate=(Q_bo == 0.0))
+    return output
+
+
+def solveForMaxBurnoutFlightPathAngle(freeFlightRange) -> numpy.ndarray:
+    """
+    This solves for the flight path angle at burnout under the maximum range condition.
+    This is based on the equation 6.2-18 from the BMW book
+    Args:
+        freeFlightRange (numpy.ndarray): Free-flight Range angle (degrees)
+
+    Returns:
+        numpy.ndarray: max burnout flight path angle (degrees)
+    """
+    return 0.25 * (180.0 - _asFloatArray(freeFlightRange))
+
+
+def solveForMaxRangeAngle(Q_bo, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the maximum range obtainable from a given Q at burnout.
+    This is based on the equation 6.2-19 from the BMW book
+
+    Q values above 1 (where the scalar version raises from `math.asin`) are returned as NaN; Q = 2 is degenerate.
+    Args:
+        Q_bo (numpy.ndarray): Q at burnout
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: max range (degrees)
+    """
+    domain_status.checkErrors(errors)
+    Q_bo = _asFloatArray(Q_bo)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        q = Q_bo/(2.0 - Q_bo)
+        output = (numpy.arcsin(q) * trig.radians2degrees) * 2.0
+
+    if errors == 'mask':
+        return domain_status.classify(output, degenerate=(Q_bo == 2.0))
+    return output
+
+
+def solveForRequiredQAtMaxRange(freeFlightAngle) -> numpy.ndarray:
+    """
+    This solves for the required Q at burnout need to achieve the range.
+    This is based on the equation 6.2-20 from the BMW book
+    Args:
+        freeFlightAngle (numpy.ndarray): Free flight angle at burnout (degrees)
+
+    Returns:
+        numpy.ndarray: Q required at burnout to reach range
+    """
+    halfAngle = _asFloatArray(freeFlightAngle)/2.0
+    sinHalfAngle = numpy.sin(halfAngle * trig.degrees2radians)
+
+    return (2.0 * sinHalfAngle) / (1.0 + sinHalfAngle)
+
+
+def solveForEccentricAnomalyFromMaxRange(e, freeFlightRange, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the eccentric anomaly based on the free flight range and eccentricity.
+    This is based on equation 6.2-21 from the BMW book
+    Args:
+        e (numpy.ndarray): eccentricity
+        freeFlightRange (numpy.ndarray): free Flight Range (degrees)
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: eccentric anomaly (degrees)
+    """
+    domain_status.checkErrors(errors)
+    e = _asFloatArray(e)
+    halfAngle = _asFloatArray(freeFlightRange)/2.0
+    cosHalfAngle = numpy.cos(halfAngle * trig.degrees2radians)
+    denominator = 1.0 - e*cosHalfAngle
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        tmp = (e - cosHalfAngle)/denominator
+        output = numpy.arccos(tmp) * trig.radians2degrees
+
+    if errors == 'mask':
+        return domain_status.classify(output, degenerate=(denominator == 0.0))
+    return output
+
+
+def solveForTimeOfFreeFlight(capE, lowE, a, returntype: ReturnType, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the free flight time based on the provided eccentric anomaly, eccentricity, semi-major axis and unit system.
+    This is based on equation 6.2-22 from the BMW book.
+
+    A semi-major axis that is not positive (an escape trajectory, which never comes back down) is unreachable and
+    returned as NaN.
+    Args:
+        capE (numpy.ndarray): Eccentric anomaly `E` (degrees)
+        lowE (numpy.ndarray): eccentricity `e`
+        a (numpy.ndarray): semi-major axis
+        returntype (ReturnType): Unit system to be used
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: time for free flight in ReturnType units
+    """
+    domain_status.checkErrors(errors)
+    a = _asFloatArray(a)
+    ERads = _asFloatArray(capE) * trig.degrees2radians
+    with numpy.errstate(invalid='ignore'):
+        tmp1 = numpy.sqrt(numpy.power(a, 3.0) / earth.getMu(returntype))
+    tmp2 = math.pi - ERads + (_asFloatArray(lowE) * numpy.sin(ERads))
+    output = 2.0 * tmp1 * tmp2
+
+    if errors == 'mask':
+        return domain_status.classify(output, unreachable=(a <= 0.0))
+    return output
+
+
+def solveForTimeOfFreeFlightFromBurnout(r_bo, v_bo, FPA_bo, returntype: ReturnType, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the free flight time of any symmetric ballistic trajectory from the burnout state.
+    This is based on the equations 6.2-12, 6.2-21 and 6.2-22 from the BMW book
+
+    Trajectories that do not return (Q of 2 or more) are returned as NaN.  Horizontal burnout at circular speed
+    (e = 0) is degenerate and gives 0.
+    Args:
+        r_bo (numpy.ndarray): radius at burnout
+        v_bo (numpy.ndarray): velocity at burnout
+        FPA_bo (numpy.ndarray): flight path angle at burnout (degrees), between 0 and 90
+        returntype (ReturnType): How the units are given and expected to return
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: time for free flight in ReturnType units
+    """
+    domain_status.checkErrors(errors)
+    r_bo = _asFloatArray(r_bo)
+    Q_bo = solveForNondimentionalParametericParameter621(v_bo, r_bo, returntype)
+    fpaRadians = _asFloatArray(FPA_bo) * trig.degrees2radians
+    sinFPA = numpy.sin(fpaRadians)
+    cosFPA = numpy.cos(fpaRadians)
+
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        e = numpy.sqrt(1.0 + Q_bo*(Q_bo - 2.0) * cosFPA*cosFPA)
+        cosHalfRange = 1.0 - Q_bo * cosFPA*cosFPA
+        sqrtQ = numpy.sqrt(Q_bo)
+        sqrtTwoMinusQ = numpy.sqrt(2.0 - Q_bo)
+        halfAnomaly = numpy.where(cosHalfRange >= 0.0,
+                                  numpy.arctan2((1.0 + e) * sqrtQ * sinFPA, sqrtTwoMinusQ * (1.0 + e - Q_bo * cosFPA*cosFPA)),
+                                  numpy.arctan2((1.0 + e) * sqrtQ * (e - cosHalfRange), sqrtTwoMinusQ * Q_bo*Q_bo * sinFPA * cosFPA*cosFPA))
+        a = r_bo / (2.0 - Q_bo)
+        timeOfFlight = 2.0 * numpy.sqrt(numpy.power(a, 3.0) / earth.getMu(returntype)) * (2.0 * halfAnomaly + e * numpy.sin(2.0 * halfAnomaly))
+
+    timeOfFlight = numpy.where(Q_bo < 2.0, timeOfFlight, numpy.nan)
+    if errors == 'mask':
+        return domain_status.classify(timeOfFlight, degenerate=(e == 0.0))
+    return timeOfFlight
+
+
+def solveForFreeFlightTime(r_bo, returntype: ReturnType) -> numpy.ndarray:
+    """
+    This solves for the free-flight time of circular orbit based on the burnout altitude.
+    This is based on the equation 6.2-23 from the BWM book.
+    Args:
+        r_bo (numpy.ndarray): Altitude at burnout
+        returntype (ReturnType): unit system being used
+
+    Returns:
+        numpy.ndarray: free flight time
+    """
+    r3 = numpy.power(_asFloatArray(r_bo), 3.0)
+    root = numpy.sqrt(r3/earth.getMu(returntype))
+
+    return 2.0 * math.pi * root
@@ -0,0 +1,133 @@
+"""
+Free-flight range angle and launch azimuth between burnout and re-entry coordinates, for arrays of points.
+
+The range angle is the great-circle angle of the spherical trig on pg. 291 (1st ed),
+`cos(psi) = sin(lat1) sin(lat2) + cos(lat1) cos(lat2) cos(lon2 - lon1)`, but it is taken with `atan2` of its
+sine and cosine so that it keeps full precision for very short and for nearly antipodal ranges, where `acos`
+loses it.  The result is in degrees and goes straight into the six_02 targeting functions:
+
+    psi, azimuth = solveForRangeAndAzimuthMatrix(siteLat, siteLon, aimLat, aimLon)
+    solutions = six_02_targeting.solveForTargetingSolutions(psi, Q_bo)
+
+Latitudes are geocentric and positive north, longitudes positive east; every angle is in degrees.
+"""
+import numpy
+
+from constants import trig
+
+# rows of the range matrix computed together, sized so that the temporaries of one block stay in cache
+_blockElements = 1 << 12
+
+
+def _rangeAndAzimuth(sinLat1, cosLat1, sinLat2, cosLat2, cosDeltaLon, sinDeltaLon, psi, azimuth):
+    # the components of the re-entry point in the frame of the burnout point: up, north and east
+    east = numpy.multiply(cosLat2, sinDeltaLon)
+    cosLat2CosDeltaLon = numpy.multiply(cosLat2, cosDeltaLon)
+    north = numpy.multiply(cosLat1, sinLat2)
+    north -= sinLat1 * cosLat2CosDeltaLon
+    up = numpy.multiply(sinLat1, sinLat2)
+    up += cosLat1 * cosLat2CosDeltaLon
+
+    numpy.arctan2(numpy.hypot(east, north), up, out=psi)
+    psi *= trig.radians2degrees
+    numpy.arctan2(east, north, out=azimuth)
+    azimuth *= trig.radians2degrees
+    numpy.add(azimuth, 360.0, out=azimuth, where=azimuth < 0.0)
+
+
+def solveForRangeAndAzimuth(lat1, lon1, lat2, lon2) -> tuple:
+    """
+    This solves for the free-flight range angle and the launch azimuth between two points, broadcasting the four
+    coordinate arrays against each other.
+    Args:
+        lat1 (numpy.ndarray): burnout latitude (degrees)
+        lon1 (numpy.ndarray): burnout longitude (degrees)
+        lat2 (numpy.ndarray): re-entry latitude (degrees)
+        lon2 (numpy.ndarray): re-entry longitude (degrees)
+
+    Returns:
+        tuple: free-flight range angle psi in [0, 180] and azimuth in [0, 360) measured east of north (degrees).
+            The azimuth is 0 where it is undefined: coincident and antipodal points, or a burnout point on a pole.
+    """
+    lat1, lon1, lat2, lon2 = (numpy.asarray(x, dtype=float) * trig.degrees2radians for x in (lat1, lon1, lat2, lon2))
+    deltaLon = lon2 - lon1
+    shape = numpy.broadcast(lat1, lat2, deltaLon).shape
+    psi, azimuth = numpy.empty(shape), numpy.empty(shape)
+    _rangeAndAzimuth(numpy.sin(lat1), numpy.cos(lat1), numpy.sin(lat2), numpy.cos(lat2), numpy.cos(deltaLon),
+                     numpy.sin(deltaLon), psi, azimuth)
+    return psi[()], azimuth[()]
+
+
+def solveForFreeFlightAngleFromCoordinates(lat1, lon1, lat2, lon2) -> numpy.ndarray:
+    """
+    This solves for the free-flight range angle between two points.
+    Args:
+        lat1 (numpy.ndarray): burnout latitude (degrees)
+        lon1 (numpy.ndarray): burnout longitude (degrees)
+        lat2 (numpy.ndarray): re-entry latitude (degrees)
+        lon2 (numpy.ndarray): re-entry longitude (degrees)
+
+    Returns:
+        numpy.ndarray: free-flight range angle psi in [0, 180] (degrees)
+    """
+    return solveForRangeAndAzimuth(lat1, lon1, lat2, lon2)[0]
+
+
+def solveForLaunchAzimuth(lat1, lon1, lat2, lon2) -> numpy.ndarray:
+    """
+    This solves for the azimuth, east of north, at the first point of the great circle to the second.
+    Args:
+        lat1 (numpy.ndarray): burnout latitude (degrees)
+        lon1 (numpy.ndarray): burnout longitude (degrees)
+        lat2 (numpy.ndarray): re-entry latitude (degrees)
+        lon2 (numpy.ndarray): re-entry longitude (degrees)
+
+    Returns:
+        numpy.ndarray: azimuth in [0, 360) (degrees)
+    """
+    return solveForRangeAndAzimuth(lat1, lon1, lat2, lon2)[1]
+
+
+def solveForRangeAndAzimuthMatrix(siteLat, siteLon, aimLat, aimLon, out: tuple = None) -> tuple:
+    """
+    This solves for the range angle and azimuth from every launch site to every aim point.  The sines and cosines
+    are taken once per point, not once per pair, so only arithmetic and the two `atan2` are done per pair.
+    Args:
+        siteLat (numpy.ndarray): launch site latitudes (degrees), 1-D
+        siteLon (numpy.ndarray): launch site longitudes (degrees), 1-D
+        aimLat (numpy.ndarray): aim point latitudes (degrees), 1-D
+        aimLon (numpy.ndarray): aim point longitudes (degrees), 1-D
+        out (tuple): optional pair of (sites x aim points) float arrays to fill instead of allocating
+
+    Returns:
+        tuple: (sites x aim points) arrays of the free-flight range angle psi and the launch azimuth (degrees)
+    """
+    siteLat, siteLon, aimLat, aimLon = (numpy.asarray(x, dtype=float).reshape(-1) * trig.degrees2radians
+                                        for x in (siteLat, siteLon, aimLat, aimLon))
+    if siteLat.shape != siteLon.shape or aimLat.shape != aimLon.shape:
+        raise ValueError("latitudes and longitudes must have the same length")
+
+    shape = (siteLat.shape[0], aimLat.shape[0])
+    if out is None:
+        out = (numpy.empty(shape), numpy.empty(shape))
+    elif any(x.shape != shape or x.dtype != numpy.float64 for x in out):
+        raise ValueError("out must be a pair of %s float arrays" % (shape,))
+    psi, azimuth = out
+
+    sinSiteLat, cosSiteLat = numpy.sin(siteLat)[:, None], numpy.cos(siteLat)[:, None]
+    sinSiteLon, cosSiteLon = numpy.sin(siteLon)[:, None], numpy.cos(siteLon)[:, None]
+    sinAimLat, cosAimLat = numpy.sin(aimLat), numpy.cos(aimLat)
+    sinAimLon, cosAimLon = numpy.sin(aimLon), numpy.cos(aimLon)
+
+    rows = max(1, _blockElements // max(1, shape[1]))
+    for start in range(0, shape[0], rows):
+        block = slice(start, start + rows)
+        # cos and sin of (aimLon - siteLon) from the angle-difference identities
+        cosDeltaLon = cosSiteLon[block] * cosAimLon
+        cosDeltaLon += sinSiteLon[block] * sinAimLon
+        sinDeltaLon = cosSiteLon[block] * sinAimLon
+        sinDeltaLon -= sinSiteLon[block] * cosAimLon
+        _rangeAndAzimuth(sinSiteLat[block], cosSiteLat[block], sinAimLat, cosAimLat, cosDeltaLon, sinDeltaLon,
+                         psi[block], azimuth[block])
+
+    return psi, azimuth
@@ -0,0 +1,180 @@
+"""
+Inverse of the free-flight range equation: the burnout Q, and so the burnout velocity, that reaches a given
+free-flight range angle at a chosen burnout flight path angle, for whole arrays of (psi, FPA, r_bo) at once.
+
+Equation 6.2-16 solved for Q gives it in closed form:
+
+    Q = 2 sin(psi/2) / (sin(psi/2) + sin(2 FPA + psi/2))
+
+which is reachable where 0 < Q < 2.  `solveForRequiredQRefined` polishes that root with a bracketed Newton
+iteration on equation 6.2-12 itself, so that `solveForFreeFlightAngleFromQ` gives back the requested range to
+the last bits, and can be warm-started from the Q of a neighbouring grid point.  Elements that are out of the
+domain or unreachable are NaN, as in the other array modules, and `errors='mask'` adds their status codes.
+"""
+import numpy
+
+from constants import trig
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import domain_status, six_02_general_ballistic_missile_problem_vectorized
+
+_epsilon = numpy.finfo(float).eps
+
+
+def _isDegenerate(freeFlightRange, FPA_bo) -> numpy.ndarray:
+    # the edges of the domain, where equation 6.2-16 has no single Q
+    freeFlightRange = numpy.asarray(freeFlightRange, dtype=float)
+    FPA_bo = numpy.asarray(FPA_bo, dtype=float)
+    return (freeFlightRange == 0.0) | (freeFlightRange == 360.0) | (FPA_bo == 0.0) | (FPA_bo == 90.0)
+
+
+def solveForRequiredQ(freeFlightRange, FPA_bo, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the Q at burnout that gives a free-flight range angle at a burnout flight path angle.
+    This is based on equation 6.2-16 from the BMW book, solved for Q
+
+    Ranges outside of (0, 360), flight path angles outside of (0, 90) and unreachable combinations (Q not
+    between 0 and 2) are returned as NaN; the edges of the domain are degenerate, the rest unreachable.
+    Args:
+        freeFlightRange (numpy.ndarray): Free-flight range angle (degrees)
+        FPA_bo (numpy.ndarray): flight path angle at burnout (degrees)
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: Q at burnout
+    """
+    domain_status.checkErrors(errors)
+    freeFlightRange = numpy.asarray(freeFlightRange, dtype=float)
+    FPA_bo = numpy.asarray(FPA_bo, dtype=float)
+    halfAngle = freeFlightRange * (0.5 * trig.degrees2radians)
+    sinHalfAngle = numpy.sin(halfAngle)
+
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        Q_bo = 2.0 * sinHalfAngle / (sinHalfAngle + numpy.sin(2.0 * FPA_bo * trig.degrees2radians + halfAngle))
+
+    valid = (freeFlightRange > 0.0) & (freeFlightRange < 360.0) & (FPA_bo > 0.0) & (FPA_bo < 90.0) & \
+        (Q_bo > 0.0) & (Q_bo < 2.0)
+    Q_bo = numpy.where(valid, Q_bo, numpy.nan)
+
+    if errors == 'mask':
+        return domain_status.classify(Q_bo, degenerate=_isDegenerate(freeFlightRange, FPA_bo))
+    return Q_bo
+
+
+def _rangeSlope(Q_bo: numpy.ndarray, FPA_bo: numpy.ndarray, freeFlightRange: numpy.ndarray) -> numpy.ndarray:
+    # d psi / d Q (degrees) along equation 6.2-16, Q (sin(psi/2) + sin(2 FPA + psi/2)) = 2 sin(psi/2)
+    halfAngle = freeFlightRange * (0.5 * trig.degrees2radians)
+    angle = 2.0 * FPA_bo * trig.degrees2radians + halfAngle
+    sinHalfAngle, cosHalfAngle = numpy.sin(halfAngle), numpy.cos(halfAngle)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        return -(sinHalfAngle + numpy.sin(angle)) / (0.5 * Q_bo * (cosHalfAngle + numpy.cos(angle)) - cosHalfAngle) \
+            * trig.radians2degrees
+
+
+def solveForRequiredQRefined(freeFlightRange, FPA_bo, initialQ=None, tolerance: float = 1e-12,
+                             maxIterations: int = 100) -> numpy.ndarray:
+    """
+    This solves for the Q at burnout that gives a free-flight range angle at a burnout flight path angle, by a
+    bracketed Newton iteration on equation 6.2-12 from the BMW book.
+
+    Each element starts from `initialQ` where given (e.g. the solution at a neighbouring grid point) and from
+    the closed form of `solveForRequiredQ` otherwise, keeps the bracket (0, 2) narrowed around the root and
+    bisects whenever a Newton step would leave it.  Only the elements still iterating are evaluated.  An
+    element has converged when the range it gives is within `tolerance` of the target or the bracket is down
+    to rounding; unreachable elements are NaN.  Where equation 6.2-12 cannot resolve `tolerance` (short
+    ranges, where it loses precision in the arccos), the iteration stalls short of it or it has not converged
+    after `maxIterations` (near horizontal burnouts close to psi = 270), the closed form is returned, as
+    polishing against the rounding would only move Q away from the exact root.
+    Args:
+        freeFlightRange (numpy.ndarray): Free-flight range angle (degrees)
+        FPA_bo (numpy.ndarray): flight path angle at burnout (degrees)
+        initialQ (numpy.ndarray): starting Q, broadcast against the other inputs; NaN elements use the closed form
+        tolerance (float): free-flight range angle tolerance (degrees)
+        maxIterations (int): iteration cap
+
+    Returns:
+        numpy.ndarray: Q at burnout
+    """
+    closedForm = solveForRequiredQ(freeFlightRange, FPA_bo)
+    shape = closedForm.shape
+    targetRange = numpy.broadcast_to(numpy.asarray(freeFlightRange, dtype=float), shape).reshape(-1)
+    fpa = numpy.broadcast_to(numpy.asarray(FPA_bo, dtype=float), shape).reshape(-1)
+
+    exact = closedForm.reshape(-1)
+    Q_bo = exact.copy()
+    if initialQ is not None:
+        initialQ = numpy.broadcast_to(numpy.asarray(initialQ, dtype=float), shape).reshape(-1)
+        warm = numpy.isfinite(Q_bo) & (initialQ > 0.0) & (initialQ < 2.0)
+        Q_bo[warm] = initialQ[warm]
+
+    # equation 6.2-12 only resolves psi to a few eps / sin(psi/2) (the arccos near 1), far coarser than
+    # `tolerance` at short ranges; there its residual cannot tell a better Q from the exact closed form
+    with numpy.errstate(divide='ignore'):
+        resolution = numpy.maximum(tolerance, 8.0 * _epsilon * trig.radians2degrees /
+                                   numpy.abs(numpy.sin(targetRange * (0.5 * trig.degrees2radians))))
+
+    low = numpy.zeros(Q_bo.shape)
+    high = numpy.full(Q_bo.shape, 2.0)
+    active = numpy.flatnonzero(numpy.isfinite(Q_bo))
+    for _ in range(maxIterations):
+        if active.size == 0:
+            break
+        q = Q_bo[active]
+        reached = six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ(q, fpa[active])
+        residual = reached - targetRange[active]
+
+        low[active] = numpy.where(residual < 0.0, q, low[active])
+        high[active] = numpy.where(residual > 0.0, q, high[active])
+        step = residual / _rangeSlope(q, fpa[active], reached)
+        stepped = q - step
+        inside = (stepped >= low[active]) & (stepped <= high[active])
+        Q_bo[active] = numpy.where(inside, stepped, 0.5 * (low[active] + high[active]))
+
+        # where equation 6.2-12 itself cannot resolve `tolerance` (tiny ranges, near horizontal burnout at Q ~ 1)
+        # the iteration ends up stepping back and forth between the two ends of the bracket
+        rounding = 4.0 * _epsilon * q
+        stalled = (stepped == low[active]) | (stepped == high[active]) | (high[active] - low[active] <= rounding)
+        hit = numpy.abs(residual) <= tolerance
+        newton = inside & (numpy.abs(step) <= rounding)
+        unresolved = ((numpy.abs(residual) <= resolution[active]) & (resolution[active] > tolerance)) | \
+            (stalled & ~newton & ~hit)
+        hit &= ~unresolved
+        converged = hit | newton | unresolved
+        # where the iteration can do no better than the rounding of equation 6.2-12, the closed form is kept
+        Q_bo[active] = numpy.where(hit, q, numpy.where(unresolved, exact[active],
+                                                       numpy.where(newton, stepped, Q_bo[active])))
+        active = active[~converged]
+
+    # the closed form is exact, only not always to the last bits of equation 6.2-12
+    Q_bo[active] = exact[active]
+    return Q_bo.reshape(shape)
+
+
+def solveForBurnoutVelocity(freeFlightRange, FPA_bo, r_bo, returntype: ReturnType, initialQ=None,
+                            refine: bool = True, errors: str = 'nan') -> (numpy.ndarray, numpy.ndarray):
+    """
+    This solves for the burnout Q and velocity that reach a free-flight range angle at a burnout flight path
+    angle and radius, using equation 6.2-16 (or 6.2-12) for Q and equation 6.2-1 for the velocity.
+    Args:
+        freeFlightRange (numpy.ndarray): Free-flight range angle (degrees)
+        FPA_bo (numpy.ndarray): flight path angle at burnout (degrees)
+        r_bo (numpy.ndarray): radius at burnout
+        returntype (ReturnType): How the units are given and expected to return
+        initialQ (numpy.ndarray): warm start of the refinement, see `solveForRequiredQRefined`
+        refine (bool): polish the closed form Q on equation 6.2-12
+        errors (str): 'nan', or 'mask' to also return one status for each (Q, velocity) pair
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): Q at burnout and velocity at burnout, NaN where unreachable
+    """
+    domain_status.checkErrors(errors)
+    if refine:
+        Q_bo = solveForRequiredQRefined(freeFlightRange, FPA_bo, initialQ)
+    else:
+        Q_bo = solveForRequiredQ(freeFlightRange, FPA_bo)
+    r_bo = numpy.asarray(r_bo, dtype=float)
+    Q_bo = numpy.broadcast_to(Q_bo, numpy.broadcast(Q_bo, r_bo).shape)
+    v_bo = six_02_general_ballistic_missile_problem_vectorized.solveForVelocity621(Q_bo, r_bo, returntype)
+
+    if errors == 'mask':
+        return domain_status.classify((Q_bo, v_bo), degenerate=_isDegenerate(freeFlightRange, FPA_bo))
+    return Q_bo, v_bo
@@ -0,0 +1,292 @@
+"""
+Precomputed free-flight angle surface psi(Q :sub:`bo`, FPA :sub:`bo`) for batched lookups.
+
+`RangeTable` is opt-in: nothing in the package uses it unless asked.  A table is built once on a uniform grid
+from the exact equation 6.2-12, saved as a `.npy` file (values) next to a `.json` file (grid, build arguments
+and error bound) and memory-mapped on load, so worker start-up does not rebuild or even read the whole surface.
+`loadOrBuild` rebuilds a saved table whose build arguments or format version differ from those asked for.
+
+With NumPy the exact equation (`six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ`)
+costs about the same as a bilinear lookup, so the table only pays off where the exact equation is not
+available in array form or where a fixed, pre-validated surface is wanted.
+
+Error bound
+-----------
+When a range table is built, both interpolation methods are checked against the exact equation on a grid four
+times as fine as the table, and the largest absolute differences, raised by 10 per cent for peaks falling between
+those samples, are stored with the table (`getMaxError`).  The surface is smooth except at Q = 1, FPA = 0, where
+psi jumps from 0 to 360 degrees; a table spanning that corner would have a bound of about 90 degrees.  The
+default table therefore starts at FPA = 1 degree and stops at Q = 1.8, like the time of flight table, for a
+bound of about 0.7 degrees bilinear and 0.3 degrees bicubic, set just above FPA = 1 near Q = 1.  Restricting
+the table further to the domain actually in use (e.g. Q < 0.98 or FPA > 5) gives a much smaller bound.
+"""
+import inspect
+import json
+import math
+import os
+
+import numpy
+
+from six_ballisticMissileTrajectories import domain_status, six_02_general_ballistic_missile_problem_vectorized
+
+_errorMargin = 1.1
+
+
+def _keysWeights(f: numpy.ndarray) -> tuple:
+    # cubic convolution kernel (Keys, a = -0.5) for the four neighbours at offsets -1, 0, 1, 2
+    f2 = f*f
+    f3 = f2*f
+    return (-0.5*f3 + f2 - 0.5*f,
+            1.5*f3 - 2.5*f2 + 1.0,
+            -1.5*f3 + 2.0*f2 + 0.5*f,
+            0.5*f3 - 0.5*f2)
+
+
+class GridTable():
+    """
+    A function of two variables sampled on a uniform grid, with bilinear and bicubic interpolation.
+
+    The values are kept with a border of one extra node on every side, extrapolated linearly from the edge
+    (f[-1] = 2 f[0] - f[1]), so the bicubic stencil never has to special-case the edges.
+    """
+    _values = None
+    _xMin = math.nan
+    _xMax = math.nan
+    _yMin = math.nan
+    _yMax = math.nan
+    _maxError = None
+    _buildArguments = None
+
+    # version of the saved format and of the way `build` samples its grid; tables saved with another version are
+    # rebuilt by `loadOrBuild`.  2: the build arguments are saved, the default range table starts at FPA = 1
+    formatVersion = 2
+
+    def __init__(self, paddedValues: numpy.ndarray, xMin: float, xMax: float, yMin: float, yMax: float, maxError: dict = None):
+        self._values = paddedValues
+        self._xMin = float(xMin)
+        self._xMax = float(xMax)
+        self._yMin = float(yMin)
+        self._yMax = float(yMax)
+        self._maxError = dict(maxError or {})
+
+        self._xStep = (self._xMax - self._xMin) / (paddedValues.shape[0] - 3)
+        self._yStep = (self._yMax - self._yMin) / (paddedValues.shape[1] - 3)
+
+    @staticmethod
+    def _pad(values: numpy.ndarray) -> numpy.ndarray:
+        padded = numpy.empty((values.shape[0] + 2, values.shape[1] + 2))
+        padded[1:-1, 1:-1] = values
+        padded[0, 1:-1] = 2.0*values[0] - values[1]
+        padded[-1, 1:-1] = 2.0*values[-1] - values[-2]
+        padded[:, 0] = 2.0*padded[:, 1] - padded[:, 2]
+        padded[:, -1] = 2.0*padded[:, -2] - padded[:, -3]
+        return padded
+
+    def getValues(self) -> numpy.ndarray:
+        return self._values[1:-1, 1:-1]
+
+    def getMaxError(self, method: str = 'bilinear') -> float:
+        """
+        Largest absolute interpolation error measured when the table was built
+        Args:
+            method (str): 'bilinear' or 'bicubic'
+
+        Returns:
+            float: error bound in the units of the tabulated function (NaN if never measured)
+        """
+        return self._maxError.get(method, math.nan)
+
+    @staticmethod
+    def _locate(t: numpy.ndarray, tMin: float, step: float, cells: int) -> (numpy.ndarray, numpy.ndarray):
+        position = numpy.nan_to_num((t - tMin) / step)
+        index = numpy.clip(numpy.floor(position), 0, cells - 1)
+        return index.astype(numpy.intp), position - index
+
+    def interpolate(self, x, y, method: str = 'bilinear', errors: str = 'nan') -> numpy.ndarray:
+        """
+        Interpolates the table at the broadcast (x, y) points.  Points outside of the grid return NaN, and are
+        UNREACHABLE with `errors='mask'`: the table has no value there.
+        Args:
+            x (numpy.ndarray): first coordinate
+            y (numpy.ndarray): second coordinate
+            method (str): 'bilinear' or 'bicubic'
+            errors (str): 'nan', or 'mask' to also return the status of each point
+
+        Returns:
+            numpy.ndarray: interpolated values
+        """
+        domain_status.checkErrors(errors)
+        x, y = numpy.broadcast_arrays(numpy.asarray(x, dtype=float), numpy.asarray(y, dtype=float))
+        rows, columns = self._values.shape
+        i, fx = self._locate(x, self._xMin, self._xStep, rows - 3)
+        j, fy = self._locate(y, self._yMin, self._yStep, columns - 3)
+
+        # flat index of node (i, j) inside of the padded table
+        flat = self._values.reshape(-1)
+        base = (i + 1) * columns + (j + 1)
+
+        if method == 'bilinear':
+            top = numpy.take(flat, base)
+            top += (numpy.take(flat, base + 1) - top) * fy
+            bottom = numpy.take(flat, base + columns)
+            bottom += (numpy.take(flat, base + columns + 1) - bottom) * fy
+            output = top + (bottom - top) * fx
+        elif method == 'bicubic':
+            wx = _keysWeights(fx)
+            wy = _keysWeights(fy)
+            output = numpy.zeros(x.shape)
+            for a in range(4):
+                rowBase = base + (a - 1) * columns
+                row = wy[0] * numpy.take(flat, rowBase - 1)
+                for b in range(1, 4):
+                    row += wy[b] * numpy.take(flat, rowBase + (b - 1))
+                output += wx[a] * row
+        else:
+            raise ValueError("Unknown interpolation method: %s" % method)
+
+        inside = (x >= self._xMin) & (x <= self._xMax) & (y >= self._yMin) & (y <= self._yMax)
+        output = numpy.where(inside, output, numpy.nan)
+
+        if errors == 'mask':
+            return domain_status.classify(output, unreachable=~inside)
+        return output
+
+    def _measureMaxError(self, exact, refinement: int = 2) -> dict:
+        # every point of a grid `refinement` times as fine that is not a table node
+        rows, columns = self.getValues().shape
+        xFine = numpy.linspace(self._xMin, self._xMax, refinement * (rows - 1) + 1)
+        yFine = numpy.linspace(self._yMin, self._yMax, refinement * (columns - 1) + 1)
+        offNode = numpy.ones((xFine.size, yFine.size), dtype=bool)
+        offNode[::refinement, ::refinement] = False
+
+        expected = exact(xFine[:, None], yFine[None, :])
+        maxError = {}
+        for method in ('bilinear', 'bicubic'):
+            error = numpy.abs(self.interpolate(xFine[:, None], yFine[None, :], method) - expected)[offNode]
+            maxError[method] = float(numpy.nanmax(error))
+        return maxError
+
+    def _metadata(self) -> dict:
+        return {'kind': type(self).__name__,
+                'version': self.formatVersion,
+                'build': self._buildArguments,
+                'shape': list(self.getValues().shape),
+                'xMin': self._xMin, 'xMax': self._xMax,
+                'yMin': self._yMin, 'yMax': self._yMax,
+                'maxError': self._maxError}
+
+    def save(self, path: str):
+        """
+        Writes the values (including the extrapolated border) to `path` (a `.npy` file) and the grid definition to
+        `path + '.json'`.  The values replace an existing file rather than overwrite it, so tables already
+        memory-mapped from it keep their values.
+        Args:
+            path (str): file name of the table
+        """
+        temporaryPath = path + '.%d.tmp' % os.getpid()
+        with open(temporaryPath, 'wb') as valuesFile:
+            numpy.save(valuesFile, numpy.ascontiguousarray(self._values), allow_pickle=False)
+        os.replace(temporaryPath, path)
+        with open(path + '.json', 'w') as metadataFile:
+            json.dump(self._metadata(), metadataFile, indent=2)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True):
+        """
+        Opens a table written by `save`.  The values are memory-mapped read-only unless `mmap` is False.
+        Args:
+            path (str): file name of the table
+            mmap (bool): memory-map the values instead of reading them
+
+        Returns:
+            GridTable: the table
+        """
+        with open(path + '.json') as metadataFile:
+            metadata = json.load(metadataFile)
+        if metadata['kind'] != cls.__name__:
+            raise ValueError("%s holds a %s, not a %s" % (path, metadata['kind'], cls.__name__))
+
+        values = numpy.load(path, mmap_mode='r' if mmap else None, allow_pickle=False)
+        table = cls(values, metadata['xMin'], metadata['xMax'], metadata['yMin'], metadata['yMax'], metadata['maxError'])
+        table._buildArguments = metadata.get('build')
+        return table
+
+    @classmethod
+    def _resolveBuildArguments(cls, grid: dict) -> dict:
+        # every argument of `build`, the defaults included, as saved in the metadata
+        arguments = inspect.signature(cls.build).bind(**grid)
+        arguments.apply_defaults()
+        return dict(arguments.arguments)
+
+    @classmethod
+    def loadOrBuild(cls, path: str, **grid):
+        """
+        Memory-maps the table at `path` if it was built by this version of `build(**grid)` of the subclass,
+        otherwise (no table, other arguments, defaults or format version) builds it and saves it there.
+        Args:
+            path (str): file name of the table
+            **grid: grid arguments of `build`
+
+        Returns:
+            GridTable: the table
+        """
+        arguments = cls._resolveBuildArguments(grid)
+        try:
+            with open(path + '.json') as metadataFile:
+                metadata = json.load(metadataFile)
+        except FileNotFoundError:
+            metadata = None
+
+        if metadata is not None and (metadata['kind'] != cls.__name__ or
+                                     (metadata.get('version') == cls.formatVersion and metadata.get('build') == arguments)):
+            return cls.load(path)
+        table = cls.build(**arguments)
+        table.save(path)
+        return cls.load(path)
+
+
+class RangeTable(GridTable):
+    """
+    Free-flight angle psi (degrees) tabulated over Q :sub:`bo` (first axis) and FPA :sub:`bo` (second axis, degrees).
+    """
+
+    @classmethod
+    def build(cls, qPoints: int = 401, fpaPoints: int = 361, qMin: float = 0.0, qMax: float = 1.8,
+              fpaMin: float = 1.0, fpaMax: float = 90.0):
+        """
+        Evaluates equation 6.2-12 on a uniform grid and measures the interpolation error bound.
+        Args:
+            qPoints (int): number of Q samples
+            fpaPoints (int): number of flight path angle samples
+            qMin (float): smallest Q
+            qMax (float): largest Q
+            fpaMin (float): smallest flight path angle (degrees), above 0 to keep the jump at Q = 1, FPA = 0 out
+            fpaMax (float): largest flight path angle (degrees)
+
+        Returns:
+            RangeTable: the table
+        """
+        exact = six_02_general_ballistic_missile_problem_vectorized.solveForFreeFlightAngleFromQ
+
+        q = numpy.linspace(qMin, qMax, qPoints)
+        fpa = numpy.linspace(fpaMin, fpaMax, fpaPoints)
+        table = cls(cls._pad(exact(q[:, None], fpa[None, :])), qMin, qMax, fpaMin, fpaMax)
+        table._buildArguments = {'qPoints': qPoints, 'fpaPoints': fpaPoints, 'qMin': qMin, 'qMax': qMax,
+                                 'fpaMin': fpaMin, 'fpaMax': fpaMax}
+        table._maxError = {method: _errorMargin * maxError
+                           for method, maxError in table._measureMaxError(exact, refinement=4).items()}
+        return table
+
+    def getFreeFlightAngle(self, Q_bo, FPA_bo, method: str = 'bilinear', errors: str = 'nan') -> numpy.ndarray:
+        """
+        Interpolated equation 6.2-12, accurate to `getMaxError(method)` degrees inside of the table.
+        Args:
+            Q_bo (numpy.ndarray): Nondimentional Parameter at burnout
+            FPA_bo (numpy.ndarray): flight path angle at burn out (degrees)
+            method (str): 'bilinear' or 'bicubic'
+            errors (str): 'nan', or 'mask' to also return the status of each element (UNREACHABLE outside of the table)
+
+        Returns:
+            numpy.ndarray: Free Flight Angle (degrees), NaN outside of the table
+        """
+        return self.interpolate(Q_bo, FPA_bo, method, errors)
@@ -0,0 +1,85 @@
+"""
+Batch targeting: minimum-energy Q and burnout flight path angles for many free-flight ranges at once.
+"""
+import numpy
+
+from six_ballisticMissileTrajectories import domain_status, six_02_general_ballistic_missile_problem_vectorized
+
+targetingSolutionDtype = numpy.dtype([('freeFlightRange', numpy.float64),
+                                      ('Q_bo', numpy.float64),
+                                      ('minimumEnergyQ', numpy.float64),
+                                      ('maxRangeFPA', numpy.float64),
+                                      ('lowFPA', numpy.float64),
+                                      ('highFPA', numpy.float64),
+                                      ('reachable', numpy.bool_)])
+"""
+Fields of a targeting solution.  Angles are in degrees; `lowFPA` and `highFPA` are NaN where `reachable` is False,
+and `lowFPA` also where the low trajectory would start below the horizontal.
+"""
+
+
+def solveForTargetingSolutions(freeFlightRange, Q_bo=None, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves the targeting problem for every free-flight range in one pass:
+
+    - the minimum-energy Q that just reaches the range (equation 6.2-20) and its flight path angle (equation 6.2-18)
+    - the low and high trajectory flight path angles for the available Q (equation 6.2-16)
+    - whether the range can be reached with the available Q at all
+
+    No exceptions are raised for unreachable targets (including escape trajectories, Q of 2 or more); they are
+    flagged in the `reachable` field instead.  A low trajectory that would need a negative flight path angle is
+    dropped (`lowFPA` is NaN) and the target flown on the high trajectory only; a target whose high trajectory
+    (with `Q_bo` omitted, the minimum-energy one, beyond psi = 180) would need one too is unreachable.  With `errors='mask'` the status
+    of each target is also returned, UNREACHABLE where `reachable` is False.
+    Args:
+        freeFlightRange (numpy.ndarray): Free-flight range angles (degrees)
+        Q_bo (numpy.ndarray): available Q at burnout, broadcast against `freeFlightRange`.  When omitted every
+            target is flown on its minimum-energy trajectory.
+        errors (str): 'nan', or 'mask' to also return the status of each target
+
+    Returns:
+        numpy.ndarray: structured array of `targetingSolutionDtype` with the broadcast shape of the inputs
+    """
+    domain_status.checkErrors(errors)
+    vectorized = six_02_general_ballistic_missile_problem_vectorized
+
+    freeFlightRange = numpy.asarray(freeFlightRange, dtype=float)
+    minimumEnergyQ = vectorized.solveForRequiredQAtMaxRange(freeFlightRange)
+    maxRangeFPA = vectorized.solveForMaxBurnoutFlightPathAngle(freeFlightRange)
+
+    if Q_bo is None:
+        Q_bo = minimumEnergyQ
+        lowFPA = highFPA = maxRangeFPA
+    else:
+        Q_bo = numpy.asarray(Q_bo, dtype=float)
+        lowFPA, highFPA = vectorized.solveForFlightPathAngle(freeFlightRange, Q_bo)
+
+        # at exactly the minimum-energy Q both solutions collapse onto the max range trajectory, where rounding
+        # can put the arcsin argument a hair above 1
+        atMinimumEnergy = numpy.isnan(lowFPA) & (numpy.abs(Q_bo - minimumEnergyQ) <= 1e-12 * minimumEnergyQ)
+        lowFPA = numpy.where(atMinimumEnergy, maxRangeFPA, lowFPA)
+        highFPA = numpy.where(atMinimumEnergy, maxRangeFPA, highFPA)
+
+    shape = numpy.broadcast(freeFlightRange, Q_bo, lowFPA).shape
+    solutions = numpy.empty(shape, dtype=targetingSolutionDtype)
+    solutions['freeFlightRange'] = freeFlightRange
+    solutions['Q_bo'] = Q_bo
+    solutions['minimumEnergyQ'] = minimumEnergyQ
+    solutions['maxRangeFPA'] = maxRangeFPA
+    solutions['lowFPA'] = lowFPA
+    solutions['highFPA'] = highFPA
+    # Q of 2 or more escapes and never comes back down, and a negative FPA would fly into the Earth: without a high
+    # trajectory above the horizontal (e.g. the minimum energy one beyond psi = 180) the target is unreachable, and
+    # a low one below it is dropped
+    with numpy.errstate(invalid='ignore'):
+        solutions['reachable'] = (freeFlightRange > 0.0) & (freeFlightRange < 360.0) & \
+            (Q_bo > 0.0) & (Q_bo < 2.0) & (solutions['highFPA'] >= 0.0)
+    solutions['lowFPA'][solutions['lowFPA'] < 0.0] = numpy.nan
+    unreachable = ~solutions['reachable']
+    solutions['lowFPA'][unreachable] = numpy.nan
+    solutions['highFPA'][unreachable] = numpy.nan
+
+    if errors == 'mask':
+        status = domain_status.classify(solutions['highFPA'], unreachable=unreachable).status
+        return domain_status.MaskedResult(solutions, status)
+    return solutions
@@ -0,0 +1,125 @@
+"""
+Precomputed time of free flight surface for batched lookups of any symmetric trajectory.
+
+The time of free flight scales with the burnout radius as sqrt(r_bo^3 / mu), so it is tabulated once in canonical
+units (r_bo = 1 DU, mu = 1) as T(Q :sub:`bo`, FPA :sub:`bo`) and scaled back for each query:
+
+    TOF = sqrt(r_bo^3 / mu) T(Q_bo, FPA_bo)
+
+The surface is keyed on the burnout flight path angle rather than on the free-flight angle psi: a given (Q, psi)
+is flown by both a low and a high trajectory with different times of flight (equation 6.2-16), whereas (Q, FPA)
+fixes the trajectory.  The first axis is sqrt(Q) = v_bo / v_cs rather than Q itself: slow shots fly for
+2 v_bo sin(FPA) / g, so T has an unbounded slope in Q at Q = 0 but not in sqrt(Q).  The border nodes around the
+grid are exact values too (linear extrapolation only below v_bo = 0), as T bends sharply towards Q = 2.
+
+Like `six_02_range_table.RangeTable` the table is opt-in, saved as a `.npy` file next to a `.json` file and
+memory-mapped on load.
+
+Error bound
+-----------
+When a table is built both interpolation methods are checked against the exact equations on a grid four times as
+fine as the table, and the largest absolute differences, raised by 10 per cent for peaks falling between those
+samples, are stored with the table (`getMaxError`, canonical time units for r_bo = 1 DU).
+`getMaxTimeOfFlightError` scales the bound to a burnout radius and unit system.  T grows as (2 - Q)^-1.5, so the
+default table stops at Q = 1.8, and it jumps from 0 to a full period at Q = 1, FPA = 0 (where psi jumps from 0 to
+360 degrees), so the default table starts at FPA = 1 degree; it changes fastest just above that, near Q = 1, where
+the bound is set.
+"""
+import math
+
+import numpy
+
+from constants import earth
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import domain_status, six_02_general_ballistic_missile_problem_vectorized
+from six_ballisticMissileTrajectories.six_02_range_table import GridTable
+
+_errorMargin = 1.1
+
+
+def _canonicalTimeOfFlight(speedRatio, FPA_bo) -> numpy.ndarray:
+    # time of free flight for r_bo = 1 DU in canonical units, where v_bo = sqrt(Q_bo) is the speed ratio
+    return six_02_general_ballistic_missile_problem_vectorized.solveForTimeOfFreeFlightFromBurnout(
+        1.0, speedRatio, FPA_bo, ReturnType.CANONICAL)
+
+
+class TimeOfFlightTable(GridTable):
+    """
+    Canonical time of free flight (r_bo = 1 DU, mu = 1) tabulated over sqrt(Q :sub:`bo`) (first axis) and
+    FPA :sub:`bo` (second axis, degrees).  Queries are made with Q :sub:`bo`.
+    """
+
+    @classmethod
+    def build(cls, qPoints: int = 361, fpaPoints: int = 361, qMin: float = 0.0, qMax: float = 1.8,
+              fpaMin: float = 1.0, fpaMax: float = 90.0):
+        """
+        Evaluates equations 6.2-12, 6.2-21 and 6.2-22 on a uniform grid and measures the interpolation error bound.
+        Args:
+            qPoints (int): number of samples along the Q axis (uniform in sqrt(Q))
+            fpaPoints (int): number of flight path angle samples
+            qMin (float): smallest Q
+            qMax (float): largest Q, below 2
+            fpaMin (float): smallest flight path angle (degrees)
+            fpaMax (float): largest flight path angle (degrees)
+
+        Returns:
+            TimeOfFlightTable: the table
+        """
+        speedRatio = numpy.linspace(math.sqrt(qMin), math.sqrt(qMax), qPoints)
+        fpa = numpy.linspace(fpaMin, fpaMax, fpaPoints)
+
+        # the grid with one more node on every side
+        speedStep = speedRatio[1] - speedRatio[0]
+        fpaStep = fpa[1] - fpa[0]
+        speedRatio = numpy.concatenate(([speedRatio[0] - speedStep], speedRatio, [speedRatio[-1] + speedStep]))
+        fpa = numpy.concatenate(([fpa[0] - fpaStep], fpa, [fpa[-1] + fpaStep]))
+        values = _canonicalTimeOfFlight(speedRatio[:, None], fpa[None, :])
+        values = numpy.where(numpy.isfinite(values) & (speedRatio[:, None] >= 0.0), values, cls._pad(values[1:-1, 1:-1]))
+
+        table = cls(values, speedRatio[1], speedRatio[-2], fpaMin, fpaMax)
+        table._buildArguments = {'qPoints': qPoints, 'fpaPoints': fpaPoints, 'qMin': qMin, 'qMax': qMax,
+                                 'fpaMin': fpaMin, 'fpaMax': fpaMax}
+        table._maxError = {method: _errorMargin * maxError
+                           for method, maxError in table._measureMaxError(_canonicalTimeOfFlight, refinement=4).items()}
+        return table
+
+    def getTimeOfFlight(self, Q_bo, FPA_bo, r_bo=1.0, returntype: ReturnType = ReturnType.CANONICAL,
+                        method: str = 'bilinear', errors: str = 'nan') -> numpy.ndarray:
+        """
+        Interpolated time of free flight, accurate to `getMaxTimeOfFlightError(r_bo, returntype, method)` inside of
+        the table.
+        Args:
+            Q_bo (numpy.ndarray): Nondimentional Parameter at burnout
+            FPA_bo (numpy.ndarray): flight path angle at burn out (degrees)
+            r_bo (numpy.ndarray): radius at burnout
+            returntype (ReturnType): How the units are given and expected to return
+            method (str): 'bilinear' or 'bicubic'
+            errors (str): 'nan', or 'mask' to also return the status of each element (UNREACHABLE outside of the table)
+
+        Returns:
+            numpy.ndarray: time for free flight in ReturnType units, NaN outside of the table
+        """
+        domain_status.checkErrors(errors)
+        r_bo = numpy.asarray(r_bo, dtype=float)
+        with numpy.errstate(invalid='ignore'):
+            speedRatio = numpy.sqrt(numpy.asarray(Q_bo, dtype=float))
+        output = numpy.sqrt(r_bo*r_bo*r_bo / earth.getMu(returntype)) * self.interpolate(speedRatio, FPA_bo, method)
+
+        if errors == 'mask':
+            return domain_status.classify(output)
+        return output
+
+    def getMaxTimeOfFlightError(self, r_bo=1.0, returntype: ReturnType = ReturnType.CANONICAL,
+                                method: str = 'bilinear') -> numpy.ndarray:
+        """
+        Interpolation error bound of `getTimeOfFlight` at a burnout radius
+        Args:
+            r_bo (numpy.ndarray): radius at burnout
+            returntype (ReturnType): How the units are given and expected to return
+            method (str): 'bilinear' or 'bicubic'
+
+        Returns:
+            numpy.ndarray: error bound in ReturnType time units (NaN if never measured)
+        """
+        r_bo = numpy.asarray(r_bo, dtype=float)
+        return numpy.sqrt(r_bo*r_bo*r_bo / earth.getMu(returntype)) * self.getMaxError(method)
@@ -0,0 +1,107 @@
+"""
+Points along the free-flight ellipse of many missiles at once, from burnout to re-entry at the burnout radius.
+
+Burnout is at the true anomaly `180 - psi/2` (equation 6.2-7) and re-entry at `180 + psi/2`.  Samples are
+evenly spaced in time or in true anomaly; the radius comes from equation 6.2-5, the time from the eccentric
+anomaly (equation 4.2-8) through Kepler's equation, the velocity from the energy equation (1.4-2) and the
+flight path angle from `tan(fpa) = e sin(v) / (1 + e cos(v))`.
+"""
+import math
+
+import numpy
+
+from constants import earth, trig
+from constants.earth import ReturnType
+from four_position_and_velocity_a_funcion_of_time import four_02_time_of_flight_eccentric_anomoly_vectorized
+from six_ballisticMissileTrajectories import domain_status, six_02_general_ballistic_missile_problem_vectorized
+
+ephemerisDtype = numpy.dtype([('time', numpy.float64),
+                              ('rangeAngle', numpy.float64),
+                              ('trueAnomaly', numpy.float64),
+                              ('radius', numpy.float64),
+                              ('velocity', numpy.float64),
+                              ('flightPathAngle', numpy.float64)])
+"""
+Fields of one ephemeris point.  `time` is since burnout (time unit of the `ReturnType`), `rangeAngle` is the
+central angle travelled since burnout and every angle is in degrees.  Missiles without a ballistic trajectory
+(Q >= 2 or no positive free-flight range) have NaN in every field.
+"""
+
+
+def _eccentricAnomaly(e: numpy.ndarray, trueAnomaly: numpy.ndarray) -> numpy.ndarray:
+    # equation 4.2-8 gives E in [0, 180], the descending half of the orbit needs 360 - E
+    capE = four_02_time_of_flight_eccentric_anomoly_vectorized.solveforEccentricAnomoly(e, trueAnomaly)
+    return numpy.where(numpy.mod(trueAnomaly, 360.0) > 180.0, 360.0 - capE, capE)
+
+
+def generateEphemeris(r_bo, v_bo, fpa_bo, returntype: ReturnType, samples: int = 101, sampling: str = 'time',
+                      out: numpy.ndarray = None, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This samples the free-flight trajectory of every missile from burnout to re-entry in one vectorized pass.
+    Args:
+        r_bo (numpy.ndarray): burnout radius of each missile
+        v_bo (numpy.ndarray): burnout velocity of each missile
+        fpa_bo (numpy.ndarray): burnout flight path angle of each missile (degrees)
+        returntype (ReturnType): unit system
+        samples (int): points per trajectory, including burnout and re-entry
+        sampling (str): 'time' for points evenly spaced in time, 'anomaly' for points evenly spaced in true anomaly
+        out (numpy.ndarray): optional (missiles x samples) array of `ephemerisDtype` to fill instead of allocating
+        errors (str): 'nan', or 'mask' to also return the status of each missile (UNREACHABLE without a
+            ballistic trajectory)
+
+    Returns:
+        numpy.ndarray: (missiles x samples) array of `ephemerisDtype`
+    """
+    domain_status.checkErrors(errors)
+    six_02 = six_02_general_ballistic_missile_problem_vectorized
+
+    r_bo, v_bo, fpa_bo = numpy.broadcast_arrays(*(numpy.atleast_1d(numpy.asarray(x, dtype=float)) for x in (r_bo, v_bo, fpa_bo)))
+    r_bo, v_bo, fpa_bo = (x.reshape(-1)[:, None] for x in (r_bo, v_bo, fpa_bo))
+    if sampling not in ('time', 'anomaly'):
+        raise ValueError("sampling must be 'time' or 'anomaly', not %r" % sampling)
+
+    shape = (r_bo.shape[0], samples)
+    if out is None:
+        out = numpy.empty(shape, dtype=ephemerisDtype)
+    elif out.shape != shape or out.dtype != ephemerisDtype:
+        raise ValueError("out must be a %s array of ephemerisDtype" % (shape,))
+
+    mu = earth.getMu(returntype)
+    Q_bo = six_02.solveForNondimentionalParametericParameter621(v_bo, r_bo, returntype)
+    freeFlightAngle = six_02.solveForFreeFlightAngleFromQ(Q_bo, fpa_bo)
+    freeFlightAngle = numpy.where((Q_bo < 2.0) & (freeFlightAngle > 0.0), freeFlightAngle, numpy.nan)
+    e = six_02.solveForEccentricity(Q_bo, fpa_bo)
+    a = six_02.solveForSemiMajorAxis(r_bo, Q_bo)
+    cosFPA = numpy.cos(fpa_bo * trig.degrees2radians)
+    p = r_bo * Q_bo * cosFPA * cosFPA
+    with numpy.errstate(invalid='ignore'):
+        meanMotion = numpy.sqrt(mu / (a * a * a))
+
+    anomalyAtBurnout = six_02.solveForAnomalyAngleAtBurnout(freeFlightAngle)
+    four_02 = four_02_time_of_flight_eccentric_anomoly_vectorized
+    meanAnomalyAtBurnout = four_02.solveForMeanAnomaly(e, _eccentricAnomaly(e, anomalyAtBurnout)) * trig.degrees2radians
+    fraction = numpy.linspace(0.0, 1.0, samples)
+
+    if sampling == 'anomaly':
+        trueAnomaly = anomalyAtBurnout + freeFlightAngle * fraction
+        meanAnomaly = four_02.solveForMeanAnomaly(e, _eccentricAnomaly(e, trueAnomaly)) * trig.degrees2radians
+        out['time'] = (meanAnomaly - meanAnomalyAtBurnout) / meanMotion
+    else:
+        timeOfFlight = 2.0 * (math.pi - meanAnomalyAtBurnout) / meanMotion
+        out['time'] = timeOfFlight * fraction
+        meanAnomaly = (meanAnomalyAtBurnout + meanMotion * out['time']) * trig.radians2degrees
+        capE = four_02.solveForEccentricAnomalyFromMeanAnomaly(e, meanAnomaly)
+        trueAnomaly = four_02.solveForTrueAnomalyFromEccentricAnomaly(e, capE)
+
+    out['trueAnomaly'] = trueAnomaly
+    out['rangeAngle'] = trueAnomaly - anomalyAtBurnout
+    radius = six_02.solveForRadiusOfEllipse(p, e, trueAnomaly)
+    out['radius'] = radius
+    with numpy.errstate(invalid='ignore'):
+        out['velocity'] = numpy.sqrt(mu * (2.0 / radius - 1.0 / a))
+    anomalyRad = trueAnomaly * trig.degrees2radians
+    out['flightPathAngle'] = numpy.arctan2(e * numpy.sin(anomalyRad), 1.0 + e * numpy.cos(anomalyRad)) * trig.radians2degrees
+
+    if errors == 'mask':
+        return domain_status.MaskedResult(out, domain_status.classify(freeFlightAngle[:, 0]).status)
+    return out
@@ -0,0 +1,115 @@
+"""
+Analytical impact miss statistics for many nominal trajectories at once, by linear covariance propagation.
+
+The miss is linear in the burnout errors (the same first order model `six_03_monte_carlo_dispersion` samples),
+so for each trajectory the (down-range, cross-range) mean and covariance follow exactly from the mean and
+covariance of the five burnout errors through the 2x5 Jacobian of the miss:
+
+    bias = J mean,    covariance = J C J^T
+
+Down-range partials come from equations 6.3-13, 6.3-16 and 6.3-18, cross-range partials from the small angle
+forms of equations 6.3-2 and 6.3-4 (`solveForInfluenceCoefficients` gives all of them in one pass).  Everything
+works on stacks: trajectories broadcast like NumPy ufuncs, Jacobians are (..., 2, 5), burnout covariances
+(5, 5) or (..., 5, 5) and miss covariances (..., 2, 2).
+
+Units follow `six_03_monte_carlo_dispersion`: `dv_bo` and `dr_bo` in the units of the trajectory, `dfpa_bo`,
+`lateral` and `azimuthal` in degrees, misses in degrees of central angle.
+"""
+import numpy
+
+from constants import trig
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_03_launching_errors_on_range_vectorized
+from six_ballisticMissileTrajectories.six_03_monte_carlo_dispersion import burnoutErrorNames
+
+
+def solveForMissJacobian(r_bo, v_bo, fpa_bo, returntype: ReturnType) -> numpy.ndarray:
+    """
+    This solves for the partials of the (down-range, cross-range) miss with respect to the burnout errors.
+    Args:
+        r_bo (numpy.ndarray): nominal burnout radius
+        v_bo (numpy.ndarray): nominal burnout velocity
+        fpa_bo (numpy.ndarray): nominal burnout flight path angle (degrees)
+        returntype (ReturnType): unit system of the trajectories
+
+    Returns:
+        numpy.ndarray: (..., 2, 5) Jacobians, columns in the order of `burnoutErrorNames`
+    """
+    influence = six_03_launching_errors_on_range_vectorized.solveForInfluenceCoefficients(r_bo, v_bo, fpa_bo, returntype)
+
+    jacobian = numpy.zeros(influence.freeFlightAngle.shape + (2, len(burnoutErrorNames)))
+    jacobian[..., 0, 0] = influence.burnoutVelocity * trig.radians2degrees
+    jacobian[..., 0, 1] = influence.burnoutHeight * trig.radians2degrees
+    jacobian[..., 0, 2] = influence.fpaError
+    jacobian[..., 1, 3] = influence.crossRangeLateral
+    jacobian[..., 1, 4] = influence.crossRangeAzimuthal
+    return jacobian
+
+
+def propagateCovariance(jacobian: numpy.ndarray, burnoutCovariance: numpy.ndarray) -> numpy.ndarray:
+    """
+    This propagates burnout error covariances through miss Jacobians, J C J^T, for a whole stack at once.
+    Args:
+        jacobian (numpy.ndarray): (..., 2, 5) Jacobians from `solveForMissJacobian`
+        burnoutCovariance (numpy.ndarray): (5, 5) or (..., 5, 5) covariances of the burnout errors
+
+    Returns:
+        numpy.ndarray: (..., 2, 2) covariances of the (down-range, cross-range) miss (degrees squared)
+    """
+    jacobian = numpy.asarray(jacobian, dtype=float)
+    return jacobian @ numpy.asarray(burnoutCovariance, dtype=float) @ numpy.swapaxes(jacobian, -1, -2)
+
+
+def solveForMissStatistics(r_bo, v_bo, fpa_bo, returntype: ReturnType, burnoutCovariance: numpy.ndarray,
+                           burnoutMean: numpy.ndarray = None) -> (numpy.ndarray, numpy.ndarray):
+    """
+    This solves for the mean and covariance of the impact miss of every trajectory.
+    Args:
+        r_bo (numpy.ndarray): nominal burnout radius
+        v_bo (numpy.ndarray): nominal burnout velocity
+        fpa_bo (numpy.ndarray): nominal burnout flight path angle (degrees)
+        returntype (ReturnType): unit system of the trajectories
+        burnoutCovariance (numpy.ndarray): (5, 5) or (..., 5, 5) covariances of the burnout errors
+        burnoutMean (numpy.ndarray): (5,) or (..., 5) means of the burnout errors, zero if not given
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): (..., 2) mean miss (degrees) and (..., 2, 2) miss covariance (degrees squared)
+    """
+    jacobian = solveForMissJacobian(r_bo, v_bo, fpa_bo, returntype)
+    covariance = propagateCovariance(jacobian, burnoutCovariance)
+    if burnoutMean is None:
+        bias = numpy.zeros(covariance.shape[:-1])
+    else:
+        bias = (jacobian @ numpy.asarray(burnoutMean, dtype=float)[..., None])[..., 0]
+    return bias, covariance
+
+
+def solveForErrorEllipses(covariance: numpy.ndarray, probability: float) -> (numpy.ndarray, numpy.ndarray, numpy.ndarray):
+    """
+    This solves for the ellipse about the mean impact point containing `probability` of jointly normal misses,
+    from the closed form eigen decomposition of each 2x2 covariance.  Same conventions as
+    `DispersionStatistics.getErrorEllipse`.
+    Args:
+        covariance (numpy.ndarray): (..., 2, 2) miss covariances (degrees squared)
+        probability (float): between 0 and 1
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray): semi-major axes (degrees), semi-minor axes (degrees) and
+        the angles of the semi-major axes from the down-range direction towards cross-range, in (-90, 90] (degrees)
+    """
+    covariance = numpy.asarray(covariance, dtype=float)
+    downRange = covariance[..., 0, 0]
+    crossRange = covariance[..., 1, 1]
+    correlation = 0.5 * (covariance[..., 0, 1] + covariance[..., 1, 0])
+
+    halfSum = 0.5 * (downRange + crossRange)
+    halfDifference = 0.5 * (downRange - crossRange)
+    radius = numpy.hypot(halfDifference, correlation)
+    scale = -2.0 * numpy.log1p(-probability)
+
+    semiMajor = numpy.sqrt(numpy.maximum(halfSum + radius, 0.0) * scale)
+    semiMinor = numpy.sqrt(numpy.maximum(halfSum - radius, 0.0) * scale)
+    # half of atan2 is in [-90, 90]; -90 (a negative zero correlation) is the same axis as 90
+    orientation = 0.5 * numpy.arctan2(correlation, halfDifference) * trig.radians2degrees
+    orientation = numpy.where(orientation <= -90.0, orientation + 180.0, orientation)
+    return semiMajor, semiMinor, orientation
@@ -1,9 +1,29 @@
 import math
+from typing import NamedTuple
 
 from constants import trig, earth
 from constants.earth import ReturnType
 
 
+class InfluenceCoefficients(NamedTuple):
+    """
+    Free-flight range angle of one trajectory and the sensitivity of its impact point to each burnout error,
+    as returned by `solveForInfluenceCoefficients`.  With arrays in, every field is an array.
+    """
+    freeFlightAngle: float
+    """free-flight range angle psi (degrees), equation 6.2-12"""
+    fpaError: float
+    """down range per burnout FPA error (radians per radian), equation 6.3-13"""
+    burnoutHeight: float
+    """down range per burnout height error (radians per unit length), equation 6.3-16"""
+    burnoutVelocity: float
+    """down range per burnout velocity error (radians per unit velocity), equation 6.3-18"""
+    crossRangeLateral: float
+    """cross range per lateral displacement error (degrees per degree), equation 6.3-2"""
+    crossRangeAzimuthal: float
+    """cross range per azimuth error (degrees per degree), equation 6.3-4"""
+
+
 def solveForCrossRangeErrorLateral(rangeAngle: float, lateralError: float) -> float:
     """
     This solves for the cross range error based on a thrust cutoff error.
@@ -192,3 +212,57 @@ def solveForInfluenceCoefficientBurnoutVelocityAlternative(r_bo: float, v_bo: fl
     """
     tmp1 = (2.0*r_bo)/v_bo
     return tmp1*icHeightError
+
+
+def solveForInfluenceCoefficients(r_bo: float, v_bo: float, fpa_bo: float, returntype: ReturnType) -> InfluenceCoefficients:
+    """
+    This solves for the free-flight range angle and every influence coefficient of a trajectory in one pass.
+    Only sin and cos of the flight path angle and one acos are taken: sin(psi/2) comes from cos(psi/2) of
+    equation 6.2-12, and the angles psi and 2 FPA from the double angle identities.
+     This is based on equations 6.2-12, 6.3-2, 6.3-4, 6.3-13, 6.3-16 and 6.3-18 from the BMW book
+    Args:
+        r_bo (float): burnout radius
+        v_bo (float): burnout velocity
+        fpa_bo (float): burnout FPA (degrees)
+        returntype (ReturnType): unit system being used
+
+    Returns:
+        InfluenceCoefficients: free-flight range angle and influence coefficients
+    """
+    return _influenceCoefficients(r_bo, v_bo, fpa_bo, earth.getMu(returntype))
+
+
+def _influenceCoefficients(r_bo: float, v_bo: float, fpa_bo: float, mu: float) -> InfluenceCoefficients:
+    # body of `solveForInfluenceCoefficients`, shared with `BallisticModel`
+    Q_bo = (v_bo * v_bo * r_bo)/mu
+
+    fpaRad = fpa_bo*trig.degrees2radians
+    sinFPA = math.sin(fpaRad)
+    cosFPA = math.cos(fpaRad)
+    cosFPASquared = cosFPA*cosFPA
+
+    # equation 6.2-12, clamped as in `solveForFreeFlightAngleFromQ`
+    num = (1.0 - Q_bo * cosFPASquared)
+    den = math.sqrt(1.0 + Q_bo*(Q_bo - 2.0) * cosFPASquared)
+    cosPsiDiv2 = 0.0 if math.isclose(den, 0.0) else num/den
+    if not(1 >= cosPsiDiv2 >= -1):
+        if math.isclose(abs(cosPsiDiv2), 1.0):
+            cosPsiDiv2 = math.copysign(1.0, cosPsiDiv2)
+        else:
+            raise Exception("Cannot perform calculation due to cosPsiDiv2 being out of bounds")
+    freeFlightAngle = math.acos(cosPsiDiv2) * 2.0 * trig.radians2degrees
+
+    sinPsiDiv2Squared = (1.0 - cosPsiDiv2)*(1.0 + cosPsiDiv2)
+    sinPsiDiv2 = math.sqrt(sinPsiDiv2Squared)
+    sinPsi = 2.0*sinPsiDiv2*cosPsiDiv2
+    cosPsi = (cosPsiDiv2 - sinPsiDiv2)*(cosPsiDiv2 + sinPsiDiv2)
+    sinTwoFPA = 2.0*sinFPA*cosFPA
+    cosTwoFPA = (cosFPA - sinFPA)*(cosFPA + sinFPA)
+
+    # 2 sin(psi + 2 FPA)/sin(2 FPA) - 2
+    fpaError = 2.0*(sinPsi*cosTwoFPA/sinTwoFPA + cosPsi - 1.0)
+    sinRatio = sinPsiDiv2Squared/sinTwoFPA
+    burnoutHeight = (4.0 * mu)/(v_bo*v_bo * r_bo*r_bo) * sinRatio
+    burnoutVelocity = (8.0 * mu)/(v_bo*v_bo*v_bo * r_bo) * sinRatio
+
+    return InfluenceCoefficients(freeFlightAngle, fpaError, burnoutHeight, burnoutVelocity, cosPsi, sinPsi)
@@ -0,0 +1,318 @@
+"""
+Array versions of the equations in `six_03_launching_errors_on_range`.
+
+Inputs broadcast against each other like NumPy ufuncs and every equation is evaluated in the same order of
+operations as its scalar counterpart (agreement to 1e-12 relative).  Elements outside of an equation's domain
+(e.g. the `math.acos` in equation 6.3-10) come back as NaN instead of raising.  The functions with a domain also
+take `errors='mask'`, which returns a `domain_status.MaskedResult` of the values and a per-element status code.
+"""
+import numpy
+
+from constants import trig, earth
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import domain_status
+from six_ballisticMissileTrajectories.six_03_launching_errors_on_range import InfluenceCoefficients
+
+
+def _asFloatArray(x) -> numpy.ndarray:
+    return numpy.asarray(x, dtype=float)
+
+
+def solveForCrossRangeErrorLateral(rangeAngle, lateralError, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the cross range error based on a thrust cutoff error.
+     This is based on equation 6.3-1 in the BMW book
+    Args:
+        rangeAngle (numpy.ndarray): free-flight range angle (degrees)
+        lateralError (numpy.ndarray): lateral displacement error (degrees)
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: Lateral cross range error (degrees)
+    """
+    domain_status.checkErrors(errors)
+    rangeAngleRad = _asFloatArray(rangeAngle) * trig.degrees2radians
+    latErRad = _asFloatArray(lateralError) * trig.degrees2radians
+
+    sinPsi = numpy.sin(rangeAngleRad)
+    cosPsi = numpy.cos(rangeAngleRad)
+    cosDeltaX = numpy.cos(latErRad)
+
+    cosDeltaC = sinPsi*sinPsi + cosPsi*cosPsi*cosDeltaX
+    with numpy.errstate(invalid='ignore'):
+        output = numpy.arccos(cosDeltaC)*trig.radians2degrees
+
+    if errors == 'mask':
+        return domain_status.classify(output)
+    return output
+
+
+def solveForCrossRangeErrorLateralSmallAngleApprox(rangeAngle, lateralError) -> numpy.ndarray:
+    """
+    This solves for the cross range error based on a thrust cutoff error using small angle approximation.
+     This is based on equation 6.3-2 in the BMW book
+    Args:
+        rangeAngle (numpy.ndarray): free-flight range angle (degrees)
+        lateralError (numpy.ndarray): lateral displacement error (degrees)
+
+    Returns:
+        numpy.ndarray: lateral cross range error (degrees)
+    """
+    rangeAngleRad = _asFloatArray(rangeAngle) * trig.degrees2radians
+    latErRad = _asFloatArray(lateralError) * trig.degrees2radians
+
+    deltaC = latErRad * numpy.cos(rangeAngleRad)
+    return deltaC*trig.radians2degrees
+
+
+def solveForCrossRangeErrorAzimuthal(rangeAngle, azimuthalError, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the cross range error based on a thrust cutoff error.
+     This is based on equation 6.3-3 in the BMW book
+    Args:
+        rangeAngle (numpy.ndarray): free-flight range angle (degrees)
+        azimuthalError (numpy.ndarray): azimuth error (degrees)
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: azimuthal cross range error (degrees)
+    """
+    domain_status.checkErrors(errors)
+    rangeAngleRad = _asFloatArray(rangeAngle)*trig.degrees2radians
+    azErRad = _asFloatArray(azimuthalError)*trig.degrees2radians
+
+    sinPsi = numpy.sin(rangeAngleRad)
+    cosPsi = numpy.cos(rangeAngleRad)
+    cosDeltaB = numpy.cos(azErRad)
+
+    cosDeltaC = cosPsi*cosPsi + sinPsi*sinPsi*cosDeltaB
+    with numpy.errstate(invalid='ignore'):
+        output = numpy.arccos(cosDeltaC)*trig.radians2degrees
+
+    if errors == 'mask':
+        return domain_status.classify(output)
+    return output
+
+
+def solveForCrossRangeErrorAzimuthalSmallAngleApprox(rangeAngle, azimuthalError) -> numpy.ndarray:
+    """
+    This solves for the cross range error based on a thrust cutoff error using small angle approximation.
+     This is based on equation 6.3-4 in the BMW book
+    Args:
+        rangeAngle (numpy.ndarray): free-flight range angle (degrees)
+        azimuthalError (numpy.ndarray): azimuth error (degrees)
+
+    Returns:
+        numpy.ndarray: azimuthal cross range error (degrees)
+    """
+    rangeAngleRad = _asFloatArray(rangeAngle)*trig.degrees2radians
+    azErRad = _asFloatArray(azimuthalError)*trig.degrees2radians
+
+    deltaC = azErRad*numpy.sin(rangeAngleRad)
+    return deltaC*trig.radians2degrees
+
+
+def solveForDownRangeError(Q_bo, fpa_bo, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the down range error of a ballistic missile assuming errors to the burnout flight path angle.
+     This is based on equation 6.3-10 from the BMW book
+
+    Q = 0 and flight path angles where sin(2 FPA) is 0 are degenerate.
+    Args:
+        Q_bo (numpy.ndarray): Q at burnout
+        fpa_bo (numpy.ndarray): FPA at burnout (degrees)
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: down range error (degrees)
+    """
+    domain_status.checkErrors(errors)
+    Q_bo = _asFloatArray(Q_bo)
+    fpa_boRad = _asFloatArray(fpa_bo)*trig.degrees2radians
+    sinTwoFpa = numpy.sin(2.0 * fpa_boRad)
+
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        cscFpaBo = 1.0/sinTwoFpa
+        cotFpaBo = numpy.cos(fpa_boRad)/numpy.sin(fpa_boRad)
+
+        cosPsi = 2.0/Q_bo * cscFpaBo - cotFpaBo
+        output = numpy.arccos(cosPsi)*2.0*trig.radians2degrees
+
+    if errors == 'mask':
+        return domain_status.classify(output, degenerate=(Q_bo == 0.0) | (sinTwoFpa == 0.0))
+    return output
+
+
+def solveForInfluenceCoefficientFPAError(freeFlightRange, fpa_bo, errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the influence coefficient as the partial derivative.
+     This is based on equation 6.3-13 from the BMW book
+    Args:
+        freeFlightRange (numpy.ndarray): free flight range of missile (degrees)
+        fpa_bo (numpy.ndarray): burnout FPA (degrees)
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: FPA error
+    """
+    domain_status.checkErrors(errors)
+    twoFpa = 2.0*_asFloatArray(fpa_bo)
+    numHelper = (_asFloatArray(freeFlightRange) + twoFpa)*trig.degrees2radians
+    denHelper = (twoFpa*trig.degrees2radians)
+
+    num = 2.0 * numpy.sin(numHelper)
+    den = numpy.sin(denHelper)
+
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        output = (num/den) - 2.0
+
+    if errors == 'mask':
+        return domain_status.classify(output, degenerate=(den == 0.0))
+    return output
+
+
+def solveForInfluenceCoefficientBurnoutHeight(r_bo, v_bo, fpa_bo, freelightRange, returntype: ReturnType,
+                                              errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the burnout height influence coefficient to determine the down range error.
+     This is based on equation 6.3-16 from the BMW book
+    Args:
+        r_bo (numpy.ndarray): burnout height
+        v_bo (numpy.ndarray): burnout velocity
+        fpa_bo (numpy.ndarray): burnout fpa (degrees)
+        freelightRange (numpy.ndarray): free flight range of missile (degrees)
+        returntype (ReturnType): unit system being used
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: burnout height influence coefficient
+    """
+    domain_status.checkErrors(errors)
+    r_bo = _asFloatArray(r_bo)
+    v_bo = _asFloatArray(v_bo)
+    with numpy.errstate(divide='ignore'):
+        tmp1 = (4.0 * earth.getMu(returntype))/(v_bo*v_bo * r_bo*r_bo)
+
+    halfAngle = (_asFloatArray(freelightRange)*trig.degrees2radians)/2.0
+    fpaRad = 2.0*_asFloatArray(fpa_bo)*trig.degrees2radians
+
+    sinHalfAngle = numpy.sin(halfAngle)
+    sinTwoFpa = numpy.sin(fpaRad)
+
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        tmp2 = (sinHalfAngle*sinHalfAngle)/sinTwoFpa
+        output = tmp1*tmp2
+
+    if errors == 'mask':
+        return domain_status.classify(output, degenerate=(v_bo * r_bo == 0.0) | (sinTwoFpa == 0.0))
+    return output
+
+
+def solveForInfluenceCoefficientBurnoutVelocity(r_bo, v_bo, fpa_bo, freeFlightRange, returntype: ReturnType,
+                                                errors: str = 'nan') -> numpy.ndarray:
+    """
+    This solves for the burnout velocity influence coefficient to determine
+    the down range error.
+      this is based on equation 6.3-18 from the BMW book
+    Args:
+        r_bo (numpy.ndarray): burnout height
+        v_bo (numpy.ndarray): burnout velocity
+        fpa_bo (numpy.ndarray): burnout FPA (degrees)
+        freeFlightRange (numpy.ndarray): free flight range of missile (degrees)
+        returntype (ReturnType): unit system being used
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        numpy.ndarray: burnout velocity influence coefficient
+    """
+    domain_status.checkErrors(errors)
+    r_bo = _asFloatArray(r_bo)
+    v_bo = _asFloatArray(v_bo)
+    with numpy.errstate(divide='ignore'):
+        tmp1 = (8.0 * earth.getMu(returntype)) / (numpy.power(v_bo, 3.0) * r_bo)
+
+    halfAngle = _asFloatArray(freeFlightRange)*trig.degrees2radians/2.0
+    fpaRad = 2.0*_asFloatArray(fpa_bo)*trig.degrees2radians
+
+    sinHalfAngle = numpy.sin(halfAngle)
+    sinTwoFpa = numpy.sin(fpaRad)
+
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        tmp2 = (sinHalfAngle*sinHalfAngle)/sinTwoFpa
+        output = tmp1*tmp2
+
+    if errors == 'mask':
+        return domain_status.classify(output, degenerate=(v_bo * r_bo == 0.0) | (sinTwoFpa == 0.0))
+    return output
+
+
+def solveForInfluenceCoefficientBurnoutVelocityAlternative(r_bo, v_bo, icHeightError) -> numpy.ndarray:
+    """
+    This solves for the burnout velocity influence coefficient to determine
+    the down range error.
+     this is based on equation 6.3-18 from the BMW book
+    Args:
+        r_bo (numpy.ndarray): burnout height
+        v_bo (numpy.ndarray): burnout velocity
+        icHeightError (numpy.ndarray): burn out height influence coefficient
+
+    Returns:
+        numpy.ndarray: burnout velocity influence coefficient
+    """
+    tmp1 = (2.0*_asFloatArray(r_bo))/_asFloatArray(v_bo)
+    return tmp1*_asFloatArray(icHeightError)
+
+
+def solveForInfluenceCoefficients(r_bo, v_bo, fpa_bo, returntype: ReturnType, errors: str = 'nan') -> InfluenceCoefficients:
+    """
+    This solves for the free-flight range angle and every influence coefficient of each trajectory in one pass.
+    `cos(psi/2)` values within 1e-9 of +/-1 are clamped; anything further out of bounds gives NaN in every field.
+    With `errors='mask'` the status covers every field of a trajectory.
+     This is based on equations 6.2-12, 6.3-2, 6.3-4, 6.3-13, 6.3-16 and 6.3-18 from the BMW book
+    Args:
+        r_bo (numpy.ndarray): burnout radius
+        v_bo (numpy.ndarray): burnout velocity
+        fpa_bo (numpy.ndarray): burnout FPA (degrees)
+        returntype (ReturnType): unit system being used
+        errors (str): 'nan', or 'mask' to also return the status of each element
+
+    Returns:
+        InfluenceCoefficients: free-flight range angle and influence coefficients, each an array
+    """
+    domain_status.checkErrors(errors)
+    r_bo = _asFloatArray(r_bo)
+    v_bo = _asFloatArray(v_bo)
+    mu = earth.getMu(returntype)
+    Q_bo = (v_bo * v_bo * r_bo)/mu
+
+    fpaRad = _asFloatArray(fpa_bo)*trig.degrees2radians
+    sinFPA = numpy.sin(fpaRad)
+    cosFPA = numpy.cos(fpaRad)
+    cosFPASquared = cosFPA*cosFPA
+
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        num = (1.0 - Q_bo * cosFPASquared)
+        den = numpy.sqrt(1.0 + Q_bo*(Q_bo - 2.0) * cosFPASquared)
+        cosPsiDiv2 = numpy.where(den == 0.0, 0.0, num/den)
+        if errors == 'mask':
+            clamped = (numpy.abs(cosPsiDiv2) > 1.0) & (numpy.abs(cosPsiDiv2) <= 1.0 + 1e-9)
+        cosPsiDiv2 = numpy.where(numpy.abs(cosPsiDiv2) <= 1.0 + 1e-9, numpy.clip(cosPsiDiv2, -1.0, 1.0), numpy.nan)
+        freeFlightAngle = numpy.arccos(cosPsiDiv2) * 2.0 * trig.radians2degrees
+
+        sinPsiDiv2Squared = (1.0 - cosPsiDiv2)*(1.0 + cosPsiDiv2)
+        sinPsiDiv2 = numpy.sqrt(sinPsiDiv2Squared)
+        sinPsi = 2.0*sinPsiDiv2*cosPsiDiv2
+        cosPsi = (cosPsiDiv2 - sinPsiDiv2)*(cosPsiDiv2 + sinPsiDiv2)
+        sinTwoFPA = 2.0*sinFPA*cosFPA
+        cosTwoFPA = (cosFPA - sinFPA)*(cosFPA + sinFPA)
+
+        fpaError = 2.0*(sinPsi*cosTwoFPA/sinTwoFPA + cosPsi - 1.0)
+        sinRatio = sinPsiDiv2Squared/sinTwoFPA
+        burnoutHeight = (4.0 * mu)/(v_bo*v_bo * r_bo*r_bo) * sinRatio
+        burnoutVelocity = (8.0 * mu)/(v_bo*v_bo*v_bo * r_bo) * sinRatio
+
+    output = InfluenceCoefficients(freeFlightAngle, fpaError, burnoutHeight, burnoutVelocity, cosPsi, sinPsi)
+    if errors == 'mask':
+        return domain_status.classify(output, clamped=clamped,
+                                      degenerate=(den == 0.0) | (sinTwoFPA == 0.0) | (v_bo * r_bo == 0.0))
+    return output
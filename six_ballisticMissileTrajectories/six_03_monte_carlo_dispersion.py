@@ -0,0 +1,272 @@
+"""
+Monte Carlo impact dispersion from burnout errors, built on the Chapter 6, Section 3 influence coefficients.
+
+For one nominal trajectory the down-range miss is the first order sum of equations 6.3-13, 6.3-16 and 6.3-18
+and the cross-range miss is the small angle form of equations 6.3-2 and 6.3-4.  Samples are drawn and reduced
+chunk by chunk, so memory stays bounded by `chunkSize` whatever the number of samples, and every chunk has its
+own random stream spawned from one seed: a run gives the same statistics for any number of processes.
+
+Units: `dv_bo` and `dr_bo` are in the units of the nominal trajectory, `dfpa_bo`, `lateral` and `azimuthal`
+are in degrees, and misses are degrees of central angle (`conversions.convertDeg2NM` gives nautical miles).
+"""
+import math
+import multiprocessing
+
+import numpy
+
+from constants import trig
+from constants.earth import ReturnType
+from six_ballisticMissileTrajectories import six_03_launching_errors_on_range
+
+burnoutErrorNames = ('dv_bo', 'dr_bo', 'dfpa_bo', 'lateral', 'azimuthal')
+
+
+class BurnoutErrorModel():
+    """
+    Independent distributions of the five burnout errors.  Each error is one of:
+
+    - `('normal', mean, sigma)`
+    - `('uniform', low, high)`
+    - `('fixed', value)`
+
+    Errors that are not given are fixed at 0.
+    """
+
+    def __init__(self, **errors):
+        unknown = set(errors) - set(burnoutErrorNames)
+        if unknown:
+            raise ValueError("Unknown burnout errors: %s" % ', '.join(sorted(unknown)))
+
+        self._errors = {name: tuple(errors.get(name, ('fixed', 0.0))) for name in burnoutErrorNames}
+        for name, (kind, *parameters) in self._errors.items():
+            if kind not in ('normal', 'uniform', 'fixed'):
+                raise ValueError("Unknown distribution for %s: %s" % (name, kind))
+
+    def getError(self, name: str) -> tuple:
+        return self._errors[name]
+
+    def getMean(self, name: str) -> float:
+        kind, *parameters = self._errors[name]
+        if kind == 'uniform':
+            return 0.5 * (parameters[0] + parameters[1])
+        return parameters[0]
+
+    def getVariance(self, name: str) -> float:
+        kind, *parameters = self._errors[name]
+        if kind == 'normal':
+            return parameters[1] * parameters[1]
+        elif kind == 'uniform':
+            return (parameters[1] - parameters[0]) ** 2 / 12.0
+        return 0.0
+
+    def getMeans(self) -> numpy.ndarray:
+        """
+        Means of the five errors, in the order of `burnoutErrorNames`
+        """
+        return numpy.array([self.getMean(name) for name in burnoutErrorNames])
+
+    def getCovariance(self) -> numpy.ndarray:
+        """
+        5x5 covariance of the errors, in the order of `burnoutErrorNames` (diagonal, the errors are independent)
+        """
+        return numpy.diag([self.getVariance(name) for name in burnoutErrorNames])
+
+    def sample(self, name: str, generator: numpy.random.Generator, count: int) -> numpy.ndarray:
+        kind, *parameters = self._errors[name]
+        if kind == 'normal':
+            return generator.normal(parameters[0], parameters[1], count)
+        elif kind == 'uniform':
+            return generator.uniform(parameters[0], parameters[1], count)
+        return numpy.full(count, float(parameters[0]))
+
+
+class DispersionStatistics():
+    """
+    Online statistics of (down-range, cross-range) misses: count, mean, covariance and a histogram of the radial
+    miss about the aim point.  Two sets of statistics over disjoint samples combine exactly with `merge`.
+    """
+
+    def __init__(self, histogramEdges: numpy.ndarray):
+        self._count = 0
+        self._mean = numpy.zeros(2)
+        self._m2 = numpy.zeros((2, 2))
+        self._histogramEdges = histogramEdges
+        self._histogram = numpy.zeros(histogramEdges.size - 1, dtype=numpy.int64)
+        self._overflow = 0
+
+    def update(self, downRange: numpy.ndarray, crossRange: numpy.ndarray):
+        """
+        Adds a chunk of misses (degrees)
+        """
+        other = DispersionStatistics(self._histogramEdges)
+        misses = numpy.stack((downRange, crossRange))
+        other._count = misses.shape[1]
+        if other._count == 0:
+            return
+        other._mean = misses.mean(axis=1)
+        centered = misses - other._mean[:, None]
+        other._m2 = centered @ centered.T
+
+        radial = numpy.hypot(downRange, crossRange)
+        other._histogram, _ = numpy.histogram(radial, bins=self._histogramEdges)
+        other._overflow = int(numpy.count_nonzero(radial > self._histogramEdges[-1]))
+        self.merge(other)
+
+    def merge(self, other: 'DispersionStatistics'):
+        """
+        Combines the statistics of another set of samples into this one (Chan et al. pairwise update)
+        """
+        if other._count == 0:
+            return
+        count = self._count + other._count
+        delta = other._mean - self._mean
+        self._mean = self._mean + delta * (other._count / count)
+        self._m2 = self._m2 + other._m2 + numpy.outer(delta, delta) * (self._count * other._count / count)
+        self._count = count
+        self._histogram += other._histogram
+        self._overflow += other._overflow
+
+    def getCount(self) -> int:
+        return self._count
+
+    def getBias(self) -> numpy.ndarray:
+        """
+        Mean (down-range, cross-range) miss (degrees)
+        """
+        return self._mean.copy()
+
+    def getCovariance(self) -> numpy.ndarray:
+        """
+        2x2 sample covariance of (down-range, cross-range) misses (degrees squared)
+        """
+        return self._m2 / (self._count - 1)
+
+    def getRadialPercentile(self, probability: float) -> float:
+        """
+        Radius about the aim point containing `probability` of the impacts, interpolated inside of one histogram
+        bin.  Returns infinity if that radius lies beyond the histogram.
+        Args:
+            probability (float): between 0 and 1
+
+        Returns:
+            float: radius (degrees)
+        """
+        target = probability * self._count
+        cumulative = numpy.cumsum(self._histogram)
+        if cumulative[-1] < target:
+            return math.inf
+
+        index = int(numpy.searchsorted(cumulative, target))
+        below = cumulative[index - 1] if index > 0 else 0
+        fraction = (target - below) / self._histogram[index] if self._histogram[index] else 0.0
+        return float(self._histogramEdges[index] + fraction * (self._histogramEdges[index + 1] - self._histogramEdges[index]))
+
+    def getCEP(self) -> float:
+        """
+        Circular error probable about the aim point (degrees)
+        """
+        return self.getRadialPercentile(0.5)
+
+    def getErrorEllipse(self, probability: float) -> (float, float, float):
+        """
+        Ellipse about the mean impact point that contains `probability` of the impacts when the misses are
+        jointly normal (exact for normal burnout errors, since the miss is linear in them).
+        Args:
+            probability (float): between 0 and 1
+
+        Returns:
+            (float, float, float): semi-major axis (degrees), semi-minor axis (degrees) and the angle of the
+            semi-major axis from the down-range direction towards cross-range (degrees)
+        """
+        eigenvalues, eigenvectors = numpy.linalg.eigh(self.getCovariance())
+        scale = -2.0 * math.log(1.0 - probability)
+        semiMinor, semiMajor = numpy.sqrt(numpy.maximum(eigenvalues, 0.0) * scale)
+        # the eigenvector's sign is arbitrary, so fold the angle into (-90, 90]
+        orientation = math.atan2(eigenvectors[1, 1], eigenvectors[0, 1]) * trig.radians2degrees
+        if orientation > 90.0:
+            orientation -= 180.0
+        elif orientation <= -90.0:
+            orientation += 180.0
+        return float(semiMajor), float(semiMinor), orientation
+
+
+def _missCoefficients(r_bo: float, v_bo: float, fpa_bo: float, returntype: ReturnType) -> (dict, dict):
+    influence = six_03_launching_errors_on_range.solveForInfluenceCoefficients(r_bo, v_bo, fpa_bo, returntype)
+    # down-range partials, converted so that every term of the miss comes out in degrees
+    downRange = {
+        'dv_bo': influence.burnoutVelocity * trig.radians2degrees,
+        'dr_bo': influence.burnoutHeight * trig.radians2degrees,
+        'dfpa_bo': influence.fpaError,
+    }
+    # small angle forms of equations 6.3-2 and 6.3-4
+    crossRange = {'lateral': influence.crossRangeLateral, 'azimuthal': influence.crossRangeAzimuthal}
+    return downRange, crossRange
+
+
+def _runChunk(arguments) -> DispersionStatistics:
+    coefficients, crossCoefficients, errorModel, count, seedSequence, histogramEdges = arguments
+    generator = numpy.random.default_rng(seedSequence)
+
+    errors = {name: errorModel.sample(name, generator, count) for name in burnoutErrorNames}
+
+    downRange = coefficients['dv_bo'] * errors['dv_bo']
+    downRange += coefficients['dr_bo'] * errors['dr_bo']
+    downRange += coefficients['dfpa_bo'] * errors['dfpa_bo']
+
+    crossRange = crossCoefficients['lateral'] * errors['lateral']
+    crossRange += crossCoefficients['azimuthal'] * errors['azimuthal']
+
+    statistics = DispersionStatistics(histogramEdges)
+    statistics.update(downRange, crossRange)
+    return statistics
+
+
+def runDispersion(r_bo: float, v_bo: float, fpa_bo: float, returntype: ReturnType, errorModel: BurnoutErrorModel,
+                  samples: int, chunkSize: int = 1000000, seed: int = None, processes: int = 1,
+                  histogramBins: int = 4096) -> DispersionStatistics:
+    """
+    Samples `samples` sets of burnout errors about one nominal trajectory and reduces the resulting misses.
+    Args:
+        r_bo (float): nominal burnout radius
+        v_bo (float): nominal burnout velocity
+        fpa_bo (float): nominal burnout flight path angle (degrees)
+        returntype (ReturnType): unit system of the nominal trajectory and of `dv_bo` / `dr_bo`
+        errorModel (BurnoutErrorModel): distributions of the burnout errors
+        samples (int): number of samples
+        chunkSize (int): samples drawn and held in memory at once by each process
+        seed (int): seed of the run; chunk k always uses the k-th stream spawned from it
+        processes (int): worker processes (1 runs in this process)
+        histogramBins (int): resolution of the radial miss histogram behind `getCEP`
+
+    Returns:
+        DispersionStatistics: statistics of the misses
+    """
+    coefficients, crossCoefficients = _missCoefficients(r_bo, v_bo, fpa_bo, returntype)
+
+    # the histogram has to be fixed before any chunk runs so chunks can be merged; size it from the exact mean
+    # and variance of the linear miss model
+    spread = 0.0
+    for name, coefficient in dict(coefficients, **crossCoefficients).items():
+        spread += coefficient * coefficient * errorModel.getVariance(name)
+    downRangeBias = sum(coefficient * errorModel.getMean(name) for name, coefficient in coefficients.items())
+    crossRangeBias = sum(coefficient * errorModel.getMean(name) for name, coefficient in crossCoefficients.items())
+    maxRadius = math.hypot(downRangeBias, crossRangeBias) + 10.0 * math.sqrt(spread)
+    histogramEdges = numpy.linspace(0.0, maxRadius if maxRadius > 0.0 else 1.0, histogramBins + 1)
+
+    chunkCounts = [chunkSize] * (samples // chunkSize)
+    if samples % chunkSize:
+        chunkCounts.append(samples % chunkSize)
+    seedSequences = numpy.random.SeedSequence(seed).spawn(len(chunkCounts))
+    chunks = [(coefficients, crossCoefficients, errorModel, count, seedSequence, histogramEdges)
+              for count, seedSequence in zip(chunkCounts, seedSequences)]
+
+    statistics = DispersionStatistics(histogramEdges)
+    if processes > 1:
+        with multiprocessing.Pool(processes) as pool:
+            for chunkStatistics in pool.imap(_runChunk, chunks):
+                statistics.merge(chunkStatistics)
+    else:
+        for chunk in chunks:
+            statistics.merge(_runChunk(chunk))
+
+    return statistics
@@ -0,0 +1,167 @@
+"""
+Parameter sweeps split across a process pool, with the results written straight into shared memory.
+
+    executor = SweepExecutor(processes=64, progress=lambda done, total: print("%d / %d" % (done, total)))
+    result = sweep_engine.sweep(six_02.solveForFreeFlightAngleFromQ, {'Q_bo': qValues, 'FPA_bo': fpaValues},
+                                executor=executor)
+
+The flattened grid is cut into blocks of `chunkSize` points.  Each worker attaches once to one
+`multiprocessing.shared_memory` block per output and writes the values of the blocks it is given in place, so
+only (start, stop) pairs and element counts go through the pool; the grid and the fixed arguments are sent
+once per worker.  The equation has to be picklable (a module level function) unless the pool forks.
+
+`cancel()`, from another thread or from the progress callback, stops handing out blocks; the sweep then raises
+`SweepCancelled` once the blocks already running have finished.
+"""
+import concurrent.futures
+import math
+import os
+import threading
+from multiprocessing import shared_memory
+
+import numpy
+
+from utilities.sweep_engine import _splitOutputs
+
+_worker = {}
+
+
+class SweepCancelled(Exception):
+    """
+    Raised by `SweepExecutor.evaluate` when the sweep was cancelled before every block had been evaluated
+    """
+
+    def __init__(self, completed: int, total: int):
+        super().__init__("sweep cancelled after %d of %d points" % (completed, total))
+        self.completed = completed
+        self.total = total
+
+
+def _evaluateInto(function, axes: dict, shape: tuple, fixed: dict, outputs: dict, start: int, stop: int) -> int:
+    # evaluates the flat grid points [start, stop) into the flat output arrays
+    indices = numpy.unravel_index(numpy.arange(start, stop), shape)
+    arguments = {name: values[index] for (name, values), index in zip(axes.items(), indices)}
+    for name, values in _splitOutputs(function(**arguments, **fixed), (stop - start,)).items():
+        outputs[name][start:stop] = values
+    return stop - start
+
+
+def _initializeWorker(function, axes: dict, shape: tuple, fixed: dict, outputSpecs: list):
+    memories = [shared_memory.SharedMemory(name=memoryName) for _, memoryName, _ in outputSpecs]
+    _worker['memories'] = memories
+    _worker['outputs'] = {name: numpy.ndarray(math.prod(shape), dtype=dtype, buffer=memory.buf)
+                          for (name, _, dtype), memory in zip(outputSpecs, memories)}
+    _worker['arguments'] = (function, axes, shape, fixed)
+
+
+def _evaluateBlock(start: int, stop: int) -> int:
+    function, axes, shape, fixed = _worker['arguments']
+    return _evaluateInto(function, axes, shape, fixed, _worker['outputs'], start, stop)
+
+
+class SweepExecutor():
+    """
+    Evaluates sweeps over a pool of processes.
+    Args:
+        processes (int): worker processes, every CPU if not given; 1 evaluates the blocks in this process
+        chunkSize (int): grid points per block, sized from the grid and the number of processes if not given
+        progress (callable): called as `progress(completedPoints, totalPoints)` as blocks finish
+        context: `multiprocessing` context of the pool (e.g. `multiprocessing.get_context('spawn')`)
+    """
+
+    def __init__(self, processes: int = None, chunkSize: int = None, progress=None, context=None):
+        self._processes = processes or os.cpu_count() or 1
+        self._chunkSize = chunkSize
+        self._progress = progress
+        self._context = context
+        self._cancelled = threading.Event()
+
+    def getProcesses(self) -> int:
+        return self._processes
+
+    def cancel(self):
+        """
+        Stops the sweep in progress (or the next one), which then raises `SweepCancelled`
+        """
+        self._cancelled.set()
+
+    def isCancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def _blocks(self, total: int) -> list:
+        chunkSize = self._chunkSize
+        if chunkSize is None:
+            # several blocks per process evens out the load and gives progress something to report
+            chunkSize = min(max(math.ceil(total / (8 * self._processes)), 1024), 1 << 18)
+        return [(start, min(start + chunkSize, total)) for start in range(0, total, chunkSize)]
+
+    def _report(self, completed: int, total: int):
+        if self._progress is not None:
+            self._progress(completed, total)
+        if self._cancelled.is_set():
+            self._cancelled.clear()
+            raise SweepCancelled(completed, total)
+
+    def evaluate(self, function, grid: dict, fixed: dict = None) -> dict:
+        """
+        This evaluates an array function over the Cartesian product of the grid, block by block.
+        Args:
+            function (callable): array function taking the grid and fixed parameters as keywords
+            grid (dict): 1-D values of each swept parameter, keyed by parameter name, in axis order
+            fixed (dict): values of the parameters that are not swept
+
+        Returns:
+            dict: one array per output with one axis per grid parameter (see `sweep_engine.SweepResult`)
+        """
+        fixed = dict(fixed or {})
+        axes = {name: numpy.asarray(values, dtype=float).reshape(-1) for name, values in grid.items()}
+        shape = tuple(values.size for values in axes.values())
+        total = math.prod(shape)
+
+        # the first point gives the names and types of the outputs
+        probeSize = min(total, 1)
+        probe = _splitOutputs(function(**{name: values[:probeSize] for name, values in axes.items()}, **fixed), (probeSize,))
+        blocks = self._blocks(total)
+
+        if self._processes == 1 or len(blocks) <= 1:
+            outputs = {name: numpy.empty(total, dtype=values.dtype) for name, values in probe.items()}
+            completed = 0
+            for start, stop in blocks:
+                completed += _evaluateInto(function, axes, shape, fixed, outputs, start, stop)
+                self._report(completed, total)
+            return {name: values.reshape(shape) for name, values in outputs.items()}
+
+        memories = []
+        try:
+            outputSpecs = []
+            for name, values in probe.items():
+                memory = shared_memory.SharedMemory(create=True, size=max(total * values.dtype.itemsize, 1))
+                memories.append(memory)
+                outputSpecs.append((name, memory.name, values.dtype.str))
+            return self._evaluateInPool(function, axes, shape, fixed, outputSpecs, memories, blocks)
+        finally:
+            for memory in memories:
+                memory.close()
+                memory.unlink()
+
+    def _evaluateInPool(self, function, axes: dict, shape: tuple, fixed: dict, outputSpecs: list, memories: list,
+                        blocks: list) -> dict:
+        total = math.prod(shape)
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=min(self._processes, len(blocks)), mp_context=self._context,
+                                                      initializer=_initializeWorker,
+                                                      initargs=(function, axes, shape, fixed, outputSpecs))
+        try:
+            pending = {pool.submit(_evaluateBlock, start, stop) for start, stop in blocks}
+            completed = 0
+            while pending:
+                done, pending = concurrent.futures.wait(pending, timeout=0.05, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    completed += future.result()
+                if done or self._cancelled.is_set():
+                    self._report(completed, total)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        # copied out of the shared blocks, which are released when the sweep returns
+        return {name: numpy.ndarray(shape, dtype=dtype, buffer=memory.buf).copy()
+                for (name, _, dtype), memory in zip(outputSpecs, memories)}
@@ -0,0 +1,331 @@
+"""
+Opt-in call counts, timings and domain outcome counters for the solver modules.
+
+Nothing is instrumented until `enable` is called: the solver functions are then replaced, on their modules,
+by wrappers that time every call, and `disable` puts the original functions back.  With instrumentation off
+the solvers run exactly the code they always do.
+
+    with instrumented():
+        run()
+    print(toPrometheus())
+
+or, for a whole job, set `BMW_INSTRUMENTATION=1` (and optionally `BMW_INSTRUMENTATION_OUTPUT=report.json` or
+`report.prom`, written when the process exits) and call `enableFromEnvironment()` from the entry point; the
+batch evaluator does.
+
+Per function this records the number of calls, the inclusive wall time (total and a log2 histogram giving
+the p50 / p90 / p99), exceptions raised, NaN elements returned and values the equation had to clamp or
+replace itself (e.g. `cosPsiDiv2` in equation 6.2-12).  Calls through references taken before `enable`
+(`from module import function`, the static methods of `BallisticModel`, the equations behind the
+`solveForFreeFlightAngle` shim) are not seen on their own.
+"""
+import atexit
+import bisect
+import contextlib
+import functools
+import importlib
+import json
+import math
+import os
+import sys
+import threading
+import time
+
+from four_position_and_velocity_a_funcion_of_time import four_02_time_of_flight_eccentric_anomoly
+from one_twoBodyOrbitalMecanics import one_04_constants_of_the_motion, one_08_circular_orbit
+from six_ballisticMissileTrajectories import six_02_general_ballistic_missile_problem, six_03_launching_errors_on_range
+
+environmentVariable = 'BMW_INSTRUMENTATION'
+outputEnvironmentVariable = 'BMW_INSTRUMENTATION_OUTPUT'
+
+# upper bounds of the duration histogram buckets: 128 ns, 256 ns, ... 2**34 ns (about 17 s), then +Inf
+bucketBoundsNs = tuple(2 ** k for k in range(7, 35))
+
+
+def _solverModules() -> list:
+    # the array modules pull in NumPy, so they are only instrumented once something has imported NumPy
+    modules = [one_04_constants_of_the_motion, one_08_circular_orbit, four_02_time_of_flight_eccentric_anomoly,
+               six_02_general_ballistic_missile_problem, six_03_launching_errors_on_range]
+    for module in list(modules):
+        vectorized = sys.modules.get(module.__name__ + '_vectorized')
+        if vectorized is None and 'numpy' in sys.modules:
+            try:
+                vectorized = importlib.import_module(module.__name__ + '_vectorized')
+            except ImportError:
+                vectorized = None
+        if vectorized is not None:
+            modules.append(vectorized)
+    return modules
+
+
+class FunctionStatistics():
+    """
+    Counters of one instrumented function
+    """
+    __slots__ = ('_calls', '_totalNs', '_buckets', '_exceptions', '_nan', '_clamped')
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._calls = 0
+        self._totalNs = 0
+        self._buckets = [0] * (len(bucketBoundsNs) + 1)
+        self._exceptions = 0
+        self._nan = 0
+        self._clamped = 0
+
+    def record(self, elapsedNs: int, exception: bool = False, nan: int = 0):
+        self._calls += 1
+        self._totalNs += elapsedNs
+        self._buckets[bisect.bisect_left(bucketBoundsNs, elapsedNs)] += 1
+        if exception:
+            self._exceptions += 1
+        self._nan += nan
+
+    def recordOutcome(self, outcome: str, count: int):
+        if outcome == 'clamped':
+            self._clamped += count
+        elif outcome == 'nan':
+            self._nan += count
+
+    def getCalls(self) -> int:
+        return self._calls
+
+    def getTotalSeconds(self) -> float:
+        return self._totalNs * 1e-9
+
+    def getExceptions(self) -> int:
+        return self._exceptions
+
+    def getNaN(self) -> int:
+        return self._nan
+
+    def getClamped(self) -> int:
+        return self._clamped
+
+    def getBuckets(self) -> list:
+        return list(self._buckets)
+
+    def getPercentileSeconds(self, percentile: float) -> float:
+        """
+        Call duration below which `percentile` (0 to 100) of the calls fall, interpolated inside of one
+        histogram bucket (so within a factor of 2)
+        """
+        if self._calls == 0:
+            return math.nan
+        target = percentile / 100.0 * self._calls
+        cumulative = 0
+        for index, count in enumerate(self._buckets):
+            if count and cumulative + count >= target:
+                lower = bucketBoundsNs[index - 1] if index > 0 else 0
+                upper = bucketBoundsNs[index] if index < len(bucketBoundsNs) else 2 * bucketBoundsNs[-1]
+                return (lower + (target - cumulative) / count * (upper - lower)) * 1e-9
+            cumulative += count
+        return bucketBoundsNs[-1] * 1e-9
+
+    def asDict(self) -> dict:
+        return {'calls': self._calls, 'totalSeconds': self.getTotalSeconds(),
+                'p50Seconds': self.getPercentileSeconds(50.0), 'p90Seconds': self.getPercentileSeconds(90.0),
+                'p99Seconds': self.getPercentileSeconds(99.0),
+                'exceptions': self._exceptions, 'nan': self._nan, 'clamped': self._clamped}
+
+
+_lock = threading.Lock()
+_statistics = {}
+_patched = []
+
+
+def _countNaN(result) -> int:
+    # NaN is the only value that is not equal to itself; works for floats, tuples and arrays without NumPy
+    if isinstance(result, float):
+        return 1 if result != result else 0
+    if isinstance(result, tuple):
+        return sum(_countNaN(item) for item in result)
+    if getattr(result, 'dtype', None) is not None and result.dtype.kind in 'fc':
+        return int((result != result).sum())
+    return 0
+
+
+def _getStatistics(module: str, function: str) -> FunctionStatistics:
+    name = "%s.%s" % (module.rsplit('.', 1)[-1], function)
+    statistics = _statistics.get(name)
+    if statistics is None:
+        statistics = _statistics.setdefault(name, FunctionStatistics())
+    return statistics
+
+
+def _recordOutcome(module: str, function: str, outcome: str, count: int):
+    if count:
+        with _lock:
+            _getStatistics(module, function).recordOutcome(outcome, count)
+
+
+def _wrap(module, name: str, function):
+    statistics = _getStatistics(module.__name__, name)
+    clock = time.perf_counter_ns
+
+    @functools.wraps(function)
+    def instrumentedFunction(*args, **kwargs):
+        start = clock()
+        try:
+            result = function(*args, **kwargs)
+        except Exception:
+            elapsed = clock() - start
+            with _lock:
+                statistics.record(elapsed, exception=True)
+            raise
+        elapsed = clock() - start
+        nan = _countNaN(result)
+        with _lock:
+            statistics.record(elapsed, nan=nan)
+        return result
+
+    return instrumentedFunction
+
+
+def isEnabled() -> bool:
+    return bool(_patched)
+
+
+def enable(modules=None):
+    """
+    Replaces every public function of the solver modules (or of `modules`) with a timing wrapper.
+    Does nothing if instrumentation is already enabled.
+    """
+    if _patched:
+        return
+    for module in (_solverModules() if modules is None else modules):
+        for name, value in list(vars(module).items()):
+            if callable(value) and not name.startswith('_') and getattr(value, '__module__', None) == module.__name__ \
+                    and not isinstance(value, type):
+                _patched.append((module, name, value))
+                setattr(module, name, _wrap(module, name, value))
+        listeners = getattr(module, '_outcomeListeners', None)
+        if listeners is not None:
+            listeners.append(_recordOutcome)
+            _patched.append((module, None, listeners))
+
+
+def disable():
+    """
+    Puts the original functions back.  The statistics are kept until `reset`.
+    """
+    while _patched:
+        module, name, value = _patched.pop()
+        if name is None:
+            value.remove(_recordOutcome)
+        else:
+            setattr(module, name, value)
+
+
+def reset():
+    """
+    Zeroes the statistics.  The counters are cleared in place, as the wrappers of an enabled instrumentation
+    keep recording into them.
+    """
+    with _lock:
+        for statistics in _statistics.values():
+            statistics.clear()
+
+
+@contextlib.contextmanager
+def instrumented(modules=None, resetStatistics: bool = True):
+    """
+    Instruments the solvers for the body of a `with` block.
+    Args:
+        modules (list): modules to instrument, the solver modules if not given
+        resetStatistics (bool): start from empty statistics
+    """
+    wasEnabled = isEnabled()
+    if resetStatistics:
+        reset()
+    enable(modules)
+    try:
+        yield
+    finally:
+        if not wasEnabled:
+            disable()
+
+
+def _activeStatistics() -> list:
+    # (name, statistics) of the functions that did anything since the last reset, sorted by name
+    return sorted((name, statistics) for name, statistics in _statistics.items()
+                  if statistics.getCalls() or statistics.getClamped() or statistics.getNaN())
+
+
+def getStatistics() -> dict:
+    """
+    Statistics of every function called since the last `reset`, keyed by `module.function`
+    """
+    with _lock:
+        return {name: statistics.asDict() for name, statistics in _activeStatistics()}
+
+
+def toJson(path: str = None) -> str:
+    """
+    The statistics as JSON, also written to `path` if given
+    """
+    text = json.dumps(getStatistics(), indent=1, sort_keys=True)
+    if path is not None:
+        with open(path, 'w') as jsonFile:
+            jsonFile.write(text)
+    return text
+
+
+def toPrometheus(path: str = None) -> str:
+    """
+    The statistics in the Prometheus text exposition format, also written to `path` if given
+    """
+    counters = (('bmw_solver_calls_total', "Calls of the solver", FunctionStatistics.getCalls),
+                ('bmw_solver_exceptions_total', "Calls that raised", FunctionStatistics.getExceptions),
+                ('bmw_solver_nan_total', "NaN results, counted per element", FunctionStatistics.getNaN),
+                ('bmw_solver_clamped_total', "Values the solver clamped into its domain", FunctionStatistics.getClamped))
+
+    with _lock:
+        items = _activeStatistics()
+        lines = []
+        for metric, description, getter in counters:
+            lines.append("# HELP %s %s" % (metric, description))
+            lines.append("# TYPE %s counter" % metric)
+            lines.extend('%s{function="%s"} %d' % (metric, name, getter(statistics)) for name, statistics in items)
+
+        lines.append("# HELP bmw_solver_duration_seconds Wall time of a call, including nested solver calls")
+        lines.append("# TYPE bmw_solver_duration_seconds histogram")
+        for name, statistics in items:
+            cumulative = 0
+            for bound, count in zip(bucketBoundsNs + (None,), statistics.getBuckets()):
+                cumulative += count
+                le = '+Inf' if bound is None else repr(bound * 1e-9)
+                lines.append('bmw_solver_duration_seconds_bucket{function="%s",le="%s"} %d' % (name, le, cumulative))
+            lines.append('bmw_solver_duration_seconds_sum{function="%s"} %r' % (name, statistics.getTotalSeconds()))
+            lines.append('bmw_solver_duration_seconds_count{function="%s"} %d' % (name, statistics.getCalls()))
+
+    text = '\n'.join(lines) + '\n'
+    if path is not None:
+        with open(path, 'w') as prometheusFile:
+            prometheusFile.write(text)
+    return text
+
+
+def _writeReport(path: str):
+    if path.endswith('.prom') or path.endswith('.txt'):
+        toPrometheus(path)
+    else:
+        toJson(path)
+
+
+def enableFromEnvironment() -> bool:
+    """
+    Enables instrumentation if `BMW_INSTRUMENTATION` is set to anything but '', '0' or 'false', and writes the
+    report to `BMW_INSTRUMENTATION_OUTPUT` (Prometheus text for .prom / .txt, JSON otherwise) at exit.
+    Returns:
+        bool: whether instrumentation is enabled
+    """
+    if os.environ.get(environmentVariable, '').lower() in ('', '0', 'false'):
+        return False
+    enable()
+    path = os.environ.get(outputEnvironmentVariable)
+    if path:
+        atexit.register(_writeReport, path)
+    return True
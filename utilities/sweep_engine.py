@@ -0,0 +1,286 @@
+"""
+Families of curves: any six_02 / six_03 equation evaluated over a Cartesian grid of its parameters.
+
+    result = sweep(six_02.solveForFreeFlightAngleFromQ, {'Q_bo': [0.3, 0.5, 0.9], 'FPA_bo': numpy.arange(0, 90.5, 0.5)})
+    result.savePlot('figure_6_2_6.svg', x='FPA_bo')
+
+Each grid parameter gets its own axis and the equation is called once on the broadcast grid.  A scalar
+equation is swapped for its array version from the matching `_vectorized` module, and an entry point that only
+takes positional arguments (`six_02.solveForFreeFlightAngle`) for the named equation its parameter names select
+(`solveForFreeFlightAngleFromQ` for Q_bo and FPA_bo).  Parameters that are not swept (e.g. `returntype`) are
+passed through `fixed`; with `fixed={'errors': 'mask'}` the per-element status codes
+(`six_ballisticMissileTrajectories.domain_status`) come back as a `status` output next to the values.
+
+With a cache directory (`cacheDirectory`, or the `BMW_SWEEP_CACHE` environment variable) results are kept as
+`.npz` files keyed by the equation, its code (with the source of its module and of the helpers it calls), the
+grid and the fixed arguments, so a chart is only recomputed when one of those changes.
+
+Large grids can be split across processes with a `parallel_sweep.SweepExecutor` (`executor=`).
+
+NumPy is the only requirement: pandas is imported by `toDataFrame` and matplotlib by `savePlot`, which draws
+on a figure of its own (Agg canvas) and never needs a display.
+"""
+import hashlib
+import importlib
+import inspect
+import os
+
+import numpy
+
+from six_ballisticMissileTrajectories.domain_status import MaskedResult
+
+cacheEnvironmentVariable = 'BMW_SWEEP_CACHE'
+
+
+def _arrayVersion(function):
+    # the array version of a scalar equation, or the function itself
+    module = inspect.getmodule(function)
+    if module is None or module.__name__.endswith('_vectorized'):
+        return function
+    try:
+        vectorized = importlib.import_module(module.__name__ + '_vectorized')
+    except ImportError:
+        return function
+    return getattr(vectorized, function.__name__, function)
+
+
+def _namedEquation(function, names: set):
+    # an entry point that only takes *args (e.g. six_02.solveForFreeFlightAngle) cannot be called with the grid
+    # names as keywords; it stands for the equations of its module named after it + 'From...', and the one whose
+    # parameters the names cover is called instead
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError):
+        return function
+    if not parameters or any(parameter.kind != parameter.VAR_POSITIONAL for parameter in parameters):
+        return function
+
+    module = inspect.getmodule(function)
+    matches = []
+    for name, candidate in inspect.getmembers(module, inspect.isfunction):
+        if not name.startswith(function.__name__ + 'From') or candidate.__module__ != module.__name__:
+            continue
+        candidate = _arrayVersion(candidate)
+        candidateParameters = inspect.signature(candidate).parameters
+        required = {parameterName for parameterName, parameter in candidateParameters.items()
+                    if parameter.default is parameter.empty}
+        if required <= names <= set(candidateParameters):
+            matches.append(candidate)
+    if len(matches) != 1:
+        raise TypeError("%s takes positional arguments only and none of its named equations takes exactly %s"
+                        % (function.__name__, ", ".join(sorted(names))))
+    return matches[0]
+
+
+def _arrayFunction(function, names: set = frozenset()):
+    # the array version of the equation the grid and fixed parameter names call
+    return _arrayVersion(_namedEquation(function, set(names)))
+
+
+def _functionName(function) -> str:
+    return "%s.%s" % (function.__module__, function.__qualname__)
+
+
+def _splitOutputs(result, shape: tuple) -> dict:
+    # outputs of one call keyed by name, broadcast to the grid shape (read-only views)
+    if isinstance(result, MaskedResult):
+        return dict(_splitOutputs(result.values, shape), status=numpy.broadcast_to(result.status, shape))
+    if isinstance(result, tuple):
+        names = getattr(result, '_fields', None) or ['output%d' % i for i in range(len(result))]
+        return {name: numpy.broadcast_to(value, shape) for name, value in zip(names, result)}
+    return {'value': numpy.broadcast_to(result, shape)}
+
+
+def _codeObjects(code) -> list:
+    # a code object and those nested in it (comprehensions, lambdas, inner functions)
+    nested = [const for const in code.co_consts if inspect.iscode(const)]
+    return [code] + [inner for const in nested for inner in _codeObjects(const)]
+
+
+def _hashModule(digest, module, seen: set):
+    path = getattr(module, '__file__', None)
+    if path is None or not path.endswith('.py') or path in seen:
+        return
+    seen.add(path)
+    with open(path, 'rb') as sourceFile:
+        digest.update(sourceFile.read())
+
+
+def _hashCode(digest, function, seen: set):
+    # the code of `function`, the source of its module and, in turn, of the functions and modules it refers to,
+    # so that changing a helper the equation calls also changes the key
+    code = getattr(function, '__code__', None)
+    if code is None or code in seen:
+        return
+    seen.add(code)
+    namespace = getattr(function, '__globals__', {})
+    _hashModule(digest, inspect.getmodule(function), seen)
+    for codeObject in _codeObjects(code):
+        digest.update(codeObject.co_code)
+        # nested code objects are hashed on their own, their repr holds a memory address
+        digest.update(repr([const for const in codeObject.co_consts if not inspect.iscode(const)]).encode())
+        for name in codeObject.co_names:
+            value = namespace.get(name)
+            if inspect.ismodule(value):
+                _hashModule(digest, value, seen)
+            elif inspect.isfunction(value):
+                _hashCode(digest, value, seen)
+
+
+def _hashValue(digest, value):
+    # arrays by their bytes: their repr elides everything but the ends of long arrays
+    if isinstance(value, (list, tuple)):
+        array = numpy.asarray(value)
+        value = array if array.dtype.kind in 'biufc' else value
+    if isinstance(value, numpy.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(numpy.ascontiguousarray(value).tobytes())
+    else:
+        digest.update(repr(value).encode())
+
+
+def _cacheKey(function, grid: dict, fixed: dict) -> str:
+    digest = hashlib.sha256(_functionName(function).encode())
+    _hashCode(digest, function, set())
+    for name, values in grid.items():
+        digest.update(name.encode())
+        digest.update(values.tobytes())
+    for name, value in sorted(fixed.items()):
+        digest.update(name.encode())
+        _hashValue(digest, value)
+    return digest.hexdigest()
+
+
+class SweepResult():
+    """
+    Values of one equation over a grid: one array per output, each with one axis per grid parameter
+    """
+
+    def __init__(self, functionName: str, axes: dict, outputs: dict, cached: bool = False):
+        self._functionName = functionName
+        self._axes = axes
+        self._outputs = outputs
+        self._cached = cached
+
+    def getFunctionName(self) -> str:
+        return self._functionName
+
+    def getAxes(self) -> dict:
+        """
+        Grid values keyed by parameter name, in axis order
+        """
+        return dict(self._axes)
+
+    def getOutputNames(self) -> tuple:
+        return tuple(self._outputs)
+
+    def getValues(self, output=0) -> numpy.ndarray:
+        """
+        Values of one output over the grid
+        Args:
+            output (int or str): output index or name ('value' for single output equations, the field names of
+                named tuples, 'output0', 'output1', ... for plain tuples)
+        """
+        if isinstance(output, int):
+            output = tuple(self._outputs)[output]
+        return self._outputs[output]
+
+    def isCached(self) -> bool:
+        """
+        Whether the values were read from the cache instead of computed
+        """
+        return self._cached
+
+    def _series(self, x: str, output) -> (numpy.ndarray, list):
+        # (x values, [(label, y values)]) with one curve per combination of the other axes
+        if x not in self._axes:
+            raise ValueError("x must be one of %s, not %r" % (tuple(self._axes), x))
+        names = list(self._axes)
+        values = numpy.moveaxis(self.getValues(output), names.index(x), -1)
+        others = [name for name in names if name != x]
+
+        curves = []
+        for index in numpy.ndindex(*values.shape[:-1]):
+            label = ", ".join("%s = %s" % (name, self._axes[name][i]) for name, i in zip(others, index))
+            curves.append((label or self.getOutputNames()[0], values[index]))
+        return self._axes[x], curves
+
+    def toDataFrame(self, x: str = None, output=0):
+        """
+        The result as a pandas DataFrame.  With `x`, one column per curve indexed by that parameter (the layout of
+        `six_02_plots.maxRangePlot`); without, one row per grid point and one column per output.
+        """
+        import pandas
+
+        if x is not None:
+            index, curves = self._series(x, output)
+            return pandas.DataFrame({label: values for label, values in curves}, index=pandas.Index(index, name=x))
+
+        index = pandas.MultiIndex.from_product(list(self._axes.values()), names=list(self._axes))
+        return pandas.DataFrame({name: values.reshape(-1) for name, values in self._outputs.items()}, index=index)
+
+    def savePlot(self, path: str, x: str, output=0, title: str = None, ylabel: str = None):
+        """
+        Draws one curve per combination of the other parameters against `x` and saves it, without a display.
+        The format follows the extension of `path` (.png, .svg, .pdf, ...).
+        """
+        from matplotlib.figure import Figure
+
+        xValues, curves = self._series(x, output)
+        figure = Figure(figsize=(8, 6))
+        axes = figure.add_subplot()
+        for label, values in curves:
+            axes.plot(xValues, values, label=label)
+        axes.set_xlabel(x)
+        axes.set_ylabel(ylabel or (output if isinstance(output, str) else self.getOutputNames()[output]))
+        axes.set_title(title or self._functionName.rsplit('.', 1)[-1])
+        axes.grid(True)
+        if len(curves) > 1:
+            axes.legend(fontsize='small')
+        figure.savefig(path)
+
+
+def sweep(function, grid: dict, fixed: dict = None, cacheDirectory: str = None, executor=None) -> SweepResult:
+    """
+    This evaluates an equation over the Cartesian product of its grid parameters in one broadcast call.
+    Args:
+        function (callable): six_02 / six_03 equation (scalar or array version) or any array function
+        grid (dict): 1-D values of each swept parameter, keyed by parameter name, in axis order
+        fixed (dict): values of the parameters that are not swept
+        cacheDirectory (str): where results are cached; `BMW_SWEEP_CACHE` if not given, no caching if neither
+        executor (parallel_sweep.SweepExecutor): splits the grid across processes; one call in this process if not given
+
+    Returns:
+        SweepResult: values over the grid
+    """
+    fixed = dict(fixed or {})
+    function = _arrayFunction(function, set(grid) | set(fixed))
+    grid = {name: numpy.asarray(values, dtype=float).reshape(-1) for name, values in grid.items()}
+    overlap = set(grid) & set(fixed)
+    if overlap:
+        raise ValueError("Parameters both swept and fixed: %s" % ', '.join(sorted(overlap)))
+
+    cacheDirectory = cacheDirectory or os.environ.get(cacheEnvironmentVariable)
+    cachePath = None
+    if cacheDirectory:
+        cachePath = os.path.join(cacheDirectory, _cacheKey(function, grid, fixed) + '.npz')
+        if os.path.exists(cachePath):
+            with numpy.load(cachePath) as cached:
+                outputs = {name[len('output:'):]: cached[name] for name in cached.files if name.startswith('output:')}
+            return SweepResult(_functionName(function), grid, outputs, cached=True)
+
+    if executor is not None:
+        outputs = executor.evaluate(function, grid, fixed)
+    else:
+        dimensions = len(grid)
+        arguments = {name: values.reshape((-1,) + (1,) * (dimensions - 1 - axis)) for axis, (name, values) in enumerate(grid.items())}
+        result = function(**arguments, **fixed)
+        outputs = {name: values.copy() for name, values in _splitOutputs(result, tuple(values.size for values in grid.values())).items()}
+
+    if cachePath is not None:
+        os.makedirs(cacheDirectory, exist_ok=True)
+        temporaryPath = cachePath[:-len('.npz')] + '.%d.tmp.npz' % os.getpid()
+        numpy.savez(temporaryPath, **{'output:' + name: values for name, values in outputs.items()})
+        os.replace(temporaryPath, cachePath)
+
+    return SweepResult(_functionName(function), grid, outputs)